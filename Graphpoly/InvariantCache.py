@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+"""
+A cache of knot invariants, keyed by the PD code of the knot diagram, so that
+the many graphs of a census giving the same induced knot diagrams (the unknot,
+trefoil, figure-eight, and so on) only need the invariant found once. Entries
+are kept in memory in an LRUCache, and, if a path is given, in an SQLite
+database on disk, so that they can be used again in later runs. The values
+stored can be anything that can be written with repr() and read back with
+ast.literal_eval(), such as the writhe and bracket [writhe, {exponent :
+coefficient}] from LPoly(), or the number of colorings from
+quandleColorings(). NumPy numbers are stored as the matching Python numbers,
+and other values are rejected when they are stored, rather than failing when
+they are read back. A stored value of None is kept like any other value.
+
+Each invariant has a name, such as 'bracket', so that different invariants of
+the same diagram are kept separately.
+"""
+
+import sqlite3
+from ast import literal_eval
+from numbers import Complex, Integral, Real
+
+from Graphpoly.canonicalPD import canonicalKnot
+from Graphpoly.LRUCache import LRUCache
+
+# Returned by get() for a diagram not in the cache, so that a stored None is
+# not taken as a miss
+
+_missing = object()
+
+#=============================================================================#
+
+def pdKey(knotCode, f_list, reverse = True):
+    """
+    Return a key for the knot diagram with PD code knotCode (in terms of its
+    edges) and f(i) function list f_list, as from createInducedKnot(). The
+    key is the canonical form from canonicalKnot(), so it does not depend on
+    the labels of the edges, the order of the crossings, or (if reverse is
+    True) the direction of the knot.
+    """
+
+    [knotCode, f_list] = canonicalKnot(knotCode, f_list, reverse = reverse)
+
+    return (tuple(tuple(crossing) for crossing in knotCode), tuple(f_list))
+
+#-----------------------------------------------------------------------------#
+
+def literalValue(value):
+    """
+    Return value with every number in it, including those in lists, tuples,
+    sets and dictionaries, changed to a Python int, float or complex, so that
+    NumPy numbers can be written with repr() and read back with
+    ast.literal_eval(). Other objects are not changed.
+    """
+
+    if value is None or isinstance(value, (bool, str, bytes)):
+        return value
+    elif isinstance(value, Integral):
+        return int(value)
+    elif isinstance(value, Real):
+        return float(value)
+    elif isinstance(value, Complex):
+        return complex(value)
+    elif isinstance(value, list):
+        return [literalValue(item) for item in value]
+    elif isinstance(value, tuple):
+        return tuple(literalValue(item) for item in value)
+    elif isinstance(value, set):
+        return {literalValue(item) for item in value}
+    elif isinstance(value, dict):
+        return {literalValue(item) : literalValue(entry) for (item, entry) in value.items()}
+
+    return value
+
+#=============================================================================#
+
+class InvariantCache:
+
+    def __init__(self, path = None, max_size = 2 ** 16):
+        """
+        Create a cache holding at most max_size entries in memory, backed by
+        the SQLite database at path (created if needed), or only in memory if
+        path is None.
+        """
+
+        self.memory = LRUCache(max_size)
+        self.connection = None
+
+        if path is not None:
+            self.connection = sqlite3.connect(path)
+            self.connection.execute('CREATE TABLE IF NOT EXISTS invariants '
+                                    '(name TEXT, key TEXT, value TEXT, PRIMARY KEY (name, key))')
+
+    #-------------------------------------------------------------------------#
+
+    def __enter__(self):
+        return self
+
+    #-------------------------------------------------------------------------#
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    #-------------------------------------------------------------------------#
+
+    def get(self, name, key, default = None):
+        """
+        Return the value of the invariant with the given name for the diagram
+        with the given key (from pdKey()), looking first in memory and then
+        on disk, or default if it has not been stored.
+        """
+
+        value = self.memory.get((name, key), _missing)
+
+        if value is not _missing:
+            return value
+
+        if self.connection is not None:
+            row = self.connection.execute('SELECT value FROM invariants WHERE name = ? AND key = ?',
+                                          (name, repr(key))).fetchone()
+
+            if row is not None:
+                value = literal_eval(row[0])
+                self.memory.put((name, key), value)
+
+                return value
+
+        return default
+
+    #-------------------------------------------------------------------------#
+
+    def put(self, name, key, value):
+        """
+        Store the value of the invariant with the given name for the diagram
+        with the given key. Values written to disk are only saved once
+        flush() or close() is called. A ValueError is raised if the value,
+        after changing NumPy numbers with literalValue(), cannot be read back
+        from its repr() with ast.literal_eval().
+        """
+
+        value = literalValue(value)
+
+        try:
+            stored = literal_eval(repr(value)) == value
+        except (ValueError, SyntaxError):
+            stored = False
+
+        if not stored:
+            raise ValueError('Value cannot be stored in InvariantCache: ' + repr(value))
+
+        self.memory.put((name, key), value)
+
+        if self.connection is not None:
+            self.connection.execute('INSERT OR REPLACE INTO invariants VALUES (?, ?, ?)',
+                                    (name, repr(key), repr(value)))
+
+    #-------------------------------------------------------------------------#
+
+    def lookup(self, name, key, compute):
+        """
+        Return the value of the invariant with the given name for the diagram
+        with the given key, finding it with the function compute (called with
+        no arguments) and storing it if it is not in the cache.
+        """
+
+        value = self.get(name, key, _missing)
+
+        if value is _missing:
+            value = compute()
+            self.put(name, key, value)
+
+        return value
+
+    #-------------------------------------------------------------------------#
+
+    def flush(self):
+        if self.connection is not None:
+            self.connection.commit()
+
+    #-------------------------------------------------------------------------#
+
+    def close(self):
+        if self.connection is not None:
+            self.connection.commit()
+            self.connection.close()
+            self.connection = None
+
+#=============================================================================#
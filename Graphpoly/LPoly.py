@@ -5,20 +5,273 @@ Created on Mon Mar 27 14:26:36 2023
 @author: cartin
 """
 
-from Graphpoly.connectList import connectList
-from Graphpoly.sewSegments import sewSegments
-from Graphpoly.splitSegment import splitSegment
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 
-def LPoly(e_path, PD_code):
+from Graphpoly.crossingOrder import crossingOrder, frontierWidth
+from Graphpoly.grayBracket import grayBracket
+from Graphpoly.memoBracket import memoBracket
+from Graphpoly.pairDarts import pairDarts
+from Graphpoly.planarBracket import planarBracket
+from Graphpoly.SegmentArray import cyclicSlice, insertRun, reverseRun, SegmentArray, splitRun
+from Graphpoly.simplifyDiagram import simplifyDiagram
+from Graphpoly.stateBracket import stateBracket
+from Graphpoly.vectorBracket import vectorBracket
+
+#=============================================================================#
+
+def splitChange(label, seg, run_1, run_2):
+    """
+    Return the change [labels, new_segs, ranges] splitting the segment seg
+    with the given label into the runs (start, stop) of its darts, with the
+    run holding index 0 first, so that its darts keep their positions.
+    """
     
-    #-------------------------------------------------------------------------#
+    [seg_1, ranges] = splitRun(seg, *run_1)
+    [seg_2, ranges_2] = splitRun(seg, *run_2)
     
-    # Find the writhe number
+    if ranges is None:
+        return [[label], [seg_2, seg_1], ranges_2]
+    
+    return [[label], [seg_1, seg_2], ranges]
+
+#-----------------------------------------------------------------------------#
+
+def sewChange(label_1, seg_1, pos_1, label_2, seg_2, pos_2):
+    """
+    Return the change [labels, new_segs, ranges] sewing the segment seg_1,
+    starting from index pos_1, to the segment seg_2, starting from index pos_2,
+    keeping the positions of the darts in the segment which moves fewer darts.
+    """
+    
+    if len(seg_1) - pos_1 <= len(seg_2) - pos_2:
+        [new_seg, ranges] = insertRun(seg_1, pos_1, cyclicSlice(seg_2, pos_2, pos_2 - 1))
+        
+        return [[label_1, label_2], [new_seg], ranges]
+    
+    [new_seg, ranges] = insertRun(seg_2, pos_2, cyclicSlice(seg_1, pos_1, pos_1 - 1))
+    
+    return [[label_2, label_1], [new_seg], ranges]
+
+#-----------------------------------------------------------------------------#
+
+def splitLink(segments, current_crossing):
+    """
+    Find the two ways of splitting the crossing current_crossing, for the
+    link whose segments are given by the SegmentArray segments. Returns the
+    changes [labels, new_segs, ranges] to the segments, as passed to
+    SegmentArray.changeSegments(), for the A split and for the A^-1 split, in
+    that order. The segments themselves are not changed. The first new segment
+    is arranged to keep as many darts as it can at the same index as before,
+    so that they do not need to be indexed again.
+    """
+    
+    [d0, d1, d2, d3] = current_crossing
+    
+    # Find the segment and connection lists for current segments, node
+    
+    [seg_list, connect_list] = segments.connectList(current_crossing)
+    
+    # Due to orientation reversals, the incoming lower
+    # dart may be incorrect. Check to see if this has
+    # happened, and modify information accordingly.
+    
+    if (d2, d0) in connect_list:
+        d0, d1, d2, d3 = d2, d3, d0, d1
+        seg_list[0], seg_list[1], seg_list[2], seg_list[3] = seg_list[2], \
+            seg_list[3], seg_list[0], seg_list[1]
+            
+    [(label_0, pos_0), (label_1, pos_1), (label_2, pos_2), (label_3, pos_3)] = seg_list
+    current_seg = segments.segment(label_0)
+
+    # Go through possible cases for next crossing
+
+    if (d1, d3) in connect_list:                   # Right-to-left crossing
+        
+        if label_0 == label_1:                     # Two edges are in same segment
+            
+            # Find A portion of function, reversing the darts from d3 to d0
+            
+            [new_seg, ranges] = reverseRun(current_seg, pos_3, pos_0)
+            A_change = [[label_0], [new_seg], ranges]
+                                            
+            # Find A^-1 portion of function
+            
+            B_change = splitChange(label_0, current_seg, (pos_2, pos_1), (pos_3, pos_0))
+            
+        else:                                      # Two edges are in different segments
+            
+            # Find A portion of function, sewing the second segment to the
+            # first one reversed
+            
+            other_seg = segments.segment(label_1)
+            
+            [new_seg, ranges] = insertRun(other_seg, pos_3, cyclicSlice(current_seg, pos_2, pos_0)[::-1])
+            A_change = [[label_1, label_0], [new_seg], ranges]
+                                            
+            # Find A^-1 portion of function
+            
+            B_change = sewChange(label_0, current_seg, pos_2, label_1, other_seg, pos_3)
+        
+    elif (d3, d1) in connect_list:                 # Left-to-right crossing
+        
+        if label_0 == label_1:                     # Two edges are in same segment
+            
+            # Find A portion of function
+            
+            A_change = splitChange(label_0, current_seg, (pos_2, pos_3), (pos_1, pos_0))
+                                            
+            # Find A^-1 portion of function, reversing the darts from d1 to d0
+            
+            [new_seg, ranges] = reverseRun(current_seg, pos_1, pos_0)
+            B_change = [[label_0], [new_seg], ranges]
+            
+        else:                                      # Two edges are in different segments
+            
+            # Find A portion of function
+            
+            other_seg = segments.segment(label_1)
+            
+            A_change = sewChange(label_0, current_seg, pos_2, label_1, other_seg, pos_1)
+                                            
+            # Find A^-1 portion of function, sewing the second segment to
+            # the first one reversed
+            
+            [new_seg, ranges] = insertRun(other_seg, pos_1, cyclicSlice(current_seg, pos_2, pos_0)[::-1])
+            B_change = [[label_1, label_0], [new_seg], ranges]
+            
+    # Return results
+    
+    return [A_change, B_change]
+
+#-----------------------------------------------------------------------------#
+
+def splitCounts(segments, current_crossing):
+    """
+    Return the numbers of segments (A_num, B_num) left after the A split and
+    the A^-1 split of the crossing current_crossing, as in splitLink(),
+    without finding the segments themselves.
+    """
+    
+    [d0, d1, d2, d3] = current_crossing
+    [seg_list, connect_list] = segments.connectList(current_crossing)
+    num_seg = len(segments)
+    
+    # Joining two segments gives one segment either way, while splitting the
+    # crossing in the same segment gives one or two
+    
+    if seg_list[0][0] != seg_list[1][0]:
+        return (num_seg - 1, num_seg - 1)
+    
+    # The crossing is right-to-left once the darts are put in the order of
+    # the link, as in splitLink()
+    
+    if ((d1, d3) in connect_list) != ((d2, d0) in connect_list):
+        return (num_seg, num_seg + 1)
+    else:
+        return (num_seg + 1, num_seg)
+    
+#-----------------------------------------------------------------------------#
+
+def iterStates(linkQueue):
+    """
+    Go through the tree of splits for the links in linkQueue, whose items are
+    of the form [segments, PD_code, (A, B)], yielding the tuple (A, B, N) for
+    each state as it is found. The last item of linkQueue is processed first,
+    the last crossing of PD_code is split first, and the A^-1 split of each
+    link is gone through before the A split.
+    
+    The tree for each link is gone through depth first, changing a single
+    SegmentArray in place. Each item of splitStack is of the form [change,
+    num_left, (A, B), mark], where change is the change to make to the
+    segments of the parent link, after undoing any changes made since mark,
+    and num_left is the number of crossings left to split.
+    """
+    
+    # Go through queue, pop off next link, and process
+    
+    while len(linkQueue) > 0:
+        [segments, PD_code, (A, B)] = linkQueue.pop()
+        splitStack = [[None, len(PD_code), (A, B), segments.mark()]]
+        
+        while len(splitStack) > 0:
+            [change, num_left, (A, B), mark] = splitStack.pop()
+            segments.undo(mark)
+            
+            # If no more crossings, the state is given by the number of
+            # unknots (or segments), so the last change need not be made
+            
+            if num_left == 0:
+                if change is None:
+                    yield (A, B, len(segments))
+                else:
+                    yield (A, B, len(segments) - len(change[0]) + len(change[1]))
+                continue
+            
+            if change is not None:
+                segments.changeSegments(*change)
+                
+            # With one crossing left, only the numbers of unknots are needed
+            
+            if num_left == 1:
+                (A_num, B_num) = splitCounts(segments, PD_code[0])
+                
+                yield (A, B + 1, B_num)
+                yield (A + 1, B, A_num)
+                continue
+            
+            # Place results of splitting the next crossing on the stack
+            
+            [A_change, B_change] = splitLink(segments, PD_code[num_left - 1])
+            mark = segments.mark()
+            
+            splitStack += [[A_change, num_left - 1, (A + 1, B), mark], \
+                           [B_change, num_left - 1, (A, B + 1), mark]]
+            
+#-----------------------------------------------------------------------------#
+
+def stateTree(linkQueue, aggregate):
+    """
+    Go through the tree of splits for the links in linkQueue, as in
+    iterStates(). Returns the list of states (A, B, N), in the order they are
+    found, or if aggregate is True, a dictionary with keys (A - B, N) and the
+    number of states with these values.
+    """
+    
+    if not aggregate:
+        return list(iterStates(linkQueue))
+    
+    stateDict = {}
+    
+    for (A, B, N) in iterStates(linkQueue):
+        stateDict[(A - B, N)] = stateDict.get((A - B, N), 0) + 1
+        
+    return stateDict
+
+#-----------------------------------------------------------------------------#
+
+def twistStates(stateDict, twist):
+    """
+    Multiply the bracket given by the dictionary of states stateDict, with
+    keys (A - B, N), by (-A^3)^twist, for the kinks removed from the diagram.
+    """
+    
+    sign = -1 if twist % 2 else 1
+    
+    return {(power + 3 * twist, N) : sign * num for ((power, N), num) in stateDict.items()}
+
+#-----------------------------------------------------------------------------#
+
+def findWrithe(e_path, PD_code):
+    """
+    Find the writhe number of the link given by e_path and PD_code.
+    """
     
     writhe = 0
+    segments = SegmentArray(e_path)
     
     for crossing in PD_code:
-        [seg_list, connect_list] = connectList(e_path, crossing)
+        [seg_list, connect_list] = segments.connectList(crossing)
         
         # There should be no reversals of the link by this point,
         # so do not check whether (d2, d0) appears in connect_list?
@@ -27,167 +280,199 @@ def LPoly(e_path, PD_code):
             writhe -= 1
         elif (crossing[3], crossing[1]) in connect_list:   # Left-to-right crossing
             writhe += 1
+            
+    return writhe
+
+#-----------------------------------------------------------------------------#
+
+def iterLPoly(e_path, PD_code):
+    """
+    Given an e_path and PD code for a link, as in LPoly(), find the writhe
+    number of the link, along with a generator for its states. The generator
+    yields the tuple (A, B, N) for each state as the state tree reaches it,
+    in the same order as the list of states from LPoly(), so the states can
+    be used without keeping them all in memory, and the search can be stopped
+    early.
+    """
     
-    # Create queue for results in-process, and final results list for those
-    # where all crossings have been reduced to unknots. Format of items in
-    # queue is [e_path, PD_code, (A, B)], with A, B the number corresponding
-    # to number of A, B splits enacted so far on that link.
+    writhe = findWrithe(e_path, PD_code)
     
-    linkQueue = [[e_path, PD_code, (0, 0)]]
-    finalStateList = []
+    return [writhe, iterStates([[SegmentArray(e_path), [cross for cross in PD_code], (0, 0)]])]
+
+#=============================================================================#
+
+def LPoly(e_path, PD_code, aggregate = False, engine = 'state', memo_size = 2 ** 16, \
+          order = None, width = False, workers = 1, split_depth = 4, simplify = False):
+    """
+    Given an e_path for a link, possibly made of several components, and the
+    PD code for the crossings of the link, find the writhe number of the link
+    and its states, by splitting each crossing in the two possible ways.
     
-    #-------------------------------------------------------------------------#
+    If aggregate is False, the states are returned as a list of tuples
+    (A, B, N), with one tuple for each state; A and B are the number of splits
+    giving factors of A and A^-1, and N is the number of unknots left. If
+    aggregate is True, states are merged as they are found, using their values
+    of (A - B, N), and the function instead returns the Kauffman bracket of
+    the link as a dictionary {exponent : coefficient} (see stateBracket).
     
-    # Go through queue, pop off next link, and process
+    The parameter engine chooses how the states are found:
+        
+        'state' : go through the tree of all splits of the link (default)
+        'memo'  : split the crossings recursively, reusing the states of
+                  partially split diagrams that have already been seen, with
+                  at most memo_size diagrams stored (see memoBracket)
+        'tl'    : add the crossings one at a time to a region of the diagram,
+                  keeping the states for each pairing of the boundary darts
+                  of the region (see planarBracket)
+        'numpy' : go through all states in batches with NumPy arrays (see
+                  vectorBracket)
+        'gray'  : go through all states in Gray code order, changing the
+                  split of one crossing at a time and updating the unknots
+                  found (see grayBracket)
+                  
+    The states found are the same for all engines, although the order of the
+    list of states may differ.
     
-    while len(linkQueue) > 0:
-        [current_epath, current_PD_code, (A, B)] = linkQueue.pop()
+    The order in which the crossings are split is given by order, either as a
+    list of indices for PD_code, with each crossing exactly once, or as one of
+    the methods of crossingOrder(). By default, the 'tl' engine uses the
+    'greedy' method, and the others use the crossings in reverse order of
+    PD_code. If width is True, the frontier width reached by the order is
+    returned after the states.
     
-        # If no more crossings, compute prefactor using
-        # number of unknots (or states), and put on
-        # finalStateList
-        
-        if len(current_PD_code) == 0:
-            finalStateList += [(A, B, len(current_epath))]
-            continue
-        
-        # Get next crossing in current link, assign labels to darts
+    For the 'state' engine, if workers is greater than one, the first
+    split_depth crossings are split in this process, and the 2^split_depth
+    links found are divided between workers separate processes. The results
+    are the same as for a single process, including the order of the list of
+    states.
+    
+    If simplify is True, kinks and bigons are removed from the diagram before
+    its states are found (see simplifyDiagram). The states of the simplified
+    diagram are not those of the original, so aggregate must also be True;
+    the writhe and bracket returned are still those of the original diagram,
+    while the frontier width is that of the simplified diagram. Since the
+    crossings of PD_code are not all kept, order must then be one of the
+    methods of crossingOrder(), rather than a list of indices.
+    """
+    
+    if engine not in ['state', 'memo', 'tl', 'numpy', 'gray']:
+        raise ValueError('Unknown engine for LPoly: ' + str(engine))
         
-        current_crossing = current_PD_code.pop()
-        [d0, d1, d2, d3] = current_crossing
+    if simplify and not aggregate:
+        raise ValueError('LPoly can only simplify the diagram if aggregate is True')
         
-        # Find the segment and connection lists for current e_path, node
+    if simplify and order is not None and not isinstance(order, str):
+        raise ValueError('LPoly can only simplify the diagram if order is a method of crossingOrder')
+    
+    #-------------------------------------------------------------------------#
+    
+    # Remove kinks and bigons, keeping track of the writhe of the kinks
+    
+    twist = 0
+    
+    if simplify:
+        [e_path, PD_code, f_list, twist] = simplifyDiagram(e_path, PD_code)
+    
+    # Find the writhe number
+    
+    writhe = findWrithe(e_path, PD_code) + twist
+            
+    # Find the order for splitting the crossings, using how the darts of the
+    # crossings are joined together. The state tree and memo engines always
+    # split the last crossing in PD_code first, so reorder PD_code to match.
+    
+    if order is None and engine == 'tl':
+        order = 'greedy'
         
-        [seg_list, connect_list] = connectList([label for label in current_epath], \
-                                               [label for label in current_crossing])
+    if order is not None or width or engine != 'state':
+        [link, free_loops] = pairDarts(e_path, PD_code)
         
-        # Due to orientation reversals, the incoming lower
-        # dart may be incorrect. Check to see if this has
-        # happened, and modify information accordingly.
+        if order is None:
+            order = 'reverse'
+            
+        if isinstance(order, str):
+            order = crossingOrder(link, order)
+            
+        frontier = frontierWidth(link, order)
         
-        if (d2, d0) in connect_list:
-            d0, d1, d2, d3 = d2, d3, d0, d1
-            seg_list[0], seg_list[1], seg_list[2], seg_list[3] = seg_list[2], \
-                seg_list[3], seg_list[0], seg_list[1]
-    
-        # Go through possible cases for next crossing
+        if engine != 'tl' and order != crossingOrder(link, 'reverse'):
+            PD_code = [PD_code[iii] for iii in reversed(order)]
+            [link, free_loops] = pairDarts(e_path, PD_code)
+            
+    # For engines other than the state tree, use how the darts of the
+    # crossings are joined together to find the states
     
-        if (d1, d3) in connect_list:                   # Right-to-left crossing
+    if engine != 'state':
+        if engine == 'memo':
+            stateCounts = memoBracket(link, free_loops, memo_size)
+        elif engine == 'tl':
+            [stateCounts, frontier] = planarBracket(link, free_loops, order)
+        elif engine == 'numpy':
+            stateCounts = vectorBracket(link, free_loops)
+        elif engine == 'gray':
+            stateCounts = grayBracket(link, free_loops)
             
-            if seg_list[0][0] == seg_list[1][0]:       # Two edges are in same segment
-                
-                # Find A portion of function
-                
-                current_seg = [dart for dart in current_epath[seg_list[0][0]]]
-                A_e_path = [seg for seg in current_epath if seg != current_seg]
-                
-                if seg_list[3][1] < seg_list[0][1]:
-                    piece_1 = current_seg[seg_list[3][1] : seg_list[0][1] + 1]
-                    piece_1.reverse()
-                    piece_2 = current_seg[seg_list[0][1] + 1:] + current_seg[:seg_list[3][1]]
-                else:
-                    piece_1 = current_seg[seg_list[3][1]:] + current_seg[:seg_list[0][1] + 1]
-                    piece_1.reverse()
-                    piece_2 = current_seg[seg_list[0][1] + 1 : seg_list[3][1]]
-                    
-                A_e_path += [piece_1 + piece_2]
-                                                
-                # Find A^-1 portion of function
-                
-                B_e_path = splitSegment([seg for seg in current_epath], seg_list[0][0], \
-                                       seg_list[2][1], seg_list[1][1], seg_list[3][1], \
-                                       seg_list[0][1])
-                
-            else:                                      # Two edges are in different segments
-                
-                # Find A portion of function
-                
-                current_seg = [dart for dart in current_epath[seg_list[0][0]]]
-                A_e_path = [seg for seg in current_epath if seg != current_seg]
-                            
-                current_seg = current_seg[seg_list[2][1]:] + current_seg[:seg_list[2][1]]
-                current_seg.reverse()
-                A_e_path += [current_seg]
-                
-                not_found = True
-                
-                while not_found:
-                    for iii in range(len(A_e_path)):
-                        if d1 in A_e_path[iii]:
-                            not_found = False
-                            d1_index = iii
-                
-                A_e_path = sewSegments(A_e_path, d1_index, len(A_e_path) - 1, \
-                                      seg_list[3][1], seg_list[1][1], current_seg.index(d0), \
-                                      current_seg.index(d2))
-                                                
-                # Find A^-1 portion of function
+        if aggregate:
+            stateDict = {}
+            
+            for ((A, B, N), num) in stateCounts.items():
+                stateDict[(A - B, N)] = stateDict.get((A - B, N), 0) + num
                 
-                B_e_path = sewSegments([seg for seg in current_epath], seg_list[0][0], seg_list[1][0], \
-                                      seg_list[2][1], seg_list[0][1], seg_list[3][1], \
-                                      seg_list[1][1])
+            result = [writhe, stateBracket(twistStates(stateDict, twist))]
+        else:
+            result = [writhe, [state for (state, num) in stateCounts.items() for iii in range(num)]]
             
-        elif (d3, d1) in connect_list:                 # Left-to-right crossing
+        return result + [frontier] if width else result
+    
+    # Create queue for results in-process. Format of items in queue is
+    # [segments, PD_code, (A, B)], with segments the SegmentArray for the
+    # e_path of the link, and A, B the number corresponding to number of
+    # A, B splits enacted so far on that link.
+    
+    linkQueue = [[SegmentArray(e_path), PD_code, (0, 0)]]
+    
+    # To run in parallel, split the first split_depth crossings here, and
+    # send each of the resulting links to a separate process. The links are
+    # kept in the order that stateTree() would reach them, so that the list
+    # of states is the same as for a single process.
+    
+    if workers > 1 and split_depth > 0:
+        for depth in range(split_depth):
+            newQueue = []
             
-            if seg_list[0][0] == seg_list[1][0]:       # Two edges are in same segment
-                
-                # Find A portion of function
+            for [segments, current_PD_code, (A, B)] in linkQueue:
+                if len(current_PD_code) == 0:
+                    newQueue += [[segments, current_PD_code, (A, B)]]
+                    continue
                 
-                A_e_path = splitSegment([seg for seg in current_epath], seg_list[0][0], \
-                                       seg_list[2][1], seg_list[3][1], seg_list[1][1], \
-                                       seg_list[0][1])
-                                                
-                # Find A^-1 portion of function
+                [A_change, B_change] = splitLink(segments, current_PD_code[-1])
+                [A_segments, B_segments] = [segments.copy(), segments]
                 
-                current_seg = [dart for dart in current_epath[seg_list[0][0]]]
-                B_e_path = [seg for seg in current_epath if seg != current_seg]
+                A_segments.changeSegments(*A_change)
+                B_segments.changeSegments(*B_change)
                 
-                if seg_list[1][1] < seg_list[0][1]:
-                    piece = current_seg[seg_list[1][1] : seg_list[0][1] + 1]
-                    piece.reverse()
-                    current_seg = current_seg[:seg_list[1][1]] + piece + \
-                        current_seg[seg_list[0][1] + 1:]
-                else:
-                    piece = current_seg[seg_list[1][1]:] + current_seg[:seg_list[0][1] + 1]
-                    piece.reverse()
-                    current_seg = current_seg[seg_list[0][1] + 1 : seg_list[1][1]] + piece
+                newQueue += [[B_segments, current_PD_code[:-1], (A, B + 1)], \
+                             [A_segments, current_PD_code[:-1], (A + 1, B)]]
                     
-                B_e_path += [current_seg]
-                
-            else:                                      # Two edges are in different segments
-                
-                # Find A portion of function
-                
-                A_e_path = sewSegments([seg for seg in current_epath], seg_list[0][0], seg_list[1][0], \
-                                      seg_list[2][1], seg_list[0][1], seg_list[1][1], \
-                                      seg_list[3][1])
-                                                
-                # Find A^-1 portion of function
-                
-                current_seg = [dart for dart in current_epath[seg_list[0][0]]]
-                B_e_path = [seg for seg in current_epath if seg != current_seg]
-                            
-                current_seg = current_seg[seg_list[2][1]:] + current_seg[:seg_list[2][1]]
-                current_seg.reverse()
-                B_e_path += [current_seg]
-                
-                not_found = True
-                
-                while not_found:
-                    for iii in range(len(B_e_path)):
-                        if d1 in B_e_path[iii]:
-                            not_found = False
-                            d1_index = iii
-                            
-                B_e_path = sewSegments(B_e_path, d1_index, len(B_e_path) - 1, \
-                                       seg_list[1][1], seg_list[3][1], current_seg.index(d0), \
-                                       current_seg.index(d2))
-                
-        # Place latest results back on queue
-        
-        linkQueue += [[A_e_path, [cross for cross in current_PD_code], (A + 1, B)]]
-        linkQueue += [[B_e_path, [cross for cross in current_PD_code], (A, B + 1)]]
+            linkQueue = newQueue
+            
+        with ProcessPoolExecutor(max_workers = workers) as executor:
+            partList = list(executor.map(stateTree, [[item] for item in linkQueue], \
+                                         repeat(aggregate)))
+    else:
+        partList = [stateTree(linkQueue, aggregate)]
         
-    # Return results
+    # Merge the results from each process, and return results
     
-    return [writhe, finalStateList]
\ No newline at end of file
+    if aggregate:
+        stateDict = {}
+        
+        for partDict in partList:
+            for (key, num) in partDict.items():
+                stateDict[key] = stateDict.get(key, 0) + num
+                
+        result = [writhe, stateBracket(twistStates(stateDict, twist))]
+    else:
+        result = [writhe, [state for partStateList in partList for state in partStateList]]
+        
+    return result + [frontier] if width else result
\ No newline at end of file
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""
+A dictionary with a maximum number of entries. When the cache is full, the
+entry which has gone the longest without being used is removed to make room
+for the new entry.
+"""
+
+from collections import OrderedDict
+
+#=============================================================================#
+
+class LRUCache:
+    
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        
+    #-------------------------------------------------------------------------#
+    
+    def __contains__(self, key):
+        return key in self.entries
+    
+    #-------------------------------------------------------------------------#
+    
+    def __len__(self):
+        return len(self.entries)
+    
+    #-------------------------------------------------------------------------#
+    
+    def get(self, key, default = None):
+        """
+        Return the value for key, marking it as the most recently used entry,
+        or default if key is not in the cache.
+        """
+        
+        if key not in self.entries:
+            self.misses += 1
+            return default
+        
+        self.hits += 1
+        self.entries.move_to_end(key)
+        
+        return self.entries[key]
+    
+    #-------------------------------------------------------------------------#
+    
+    def put(self, key, value):
+        """
+        Add an entry to the cache, removing the least recently used entry if
+        the cache is full.
+        """
+        
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last = False)
+        
+#=============================================================================#
@@ -0,0 +1,301 @@
+# -*- coding: utf-8 -*-
+"""
+Laurent polynomials with integer coefficients, in one or more variables, for
+the Kauffman bracket and the graph polynomials built from it. The terms are
+kept sorted by exponent, with the exponents of all terms in one flat array (so
+that term iii has exponents exponents[iii * num_vars : (iii + 1) * num_vars])
+and the coefficients in another. Coefficients must fit in a signed 64-bit
+integer; larger values raise an OverflowError rather than wrapping around.
+
+A polynomial is not changed once it is made, so it can be used as a key in a
+dictionary, for example to find the multiset of polynomials for the induced
+knot diagrams of a graph. SymPy is only needed by toSympy().
+"""
+
+from array import array
+from numbers import Integral
+from operator import index
+
+#=============================================================================#
+
+class LaurentPoly:
+
+    def __init__(self, terms = None, names = ('A',)):
+        """
+        Create a polynomial in the variables with the given names, from a
+        dictionary (or list of pairs) of terms {exponent : coefficient}. For a
+        single variable, each exponent is an integer, and otherwise a tuple
+        with one integer for each variable.
+        """
+
+        self.names = tuple(names)
+        self.num_vars = len(self.names)
+        self.hash_value = None
+
+        if terms is None:
+            terms = {}
+        elif isinstance(terms, dict):
+            terms = terms.items()
+
+        # Add together terms with the same exponents, and remove those that
+        # cancel
+
+        termDict = {}
+
+        for (exponent, coeff) in terms:
+            key = (index(exponent),) if isinstance(exponent, Integral) else tuple(exponent)
+
+            if len(key) != self.num_vars:
+                raise ValueError('Exponent ' + str(exponent) + ' does not match variables ' + \
+                                 str(self.names))
+
+            termDict[key] = termDict.get(key, 0) + coeff
+
+        keys = sorted(key for (key, coeff) in termDict.items() if coeff != 0)
+
+        self.exponents = array('i', [power for key in keys for power in key])
+        self.coeffs = array('q', [termDict[key] for key in keys])
+
+    #-------------------------------------------------------------------------#
+
+    def __len__(self):
+        return len(self.coeffs)
+
+    #-------------------------------------------------------------------------#
+
+    def items(self):
+        """
+        Return the list of terms (exponent, coefficient), in order of
+        exponent, with each exponent given as a tuple.
+        """
+
+        num_vars = self.num_vars
+
+        return [(tuple(self.exponents[iii * num_vars : (iii + 1) * num_vars]), coeff)
+                for (iii, coeff) in enumerate(self.coeffs)]
+
+    #-------------------------------------------------------------------------#
+
+    def terms(self):
+        """
+        Return the polynomial as a dictionary {exponent : coefficient}, in the
+        same form as used to create it; for a single variable, this is the
+        same form as returned by stateBracket().
+        """
+
+        if self.num_vars == 1:
+            return {power : coeff for (power, coeff) in zip(self.exponents, self.coeffs)}
+
+        return {key : coeff for (key, coeff) in self.items()}
+
+    #-------------------------------------------------------------------------#
+
+    def checkNames(self, other):
+        if self.names != other.names:
+            raise ValueError('Polynomials are in different variables: ' + str(self.names) + \
+                             ', ' + str(other.names))
+
+    #-------------------------------------------------------------------------#
+
+    def __eq__(self, other):
+        if not isinstance(other, LaurentPoly):
+            return NotImplemented
+
+        return self.names == other.names and self.exponents == other.exponents and \
+            self.coeffs == other.coeffs
+
+    #-------------------------------------------------------------------------#
+
+    def __hash__(self):
+        if self.hash_value is None:
+            self.hash_value = hash((self.names, self.exponents.tobytes(), self.coeffs.tobytes()))
+
+        return self.hash_value
+
+    #-------------------------------------------------------------------------#
+
+    def __add__(self, other):
+        if isinstance(other, Integral):
+            other = LaurentPoly({(0,) * self.num_vars : index(other)}, self.names)
+        elif not isinstance(other, LaurentPoly):
+            return NotImplemented
+
+        self.checkNames(other)
+
+        return LaurentPoly(self.items() + other.items(), self.names)
+
+    __radd__ = __add__
+
+    #-------------------------------------------------------------------------#
+
+    def __neg__(self):
+        return self * -1
+
+    #-------------------------------------------------------------------------#
+
+    def __sub__(self, other):
+        return self + (-other)
+
+    #-------------------------------------------------------------------------#
+
+    def __rsub__(self, other):
+        return (-self) + other
+
+    #-------------------------------------------------------------------------#
+
+    def __mul__(self, other):
+        if isinstance(other, Integral):
+            other = index(other)
+            return LaurentPoly([(key, other * coeff) for (key, coeff) in self.items()], self.names)
+        elif not isinstance(other, LaurentPoly):
+            return NotImplemented
+
+        self.checkNames(other)
+        product = {}
+
+        # Single variable polynomials are multiplied using the arrays directly
+
+        if self.num_vars == 1:
+            for (power_1, coeff_1) in zip(self.exponents, self.coeffs):
+                for (power_2, coeff_2) in zip(other.exponents, other.coeffs):
+                    product[power_1 + power_2] = product.get(power_1 + power_2, 0) + \
+                        coeff_1 * coeff_2
+        else:
+            other_items = other.items()
+
+            for (key_1, coeff_1) in self.items():
+                for (key_2, coeff_2) in other_items:
+                    key = tuple(power_1 + power_2 for (power_1, power_2) in zip(key_1, key_2))
+                    product[key] = product.get(key, 0) + coeff_1 * coeff_2
+
+        return LaurentPoly(product, self.names)
+
+    __rmul__ = __mul__
+
+    #-------------------------------------------------------------------------#
+
+    def __pow__(self, power):
+        """
+        Raise the polynomial to an integer power, by repeated squaring. Negative
+        powers are only allowed for a single term with coefficient 1 or -1,
+        such as A or -A^3.
+        """
+
+        if not isinstance(power, Integral):
+            raise ValueError('Power of LaurentPoly must be an integer: ' + str(power))
+
+        power = index(power)
+
+        if power < 0:
+            if len(self) != 1 or abs(self.coeffs[0]) != 1:
+                raise ValueError('Only a monomial with coefficient 1 or -1 has an inverse: ' + \
+                                 str(self))
+
+            inverse = [(tuple(-power for power in self.exponents), self.coeffs[0])]
+
+            return LaurentPoly(inverse, self.names) ** -power
+
+        result = LaurentPoly({(0,) * self.num_vars : 1}, self.names)
+        base = self
+
+        while power > 0:
+            if power & 1:
+                result = result * base
+            base = base * base
+            power >>= 1
+
+        return result
+
+    #-------------------------------------------------------------------------#
+
+    def shift(self, exponent):
+        """
+        Multiply the polynomial by the monomial with the given exponent (an
+        integer for a single variable, otherwise a tuple).
+        """
+
+        key = (index(exponent),) if isinstance(exponent, Integral) else tuple(exponent)
+
+        if len(key) != self.num_vars:
+            raise ValueError('Exponent ' + str(exponent) + ' does not match variables ' + \
+                             str(self.names))
+
+        result = LaurentPoly(names = self.names)
+        result.coeffs = array('q', self.coeffs)
+        result.exponents = array('i', [power + key[iii % self.num_vars]
+                                       for (iii, power) in enumerate(self.exponents)])
+
+        return result
+
+    #-------------------------------------------------------------------------#
+
+    def toSympy(self, symbols = None):
+        """
+        Return the polynomial as a SymPy expression, using the given SymPy
+        symbols, or new symbols with the names of the variables.
+        """
+
+        import sympy
+
+        if symbols is None:
+            symbols = [sympy.Symbol(name) for name in self.names]
+
+        result = sympy.Integer(0)
+
+        for (key, coeff) in self.items():
+            term = sympy.Integer(coeff)
+
+            for (symbol, power) in zip(symbols, key):
+                term *= symbol ** power
+
+            result += term
+
+        return result
+
+    #-------------------------------------------------------------------------#
+
+    def __repr__(self):
+        if len(self) == 0:
+            return '0'
+
+        term_list = []
+
+        for (key, coeff) in self.items():
+            factors = [name if power == 1 else name + '^' + str(power)
+                       for (name, power) in zip(self.names, key) if power != 0]
+
+            if len(factors) == 0:
+                term = str(abs(coeff))
+            elif abs(coeff) == 1:
+                term = '*'.join(factors)
+            else:
+                term = str(abs(coeff)) + '*' + '*'.join(factors)
+
+            if len(term_list) == 0:
+                term_list += [term if coeff > 0 else '-' + term]
+            else:
+                term_list += [('+ ' if coeff > 0 else '- ') + term]
+
+        return ' '.join(term_list)
+
+#=============================================================================#
+
+# Powers of the loop value d = -A^2 - A^-2, kept as they are found
+
+loop_powers = [LaurentPoly({0 : 1})]
+
+def loopPower(kkk):
+    """
+    Return the polynomial d^kkk in the variable A, for the loop value
+    d = -A^2 - A^-2 of the Kauffman bracket.
+    """
+
+    if kkk < 0:
+        raise ValueError('Power of loop value must be non-negative: ' + str(kkk))
+
+    while len(loop_powers) <= kkk:
+        loop_powers.append(loop_powers[-1] * LaurentPoly({2 : -1, -2 : -1}))
+
+    return loop_powers[kkk]
+
+#=============================================================================#
@@ -0,0 +1,320 @@
+# -*- coding: utf-8 -*-
+"""
+The segments of an e_path, stored as arrays of dart labels, together with an
+index giving the segment and position of each dart. This replaces the list of
+lists e_path in the state tree of LPoly(), where connectList(), splitSegment()
+and sewSegments() must search through every segment to find the darts of a
+crossing. Here, the darts are found directly from the index, which is kept up
+to date as segments are split, sewn together and reversed.
+
+Each segment is given a label when it is added. The index is kept as two
+dictionaries, giving the label of the segment holding each dart and the
+position of the dart in that segment, so that a dart is found with two
+lookups. When segments are changed, the first new segment takes the label of
+the first old one, so that only the darts moving to a different segment get a
+new label. Likewise, only the darts moving to a different index get a new
+position, and undo() gives the same darts back their old positions. The
+changes made by LPoly() keep most of the darts of that segment at the same
+index: a reversal is done in place, leaving the darts outside it where they
+were, a split keeps the run of darts holding index 0, and two segments are
+sewn by inserting one of them into the other. The arrays for the segments are
+never changed in place.
+
+Each change to the segments is recorded in a log, so that the state tree of
+LPoly() can keep a single SegmentArray, going back to the parent link with
+undo() instead of copying the index for every split.
+"""
+
+from array import array
+
+#=============================================================================#
+
+def cyclicSlice(seg, start, stop):
+    """
+    Return the darts of the segment seg from index start to index stop,
+    inclusive, wrapping around the end of the segment if start > stop.
+    """
+
+    if start < stop:
+        return seg[start : stop + 1]
+    else:
+        return seg[start:] + seg[: stop + 1]
+
+#-----------------------------------------------------------------------------#
+
+def reverseRun(seg, start, stop):
+    """
+    Reverse the darts of the segment seg from index start to index stop, as in
+    cyclicSlice(), leaving the other darts where they are. If there are fewer
+    other darts, they are reversed instead, which gives the same loop in the
+    opposite direction. Returns [new_seg, ranges], where ranges lists the
+    ranges (first, last) of indices whose darts have changed.
+    """
+
+    num_darts = len(seg)
+
+    if (stop - start) % num_darts >= num_darts // 2 and (stop + 1) % num_darts != start:
+        (start, stop) = ((stop + 1) % num_darts, (start - 1) % num_darts)
+
+    if start <= stop:
+        run = seg[start : stop + 1]
+        run.reverse()
+
+        return [seg[:start] + run + seg[stop + 1:], [(start, stop + 1)]]
+
+    run = seg[start:] + seg[: stop + 1]
+    run.reverse()
+    cut = num_darts - start
+
+    return [run[cut:] + seg[stop + 1 : start] + run[:cut], [(0, stop + 1), (start, num_darts)]]
+
+#-----------------------------------------------------------------------------#
+
+def splitRun(seg, start, stop):
+    """
+    Return [new_seg, ranges] for the segment made from the darts of seg from
+    index start to index stop, as in cyclicSlice(), starting at index 0 if it
+    is included, so that the darts from there keep their indices; ranges is
+    as in reverseRun(), or None if index 0 is not included.
+    """
+
+    if start == 0:
+        return [seg[: stop + 1], []]
+    elif start <= stop:
+        return [seg[start : stop + 1], None]
+
+    return [seg[: stop + 1] + seg[start:], [(stop + 1, stop + 1 + len(seg) - start)]]
+
+#-----------------------------------------------------------------------------#
+
+def insertRun(seg, pos, darts):
+    """
+    Return [new_seg, ranges] for the segment made by going around seg from
+    index pos, and then along the darts, keeping the darts of seg before pos
+    where they are; ranges is as in reverseRun().
+    """
+
+    pos = pos if pos > 0 else len(seg)
+
+    return [seg[:pos] + darts + seg[pos:], [(pos, len(seg) + len(darts))]]
+
+#=============================================================================#
+
+class SegmentArray:
+
+    def __init__(self, e_path):
+        self.segments = {}
+        self.index = {}
+        self.positions = {}
+        self.next_label = 0
+        self.log = []
+
+        for seg in e_path:
+            self.addSegment(seg)
+
+    #-------------------------------------------------------------------------#
+
+    def __len__(self):
+        return len(self.segments)
+
+    #-------------------------------------------------------------------------#
+
+    def copy(self):
+        new = SegmentArray.__new__(SegmentArray)
+        new.segments = self.segments.copy()
+        new.index = self.index.copy()
+        new.positions = self.positions.copy()
+        new.next_label = self.next_label
+        new.log = []
+
+        return new
+
+    #-------------------------------------------------------------------------#
+
+    def listEPath(self):
+        return [list(seg) for seg in self.segments.values()]
+
+    #-------------------------------------------------------------------------#
+
+    def locate(self, dart):
+        """
+        Return the tuple (label, index) for the segment containing dart, and
+        where the dart is in that segment.
+        """
+
+        return (self.index[dart], self.positions[dart])
+
+    #-------------------------------------------------------------------------#
+
+    def segment(self, label):
+        return self.segments[label]
+
+    #-------------------------------------------------------------------------#
+
+    def addSegment(self, darts):
+        """
+        Add a segment with the given darts, and return its label.
+        """
+
+        seg = darts if isinstance(darts, array) else array('i', darts)
+        label = self.next_label
+        self.next_label += 1
+        self.segments[label] = seg
+        self.index.update(dict.fromkeys(seg, label))
+        self.positions.update(zip(seg, range(len(seg))))
+
+        return label
+
+    #-------------------------------------------------------------------------#
+
+    def changeSegments(self, labels, new_segs, ranges = None):
+        """
+        Remove the segments with the given labels, and add segments with the
+        darts in each item of new_segs, which are taken from the darts of the
+        removed segments. The first new segment takes the first label, and
+        the others get new labels. The change is recorded, so that it can be
+        undone.
+
+        If ranges is given, the darts of the first new segment are at the same
+        indices as in the first removed segment, other than in the ranges
+        (first, last) listed, as from reverseRun(), and only the darts in
+        those ranges are given new positions.
+        """
+
+        segments, index, positions = self.segments, self.index, self.positions
+        first_label = labels[0]
+        old_segs = [(label, segments.pop(label)) for label in labels]
+
+        # Only darts moving to a different segment are given a new label, and
+        # only darts moving to a different index are given a new position
+
+        for (label, seg) in old_segs[1:]:
+            index.update(dict.fromkeys(seg, first_label))
+
+        first_seg = new_segs[0]
+
+        if not isinstance(first_seg, array):
+            first_seg = array('i', first_seg)
+
+        segments[first_label] = first_seg
+
+        for (first, last) in [(0, len(first_seg))] if ranges is None else ranges:
+            positions.update(zip(first_seg[first : last], range(first, last)))
+
+        for darts in new_segs[1:]:
+            self.addSegment(darts)
+
+        self.log += [(old_segs, len(new_segs) - 1, ranges)]
+
+    #-------------------------------------------------------------------------#
+
+    def mark(self):
+        """
+        Return a mark for the current segments, to pass to undo().
+        """
+
+        return len(self.log)
+
+    #-------------------------------------------------------------------------#
+
+    def undo(self, mark):
+        """
+        Undo the changes made since mark() returned the given mark, in
+        reverse order.
+        """
+
+        segments, index, positions, log = self.segments, self.index, self.positions, self.log
+
+        while len(log) > mark:
+            (old_segs, num_added, ranges) = log.pop()
+            (first_label, first_seg) = old_segs[0]
+
+            # The darts of the first old segment which were kept at the same
+            # index are in neither the given ranges nor past the end of the
+            # new segment, so only the others are given their old positions
+
+            if ranges is None:
+                ranges = [(0, len(first_seg))]
+            else:
+                ranges = ranges + [(len(segments[first_label]), len(first_seg))]
+
+            for (first, last) in ranges:
+                positions.update(zip(first_seg[first : last], range(first, last)))
+
+            # Darts in the added segments came from the first old segment,
+            # unless they are in one of the others
+
+            for iii in range(num_added):
+                self.next_label -= 1
+                index.update(dict.fromkeys(segments.pop(self.next_label), first_label))
+
+            for (label, seg) in old_segs[1:]:
+                index.update(dict.fromkeys(seg, label))
+                positions.update(zip(seg, range(len(seg))))
+                segments[label] = seg
+
+            segments[first_label] = first_seg
+
+    #-------------------------------------------------------------------------#
+
+    def replaceSegment(self, label, darts):
+        """
+        Replace the segment with the given label by a segment with the given
+        darts, keeping the same label.
+        """
+
+        self.changeSegments([label], [darts])
+
+    #-------------------------------------------------------------------------#
+
+    def connectList(self, node):
+        """
+        Find the lists seg_list and connect_list of connectList() for a
+        crossing with PD code node = [d0, d1, d2, d3], with the labels of
+        segments in place of their indices in e_path. Since the link passes
+        straight through the crossing, d0 is always joined to d2, and d1 to
+        d3, even when an edge of the link joins two darts of the crossing.
+        """
+
+        index, positions = self.index, self.positions
+        seg_list = [(index[dart], positions[dart]) for dart in node]
+        connect_list = []
+
+        for (first, second) in [(0, 2), (1, 3)]:
+            (label, pos) = seg_list[first]
+            seg = self.segments[label]
+
+            if seg[pos - len(seg) + 1] == node[second]:
+                connect_list += [(node[first], node[second])]
+            elif seg[pos - 1] == node[second]:
+                connect_list += [(node[second], node[first])]
+
+        return [seg_list, connect_list]
+
+    #-------------------------------------------------------------------------#
+
+    def splitSegment(self, label, start_1, stop_1, start_2, stop_2):
+        """
+        Split the segment with the given label in two, in the same way as
+        splitSegment().
+        """
+
+        seg = self.segments[label]
+
+        self.changeSegments([label], [cyclicSlice(seg, start_1, stop_1),
+                                      cyclicSlice(seg, start_2, stop_2)])
+
+    #-------------------------------------------------------------------------#
+
+    def sewSegments(self, label_1, label_2, start_1, stop_1, start_2, stop_2):
+        """
+        Join the two segments with the given labels together, in the same way
+        as sewSegments().
+        """
+
+        seg_1, seg_2 = self.segments[label_1], self.segments[label_2]
+
+        self.changeSegments([label_1, label_2], [cyclicSlice(seg_1, start_1, stop_1) +
+                                                 cyclicSlice(seg_2, start_2, stop_2)])
+
+#=============================================================================#
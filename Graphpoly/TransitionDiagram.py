@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+"""
+A decision diagram holding every choice of transitions at the vertices of a
+knotted 4-valent graph which gives an Eulerian circuit, built one vertex at a
+time in the same way as transitionCircuits(). Instead of going through each
+choice, the choices which leave the strands in the same state are merged, so
+the diagram has one node for each state reached at each level. The state
+after some of the vertices are dealt with is given by the pairs of ends of
+the strands through those vertices; the other strands are still those of the
+graph, so the state only involves darts next to the vertices already dealt
+with (the frontier).
+
+Each path from the root to the end of the diagram is one Eulerian circuit,
+so the number of circuits is found by counting paths, without going through
+them. The circuits are numbered in order of their path through the diagram,
+so a circuit can be found from its number directly. This allows the circuits
+to be sampled uniformly, or gone through in chunks given by ranges of
+numbers.
+"""
+
+import random
+from collections import deque
+
+from Graphpoly.createCircuits import circuitGraphs
+from Graphpoly.transitionCircuits import followCircuit, graphStrands, transition_list
+
+#=============================================================================#
+
+class TransitionDiagram:
+
+    def __init__(self, PD_list, type_list):
+        """
+        Build the diagram for the graph with the given PD code and node types,
+        in the same form as for createCircuits().
+        """
+
+        self.PD_list = [[dart for dart in node] for node in PD_list]
+        self.type_list = list(type_list)
+
+        [self.edge, self.passage, self.vertex_list, end] = graphStrands(PD_list, type_list)
+
+        # The children of each node at each level are given by a list with the
+        # index of the node at the next level for each transition, or -1 if
+        # the transition closes a loop too early. At the last level, the
+        # index is 0 if the transition closes the circuit. The number of paths
+        # from each node to the end of the diagram is given by counts.
+
+        self.children = []
+        self.counts = []
+
+        if len(self.vertex_list) == 0:
+            circuit = followCircuit(self.edge, self.passage)
+            self.num_circuits = 1 if len(circuit) == len(self.edge) else 0
+            return
+
+        if end is None:
+            self.num_circuits = 0
+            return
+
+        self.orderVertices(end)
+        self.buildLevels(end)
+
+        # Count the paths from each node, starting from the last level
+
+        below = [1]
+
+        for children in reversed(self.children):
+            below = [sum(below[child] for child in child_list if child >= 0)
+                     for child_list in children]
+            self.counts = [below] + self.counts
+
+        self.num_circuits = self.counts[0][0]
+
+    #-------------------------------------------------------------------------#
+
+    def orderVertices(self, end):
+        """
+        Order the vertices by a breadth-first search along the strands of the
+        graph, so that the frontier stays small.
+        """
+
+        vertex_list = self.vertex_list
+        dart_node = {dart : iii for (iii, node) in enumerate(vertex_list) for dart in node}
+        added = [False for node in vertex_list]
+
+        self.vertex_list = []
+
+        for start in range(len(vertex_list)):
+            if added[start]:
+                continue
+
+            added[start] = True
+            queue = deque([start])
+
+            while len(queue) > 0:
+                node = queue.popleft()
+                self.vertex_list += [vertex_list[node]]
+
+                for dart in vertex_list[node]:
+                    other = dart_node[end[dart]]
+
+                    if not added[other]:
+                        added[other] = True
+                        queue.append(other)
+
+    #-------------------------------------------------------------------------#
+
+    def buildLevels(self, end):
+        """
+        Go through the vertices in order, finding the states reached by each
+        transition from each state at the previous level. A state is a tuple
+        of the pairs (a, b), with a < b, of the ends of the strands through
+        the vertices dealt with so far.
+        """
+
+        state_list = [()]
+
+        for (level, node) in enumerate(self.vertex_list):
+            open_ends = 4 * (len(self.vertex_list) - level)
+            next_states = {}
+            children = []
+
+            for state in state_list:
+                child_list = []
+
+                for transition in transition_list:
+                    pairs = {}
+
+                    for (dart_1, dart_2) in state:
+                        pairs[dart_1], pairs[dart_2] = dart_2, dart_1
+
+                    closed = False
+                    num_ends = open_ends
+
+                    # Join the ends of the strands at the darts paired by the
+                    # transition, as in transitionCircuits()
+
+                    for (loc_1, loc_2) in transition:
+                        dart_1, dart_2 = node[loc_1], node[loc_2]
+                        end_1, end_2 = pairs.get(dart_1, end[dart_1]), pairs.get(dart_2, end[dart_2])
+                        num_ends -= 2
+
+                        for dart in [dart_1, dart_2, end_1, end_2]:
+                            pairs.pop(dart, None)
+
+                        if end_1 != dart_2:
+                            pairs[end_1], pairs[end_2] = end_2, end_1
+                        elif num_ends > 0:
+                            closed = True
+                            break
+
+                    if closed:
+                        child_list += [-1]
+                    elif num_ends == 0:
+                        child_list += [0]
+                    else:
+                        key = tuple(sorted((dart_1, dart_2) for (dart_1, dart_2) in pairs.items()
+                                           if dart_1 < dart_2))
+
+                        if key not in next_states:
+                            next_states[key] = len(next_states)
+
+                        child_list += [next_states[key]]
+
+                children += [child_list]
+
+            self.children += [children]
+            state_list = list(next_states.keys())
+
+    #-------------------------------------------------------------------------#
+
+    def count(self):
+        """
+        Return the number of Eulerian circuits through the graph, not
+        counting the reverse of each circuit separately.
+        """
+
+        return self.num_circuits
+
+    #-------------------------------------------------------------------------#
+
+    def numNodes(self):
+        return sum(len(children) for children in self.children)
+
+    #-------------------------------------------------------------------------#
+
+    def transitions(self, index):
+        """
+        Return the list of transitions (indices for transition_list) chosen
+        at each vertex for the circuit with the given number.
+        """
+
+        if not 0 <= index < self.num_circuits:
+            raise ValueError('Circuit number out of range: ' + str(index))
+
+        choice_list = []
+        node = 0
+
+        for (level, children) in enumerate(self.children):
+            below = self.counts[level + 1] if level + 1 < len(self.counts) else [1]
+
+            for (transition, child) in enumerate(children[node]):
+                if child < 0:
+                    continue
+                elif index < below[child]:
+                    break
+
+                index -= below[child]
+
+            choice_list += [transition]
+            node = child
+
+        return choice_list
+
+    #-------------------------------------------------------------------------#
+
+    def circuit(self, index):
+        """
+        Return the circuit with the given number, as a list of the darts
+        passed through, in the same form as from transitionCircuits().
+        """
+
+        passage = dict(self.passage)
+
+        for (node, transition) in zip(self.vertex_list, self.transitions(index)):
+            for (loc_1, loc_2) in transition_list[transition]:
+                passage[node[loc_1]], passage[node[loc_2]] = node[loc_2], node[loc_1]
+
+        return followCircuit(self.edge, passage)
+
+    #-------------------------------------------------------------------------#
+
+    def graphs(self, index):
+        """
+        Return the graph for the circuit with the given number, and the graph
+        for the reversed circuit, as in createCircuits().
+        """
+
+        return circuitGraphs(self.PD_list, self.type_list, self.circuit(index))
+
+    #-------------------------------------------------------------------------#
+
+    def sample(self, rng = random):
+        """
+        Return a circuit chosen uniformly at random, using the random number
+        generator rng (such as an instance of random.Random).
+        """
+
+        if self.num_circuits == 0:
+            raise ValueError('Graph has no Eulerian circuits')
+
+        return self.circuit(rng.randrange(self.num_circuits))
+
+    #-------------------------------------------------------------------------#
+
+    def iterCircuits(self, start = 0, stop = None):
+        """
+        Go through the circuits with numbers from start up to (but not
+        including) stop, or to the last circuit if stop is None.
+        """
+
+        stop = self.num_circuits if stop is None else min(stop, self.num_circuits)
+
+        for index in range(start, stop):
+            yield self.circuit(index)
+
+#=============================================================================#
@@ -6,18 +6,36 @@ Created on Sun Jun  9 09:22:42 2019
 """
 
 from Graphpoly.addPair import addPair
+from Graphpoly.canonicalPD import canonicalGraph, canonicalKnot
 from Graphpoly.connectList import connectList
-from Graphpoly.createCircuits import createCircuits
-from Graphpoly.createInducedKnot import createInducedKnot
+from Graphpoly.createCircuits import createCircuits, iterCircuits
+from Graphpoly.createInducedKnot import createInducedKnot, createInducedKnots
 from Graphpoly.createSequences import createSequences
+from Graphpoly.crossingOrder import crossingOrder, frontierWidth
+from Graphpoly.graphAutomorphisms import graphAutomorphisms
+from Graphpoly.graphInvariantMultiset import graphInvariantMultiset, quandleColorings
+from Graphpoly.grayBracket import grayBracket
+from Graphpoly.InvariantCache import InvariantCache, pdKey
 from Graphpoly.isRealizable import isRealizable
 from Graphpoly.labelReverse import labelReverse
-from Graphpoly.LPoly import LPoly
+from Graphpoly.LaurentPoly import LaurentPoly, loopPower
+from Graphpoly.LPoly import iterLPoly, LPoly
+from Graphpoly.LRUCache import LRUCache
+from Graphpoly.memoBracket import memoBracket
 from Graphpoly.modOrbit import modOrbit
 from Graphpoly.notComposite import notComposite
+from Graphpoly.pairDarts import pairDarts
+from Graphpoly.planarBracket import planarBracket
 from Graphpoly.planarDiagram import planarDiagram
 from Graphpoly.properPair import properPair
 from Graphpoly.reorder import reorder
 from Graphpoly.segIndexList import segIndexList
+from Graphpoly.SegmentArray import SegmentArray
 from Graphpoly.sewSegments import sewSegments
-from Graphpoly.splitSegment import splitSegment
\ No newline at end of file
+from Graphpoly.simplifyDiagram import arcCode, simplifyDiagram
+from Graphpoly.splitSegment import splitSegment
+from Graphpoly.stateBracket import stateBracket
+from Graphpoly.transitionCircuits import transitionCircuits
+from Graphpoly.TransitionDiagram import TransitionDiagram
+from Graphpoly.twoVarPoly import twoVarPoly
+from Graphpoly.vectorBracket import vectorBracket
\ No newline at end of file
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""
+This program finds a canonical form for the PD code of a knot diagram, or of
+a knotted 4-valent graph, which does not depend on how the diagram is
+labelled, where the labels start, or (optionally) the direction they go in.
+Two diagrams have the same canonical form exactly when one can be relabelled
+to give the other.
+
+The labels of both kinds of PD code go along a single closed curve through the
+diagram: the edges of a knot diagram from createInducedKnot() in the order they
+are passed through, and the darts of a graph from planarDiagram() along the
+circuit straight through every node. Any relabelling of this kind is given by
+a starting label and a direction, so each start and direction is tried, and
+the smallest code found is kept. For each choice, the code is built one item
+at a time, in the order of the new labels, and the choice is dropped as soon
+as the code is larger than the smallest one found so far.
+"""
+
+#=============================================================================#
+
+def smallestCode(num_items, start_list, codeItem):
+    """
+    Given a function codeItem(start, iii) giving item iii of the code for
+    each start in start_list, return the start giving the smallest code, with
+    num_items items, comparing the codes one item at a time.
+    """
+
+    best_start = start_list[0]
+    best_code = [codeItem(best_start, iii) for iii in range(num_items)]
+
+    for start in start_list[1:]:
+        for iii in range(num_items):
+            item = codeItem(start, iii)
+
+            if item > best_code[iii]:
+                break
+            elif item < best_code[iii]:
+
+                # The new code is smaller, so keep the rest of it
+
+                best_start = start
+                best_code[iii:] = [codeItem(start, jjj) for jjj in range(iii, num_items)]
+                break
+
+    return best_start
+
+#-----------------------------------------------------------------------------#
+
+def canonicalKnot(knotCode, f_list, reverse = True):
+    """
+    Return the canonical form [knotCode, f_list] of the PD code knotCode (in
+    terms of its edges) and f(i) function list f_list of a knot diagram, as
+    from createInducedKnot(). In the canonical form, edge iii enters crossing
+    iii as the undercrossing, so that crossing iii is [iii, j, iii + 1, j].
+    If reverse is True, the direction of the knot may also be reversed; this
+    does not change the f(i) value of any crossing, since both the
+    undercrossing and overcrossing change direction.
+    """
+
+    num_cross = len(knotCode)
+
+    if num_cross == 0:
+        return [[], []]
+
+    # Go along the knot once from edge 0, finding the position of each edge;
+    # the crossings entered and left by each edge as the undercrossing are
+    # given by enter_list and leave_list
+
+    enter_list = [None for edge in range(num_cross)]
+    leave_list = [None for edge in range(num_cross)]
+
+    for (crossing, f) in zip(knotCode, f_list):
+        enter_list[crossing[0]] = (crossing[1], f)
+        leave_list[crossing[2]] = (crossing[1], f)
+
+    next_edge = {crossing[0] : crossing[2] for crossing in knotCode}
+    edge_list = []
+    edge = 0
+
+    while len(edge_list) < num_cross:
+        edge_list += [edge]
+        edge = next_edge[edge]
+
+    if edge != 0 or len(set(edge_list)) < num_cross:
+        raise ValueError('PD code is not for a knot: ' + str(knotCode))
+
+    position = [0 for edge in range(num_cross)]
+
+    for (iii, edge) in enumerate(edge_list):
+        position[edge] = iii
+
+    #-------------------------------------------------------------------------#
+
+    # Item iii of the code for each start (position of the new edge 0, and
+    # direction) is the new label of the overcrossing, and the f(i) value,
+    # for the crossing entered by new edge iii
+
+    def codeItem(start, iii):
+        (first, direction) = start
+
+        if direction == 1:
+            (over, f) = enter_list[edge_list[(first + iii) % num_cross]]
+        else:
+            (over, f) = leave_list[edge_list[(first - iii) % num_cross]]
+
+        return ((position[over] - first) * direction % num_cross, f)
+
+    direction_list = [1, -1] if reverse else [1]
+    start_list = [(first, direction) for direction in direction_list for first in range(num_cross)]
+
+    start = smallestCode(num_cross, start_list, codeItem)
+    code = [codeItem(start, iii) for iii in range(num_cross)]
+
+    return [[[iii, over, (iii + 1) % num_cross, over] for (iii, (over, f)) in enumerate(code)],
+            [f for (over, f) in code]]
+
+#-----------------------------------------------------------------------------#
+
+def canonicalGraph(PD_list, type_list, reverse = True):
+    """
+    Return the canonical form [PD_list, type_list] of the PD code and node
+    types of a knotted 4-valent graph, in the form from planarDiagram(), with
+    dart d joined to dart d + 1 along the circuit straight through each node.
+    The nodes are given in order of their lowest dart. Only relabellings
+    keeping darts entering a node even are used, so the new dart 0 is an
+    even dart, or an odd dart if the direction is reversed (if reverse is
+    True). Reversing the direction takes the PD code [a, b, c, d] of a node
+    to [c, d, a, b], and does not change the node types.
+    """
+
+    num_node = len(PD_list)
+    num_darts = 4 * num_node
+
+    if num_node == 0:
+        return [[], []]
+
+    dart_node = [0 for dart in range(num_darts)]
+
+    for (node, dart_list) in enumerate(PD_list):
+        for dart in dart_list:
+            dart_node[dart] = node
+
+    # Item iii of the code for each start (old label of the new dart 0, and
+    # direction) is the new PD code and type of the node with new dart iii,
+    # if new dart iii is the lowest dart of its node, and (-1,) otherwise
+
+    def codeItem(start, iii):
+        (first, direction) = start
+        node = dart_node[(first + direction * iii) % num_darts]
+        new_node = [(dart - first) * direction % num_darts for dart in PD_list[node]]
+
+        if min(new_node) != iii:
+            return (-1,)
+
+        if direction == -1:
+            new_node = new_node[2:] + new_node[:2]
+
+        return (tuple(new_node), type_list[node])
+
+    start_list = [(first, 1) for first in range(0, num_darts, 2)]
+
+    if reverse:
+        start_list += [(first, -1) for first in range(1, num_darts, 2)]
+
+    start = smallestCode(num_darts, start_list, codeItem)
+    code = [item for item in [codeItem(start, iii) for iii in range(num_darts)] if len(item) > 1]
+
+    return [[list(node) for (node, node_type) in code], [node_type for (node, node_type) in code]]
+
+#=============================================================================#
@@ -25,44 +25,117 @@ The second list, type_list, gives the node state and information about how the
 half-edges cross each other in the given orientation. A node state has
 magnitude 1 if it is a crossing, and 2 if it is a vertex; the sign comes from
 the value f(i) for the given node.
+
+The circuits are found by a depth-first search, moving a single Graph object
+along each possible circuit. Each change made to the graph is recorded in an
+undo log, so that the graph can be returned to the point where the next dart
+is chosen, instead of keeping a copy of the graph for each choice. The
+circuits can also be found by choosing a transition at each vertex of the
+graph (see transitionCircuits).
 """
 
-from copy import deepcopy
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from Graphpoly.graphAutomorphisms import graphAutomorphisms
+from Graphpoly.transitionCircuits import transitionCircuits
+
+#=============================================================================#
+
+def leastRotation(seq):
+    """
+    Find the index at which the smallest cyclic permutation of the list seq
+    starts, in linear time, using Booth's algorithm.
+    """
+    
+    double_seq = seq + seq
+    failure = [-1 for iii in range(len(double_seq))]
+    start = 0
+    
+    for jjj in range(1, len(double_seq)):
+        label = double_seq[jjj]
+        iii = failure[jjj - start - 1]
+        
+        while iii != -1 and label != double_seq[start + iii + 1]:
+            if label < double_seq[start + iii + 1]:
+                start = jjj - iii - 1
+            iii = failure[iii]
+            
+        if label != double_seq[start + iii + 1]:
+            
+            # Here iii = -1, so compare with the start of the current rotation
+            
+            if label < double_seq[start]:
+                start = jjj
+            failure[jjj - start] = -1
+        else:
+            failure[jjj - start] = iii + 1
+            
+    return start
 
 #=============================================================================#
 
 class Graph:
+    
+    # The state of the graph is kept in a fixed set of attributes. The arrays
+    # node_type, dart_node, dart_pos and dart_match are found once from the
+    # PD code, and are shared between copies of the graph; dart_adj is the
+    # only array changed during the search.
+    
+    __slots__ = ['num_node', 'cpath', 'epath', 'back_node', 'undo_log', 'node_type', 'PD_code',
+                 'dart_node', 'dart_pos', 'dart_match', 'dart_adj', 'current_node',
+                 'current_dart', 'next_dart_list']
+    
     def __init__(self, PD_code, type_list):
         
         if len(PD_code) != len(type_list):
             print('PD code has different length than type_list')
         self.num_node = len(PD_code)
+        num_darts = 4 * self.num_node
         
         # Definitions
         
         self.cpath = []
         self.epath = []
-        self.node_type_dict = {iii : type_list[iii] for iii in range(self.num_node)}
+        self.back_node = -1
+        self.undo_log = []
+        self.node_type = array('i', type_list)
         self.PD_code = [[label for label in node] for node in PD_code]
         
-        # Create a dictionary from PD code, with key as dart label, and value
-        # as node the dart is incident to
+        # Create arrays from PD code, giving the node each dart is incident
+        # to, and the position of the dart in the PD code for that node
+        
+        self.dart_node = array('i', [-1]) * num_darts
+        self.dart_pos = array('i', [-1]) * num_darts
+        
+        for (node, dart_list) in enumerate(self.PD_code):
+            for (loc, dart) in enumerate(dart_list):
+                self.dart_node[dart] = node
+                self.dart_pos[dart] = loc
+                
+        # Create an array giving the dart on the other end of the edge for
+        # each dart. Find location of outgoing darts by using original node
+        # type list; the outgoing dart d is joined to the incoming dart d + 1.
         
-        self.dart_dict = {iii : -1 for iii in range(4 * self.num_node)}
+        self.dart_match = array('i', [-1]) * num_darts
         
         for (node, dart_list) in enumerate(self.PD_code):
-            for dart in dart_list:
-                self.dart_dict[dart] = node
+            outgoing_list = [2, 3] if self.node_type[node] > 0 else [1, 2]
+            
+            for (loc, dart) in enumerate(dart_list):
+                if loc in outgoing_list:
+                    self.dart_match[dart] = (dart + 1) % num_darts
+                else:
+                    self.dart_match[dart] = (dart - 1) % num_darts
         
-        # Create a dictionary from PD code, with key as node label, and
-        # value as list of half-edges incident to the node.
+        # Create an array from PD code, with the half-edges incident to node
+        # iii in entries 4 * iii, ..., 4 * iii + 3.
         
-        # This dict will be altered i løpet av programmet, to keep track of
+        # This array will be altered i løpet av programmet, to keep track of
         # which edges have been used. The original PD code will be used at the
         # end to find the PD code for the Eulerian circuit through the graph.
 
-        self.dart_adj_dict = {iii : [dart for dart in self.PD_code[iii]]
-                              for iii in range(self.num_node)}
+        self.dart_adj = array('i', [dart for node in self.PD_code for dart in node])
         
         # Set starting dart, node
         
@@ -80,45 +153,31 @@ class Graph:
         # is the only available edge for the next move; otherwise, all edges
         # except for the current edge are available.
         
-        loc = self.dart_adj_dict[self.current_node].index(self.current_dart)
+        loc = self.dart_pos[self.current_dart]
         
-        if abs(self.node_type_dict[self.current_node]) == 1:
-            self.next_dart_list = [self.dart_adj_dict[self.current_node][(loc + 2) % 4]]
+        if abs(self.node_type[self.current_node]) == 1:
+            self.next_dart_list = [self.dart_adj[(loc + 2) % 4]]
         else:
-            self.next_dart_list = [dart for dart in self.dart_adj_dict[self.current_node]
-                                   if dart != self.current_dart]
+            self.next_dart_list = [dart for dart in self.dart_adj[:4] if dart != self.current_dart]
 
     #-------------------------------------------------------------------------#
         
     def __eq__(self, other):
         """
         Check for equality between two graphs by testing their final Eulerian
-        circuits. Since permuted versions of these circuits are considered
-        equivalent, we use permutations for the equality test.
+        circuits. Since cyclic permutations and reversals of these circuits
+        are considered equivalent, we compare their keys from circuitKey().
         """
         
-        # Get other epath
-        
-        other_epath = other.listEPath()
-        
-        # Check lengths of epaths
-        
-        if len(self.epath) != len(other_epath):
-            return False
-        
-        # Try all cyclic permutations of other.epath, and compare to
-        # self.epath; include reversals of entire list
-        
-        for iii in range(len(self.epath)):
-            new_epath = other_epath[iii:] + other_epath[:iii]
-            if new_epath == self.epath:
-                return True
-            if new_epath.reverse() == self.epath:
-                return True
-            
-        # No permutations work
+        if not isinstance(other, Graph):
+            return NotImplemented
         
-        return False
+        return self.circuitKey() == other.circuitKey()
+
+    #-------------------------------------------------------------------------#
+    
+    def __hash__(self):
+        return hash(self.circuitKey())
 
     #-------------------------------------------------------------------------#
         
@@ -135,8 +194,13 @@ class Graph:
         
         dart = self.cpath[-2]
         
+        # Record the current position, so the step can be undone
+        
+        self.undo_log += [('backtrack', self.back_node, self.current_node, self.current_dart,
+                           self.next_dart_list)]
+        
         self.epath += [self.cpath[-1], self.cpath[-2]]
-        self.cpath = self.cpath[:-2]
+        del self.cpath[-2:]
         
         # Find node on other end of current_edge, other dart on same edge.
         # I have added a back_node variable here, to see which node has just
@@ -144,22 +208,23 @@ class Graph:
         # half-darts for this back node have been passed through on self.epath
         
         self.back_node = self.current_node
-        self.current_node = self.dart_dict[dart]
+        self.current_node = self.dart_node[dart]
         self.current_dart = dart
         
-        # Update next available dart list; use original PD code to find index
-        # of current_dart, since it may no longer be in dart_adj_dict
+        # Update next available dart list; use original position of
+        # current_dart, since it may no longer be in dart_adj
         
-        loc = self.PD_code[self.current_node].index(self.current_dart)
+        base = 4 * self.current_node
+        loc = self.dart_pos[self.current_dart]
         
-        if abs(self.node_type_dict[self.current_node]) == 1:
-            if self.dart_adj_dict[self.current_node][(loc + 2) % 4] != -1:
+        if abs(self.node_type[self.current_node]) == 1:
+            if self.dart_adj[base + (loc + 2) % 4] != -1:
                 self.next_dart_list = [self.PD_code[self.current_node][(loc + 2) % 4]]
         else:
-            self.next_dart_list = [dart for dart in self.dart_adj_dict[self.current_node]
+            self.next_dart_list = [dart for dart in self.dart_adj[base : base + 4]
                                    if dart != self.current_dart and dart != -1]
             
-        #-------------------------------------------------------------------------#
+    #-------------------------------------------------------------------------#
     
     def chooseNextDart(self, next_dart_label):
         """
@@ -179,38 +244,88 @@ class Graph:
             
         self.cpath += [next_dart_label]
         
-        # Removes dart as a valid choice from dart_adj_dict, replacing label
-        # with -1 to show it has been used in the temporary Eulerian circuit.
+        # Removes dart as a valid choice from dart_adj, replacing label with
+        # -1 to show it has been used in the temporary Eulerian circuit.
+        
+        loc = self.dart_pos[next_dart_label]
+        self.dart_adj[4 * self.current_node + loc] = -1
+        
+        # Record the current position, and where the dart was removed, so the
+        # step can be undone
         
-        loc = self.dart_adj_dict[self.current_node].index(next_dart_label)
-        self.dart_adj_dict[self.current_node][loc] = -1
+        self.undo_log += [('choose', self.current_node, self.current_dart, self.next_dart_list,
+                           loc)]
         
         # Finds dart sharing same edge, and makes it current dart; add to cpath
         
-        self.current_dart = self.findDartMatch(next_dart_label)
+        self.current_dart = self.dart_match[next_dart_label]
         self.cpath += [self.current_dart]
         
         # Move current node to other side of edge
         
-        self.current_node = self.dart_dict[self.current_dart]
+        self.current_node = self.dart_node[self.current_dart]
         
         # Update next available dart list, then remove dart used to reach this
         # new current node
         
-        loc = self.dart_adj_dict[self.current_node].index(self.current_dart)
+        base = 4 * self.current_node
+        loc = self.dart_pos[self.current_dart]
         
-        if abs(self.node_type_dict[self.current_node]) == 1:
-            if self.dart_adj_dict[self.current_node][(loc + 2) % 4] != -1:
-                self.next_dart_list = [self.dart_adj_dict[self.current_node][(loc + 2) % 4]]
+        if abs(self.node_type[self.current_node]) == 1:
+            if self.dart_adj[base + (loc + 2) % 4] != -1:
+                self.next_dart_list = [self.dart_adj[base + (loc + 2) % 4]]
             else:
                 self.next_dart_list = []
         else:
-            self.next_dart_list = [dart for dart in self.dart_adj_dict[self.current_node]
+            self.next_dart_list = [dart for dart in self.dart_adj[base : base + 4]
                                    if dart != self.current_dart and dart != -1]
             
-        self.dart_adj_dict[self.current_node][loc] = -1
+        self.dart_adj[base + loc] = -1
         
     #-------------------------------------------------------------------------#
+    
+    def circuitKey(self):
+        """
+        Return a key for the Eulerian circuit epath, which is the same for
+        all cyclic permutations of epath and of its reversal. This is the
+        smallest cyclic permutation of either, as a tuple.
+        """
+        
+        reverse_epath = self.epath[::-1]
+        
+        start = leastRotation(self.epath)
+        reverse_start = leastRotation(reverse_epath)
+        
+        return min(tuple(self.epath[start:] + self.epath[:start]),
+                   tuple(reverse_epath[reverse_start:] + reverse_epath[:reverse_start]))
+    
+    #-------------------------------------------------------------------------#
+    
+    def copy(self):
+        """
+        Make a copy of the graph, with its own lists of darts, but without the
+        undo log. The arrays which do not change are shared with the copy.
+        """
+        
+        new = Graph.__new__(Graph)
+        new.num_node = self.num_node
+        new.cpath = list(self.cpath)
+        new.epath = list(self.epath)
+        new.back_node = self.back_node
+        new.undo_log = []
+        new.node_type = self.node_type
+        new.PD_code = [list(node) for node in self.PD_code]
+        new.dart_node = self.dart_node
+        new.dart_pos = self.dart_pos
+        new.dart_match = self.dart_match
+        new.dart_adj = array('i', self.dart_adj)
+        new.current_node = self.current_node
+        new.current_dart = self.current_dart
+        new.next_dart_list = list(self.next_dart_list)
+        
+        return new
+    
+    #-------------------------------------------------------------------------#
             
     def currentNodeDegree(self):
         """
@@ -227,24 +342,7 @@ class Graph:
         Given a dart label, we find the other dart on the same edge.
         """
         
-        # Find the node that the dart is incident to
-        
-        node = self.dart_dict[dart]
-        
-        # Find location of outgoing darts by using original node type list
-        
-        if self.node_type_dict[node] > 0:
-            outgoing_list = [2, 3]
-        else:
-            outgoing_list = [1, 2]
-        
-        # Find out if this is an incoming or outgoing edge in the original
-        # DT sequence by using the PD code
-        
-        if self.PD_code[node].index(dart) in outgoing_list: # outgoing dart
-            return ((dart + 1) % (4 * self.num_node))
-        else:                                               # incoming dart
-            return (dart - 1) % (4 * self.num_node)
+        return self.dart_match[dart]
     
     #-------------------------------------------------------------------------#
             
@@ -257,6 +355,11 @@ class Graph:
         return len(self.epath)
     
     #-------------------------------------------------------------------------#
+            
+    def lenUndoLog(self):
+        return len(self.undo_log)
+    
+    #-------------------------------------------------------------------------#
         
     def listAvailableDarts(self):
         """
@@ -290,7 +393,7 @@ class Graph:
         Eulerian circuit
         """
         
-        return self.dart_adj_dict
+        return {node : list(self.dart_adj[4 * node : 4 * node + 4]) for node in range(self.num_node)}
     
     #-------------------------------------------------------------------------#
     
@@ -299,7 +402,7 @@ class Graph:
         Keys are dart labels, values is node label dart is incident to
         """
         
-        return self.dart_dict
+        return {dart : node for (dart, node) in enumerate(self.dart_node)}
     
     #-------------------------------------------------------------------------#
     
@@ -309,7 +412,7 @@ class Graph:
     #-------------------------------------------------------------------------#
     
     def listNodeTypeDict(self):
-        return self.node_type_dict
+        return {iii : node_type for (iii, node_type) in enumerate(self.node_type)}
         
     #-------------------------------------------------------------------------#
     
@@ -395,81 +498,331 @@ class Graph:
         self.PD_code = [[code[2], code[3], code[0], code[1]] for code in self.PD_code]
         #self.node_type_dict = {iii : -self.node_type_dict[iii] for iii in self.node_type_dict.keys()}
         
+    #-------------------------------------------------------------------------#
+    
+    def undo(self, mark):
+        """
+        Undo the steps made by chooseNextDart() and backtrack(), in reverse
+        order, until the undo log has length mark.
+        """
+        
+        while len(self.undo_log) > mark:
+            step = self.undo_log.pop()
+            
+            if step[0] == 'choose':
+                
+                # Put back the darts removed from both ends of the edge, and
+                # remove the edge from cpath
+                
+                (label, node, dart, next_dart_list, loc) = step
+                
+                self.dart_adj[4 * self.current_node + self.dart_pos[self.current_dart]] = \
+                    self.current_dart
+                self.dart_adj[4 * node + loc] = self.cpath[-2]
+                
+                del self.cpath[-2:]
+                
+            else:
+                
+                # Move the edge from the end of epath back to cpath
+                
+                (label, self.back_node, node, dart, next_dart_list) = step
+                
+                self.cpath += [self.epath[-1], self.epath[-2]]
+                del self.epath[-2:]
+                
+            self.current_node, self.current_dart = node, dart
+            self.next_dart_list = next_dart_list
+        
 #=============================================================================#
 
-def createCircuits(PD_list, type_list):
+def orderedGraphs(G):
+    """
+    Make copies of the graph G, once it has found an Eulerian circuit,
+    returning the graph with its PD code ordered to match the circuit, and
+    the graph for the reversed circuit.
+    """
+    
+    newGraph = G.copy()
+    newGraph.order()
     
-    # Create the starting graph
+    # Include reversed version of graph circuit
+    
+    revGraph = newGraph.copy()
+    revGraph.reverseGraph()
+    
+    return [newGraph, revGraph]
 
+#-----------------------------------------------------------------------------#
+
+def circuitGraphs(PD_list, type_list, circuit):
+    """
+    Make the graph for a given Eulerian circuit through the knotted graph,
+    as a list of the darts passed through, in the same form as the graphs
+    found by createCircuits(). Returns the graph, with its PD code ordered to
+    match the circuit, and the graph for the reversed circuit.
+    """
+    
     G = Graph(PD_list, type_list)
+    G.epath = list(circuit)
+    G.dart_adj = array('i', [-1]) * len(G.dart_adj)
+    G.next_dart_list = []
     
-    # Create stack of graphs, intermediate list of graph classes used to
-    # find Eulerian circuits through the knotted graph, and the final list of
-    # induced knot diagrams
+    return orderedGraphs(G)
+
+#-----------------------------------------------------------------------------#
+
+def searchCircuits(G, dartStack):
+    """
+    Run the depth-first search for Eulerian circuits, starting from the graph
+    G and the stack dartStack of choices of the next dart still to be tried.
+    Items in the stack are of the form (mark, dart), where mark is the length
+    of the undo log of G at the node where dart is chosen. Yields G each time
+    it reaches the end of a circuit; the same circuit may be found more than
+    once.
+    """
     
-    graphStack = [G]
-    graphList = []
+    while len(dartStack) > 0:
+        
+        # Return graph to the node where the next dart is chosen, and move
+        # along the edge for that dart
+        
+        (mark, nextDart) = dartStack.pop()
+        
+        G.undo(mark)
+        G.chooseNextDart(nextDart)
+        
+        # If the current node has no remaining edges, pop edge from cpath, add
+        # edge to epath; algorithm will now backtrack until it finds node
+        # with unused edges
+        
+        while G.lenCPath() > 0 and G.currentNodeDegree() == 0:
+            G.backtrack()
+            
+        # More processing to be done?
+        
+        if G.lenCPath() > 0:
+            
+            # Current node has remaining edges in graph; add each possible
+            # dart for current node to the stack
+            
+            mark = G.lenUndoLog()
+            dartStack += [(mark, dart) for dart in G.listAvailableDarts()]
+        else:
+            yield G
+            
+#-----------------------------------------------------------------------------#
+
+def shardCircuits(G, dart):
+    """
+    Find the circuits reached from the graph G by next choosing dart, or the
+    circuit of G itself if dart is None. Returns a list of items [key,
+    newGraph, revGraph] for each circuit, in the order they are found,
+    without repeats, with key from circuitKey() and the graphs from
+    orderedGraphs().
+    """
+    
+    if dart is None:
+        return [[G.circuitKey()] + orderedGraphs(G)]
+    
+    circuitKeys = set()
+    circuitList = []
+    
+    for circuitGraph in searchCircuits(G, [(G.lenUndoLog(), dart)]):
+        key = circuitGraph.circuitKey()
+        
+        if key not in circuitKeys:
+            circuitKeys.add(key)
+            circuitList += [[key] + orderedGraphs(circuitGraph)]
+            
+    return circuitList
+
+#-----------------------------------------------------------------------------#
+
+def iterCircuits(PD_list, type_list, engine = 'dfs'):
+    """
+    Go through the Eulerian circuits of the knotted graph, in the same order
+    as createCircuits(), yielding the graph for each new circuit (with its
+    PD code ordered to match the circuit), followed by the graph for the
+    reversed circuit, as soon as the circuit is found. Only the keys of the
+    circuits found are kept, so the graphs can be used one at a time.
+    
+    The parameter engine chooses how the circuits are found:
+        
+        'dfs'        : Hierholzer's algorithm, going through every choice of
+                       dart along the way (default)
+        'transition' : choose one of the three transitions at each vertex,
+                       dropping choices which close up a loop too early (see
+                       transitionCircuits)
+                       
+    Both engines give the same graphs, but in a different order.
+    """
+    
+    if engine not in ['dfs', 'transition']:
+        raise ValueError('Unknown engine for iterCircuits: ' + str(engine))
+        
+    # Each circuit found by choosing transitions is new, so only the graph
+    # for the circuit needs to be made
+        
+    if engine == 'transition':
+        for circuit in transitionCircuits(PD_list, type_list):
+            yield from circuitGraphs(PD_list, type_list, circuit)
+            
+        return
     
-    iter = 0
+    # Create the graph, which is moved along each possible Eulerian circuit,
+    # and the keys from circuitKey() of the circuits already found, which are
+    # the same for a circuit and its reverse
+    
+    G = Graph(PD_list, type_list)
+    circuitKeys = set()
     
     # Run through DFS of graphs; this finds all possible Eulerian circuits
-    # through the knotted graph, and records them in graphList
+    # through the knotted graph
     
-    while len(graphStack) > 0:
+    for circuitGraph in searchCircuits(G, [(0, dart) for dart in G.listAvailableDarts()]):
+        key = circuitGraph.circuitKey()
         
-        # Get next graph
+        if key not in circuitKeys:
+            circuitKeys.add(key)
+            yield from orderedGraphs(circuitGraph)
+            
+#-----------------------------------------------------------------------------#
+
+def circuitOrbits(graphList, perm_list):
+    """
+    Given a list of graphs already found by createCircuits(), with each
+    circuit followed by its reverse, and the symmetries of the knotted graph
+    from graphAutomorphisms(), keep only the first circuit in the list from
+    each orbit of circuits under the symmetries. Since circuits in the same orbit give
+    the same induced knot diagram, up to turning the diagram over, only one
+    needs to be dealt with. Returns [orbitList, multiplicity_list], where
+    orbitList is in the same form as graphList, and multiplicity_list gives
+    the number of circuits in the orbit of each graph in orbitList.
+    """
+    
+    circuitKeys = set()
+    orbitList = []
+    multiplicity_list = []
+    
+    for iii in range(0, len(graphList), 2):
+        [newGraph, revGraph] = graphList[iii : iii + 2]
         
-        nextGraph = graphStack.pop()
+        if newGraph.circuitKey() in circuitKeys:
+            continue
         
-        # Print out edge_adj_dict, edge_dict
+        # Find the keys of the images of the circuit under each symmetry
         
-        # If cpath is empty, graph is not placed back into graphStack on any
-        # previous iteration, so safe to assume len(cpath) > 0; see if current
-        # node has non-zero edges left
+        imageGraph = newGraph.copy()
+        orbitKeys = set()
         
-        if nextGraph.currentNodeDegree() == 0:
-            
-            # Current node has no remaining edges, pop edge from cpath, add
-            # edge to epath; algorithm will now backtrack until it finds node
-            # with unused edges
+        for perm in perm_list:
+            imageGraph.epath = [perm[dart] for dart in newGraph.listEPath()]
+            orbitKeys.add(imageGraph.circuitKey())
             
-            nextGraph.backtrack()
+        circuitKeys |= orbitKeys
+        orbitList += [newGraph, revGraph]
+        multiplicity_list += [len(orbitKeys), len(orbitKeys)]
+        
+    return [orbitList, multiplicity_list]
+
+#-----------------------------------------------------------------------------#
+
+def parallelCircuits(PD_list, type_list, workers, split_depth):
+    """
+    Find the list of graphs from createCircuits() for the 'dfs' engine,
+    dividing the search between workers separate processes after the first
+    split_depth choices of dart.
+    """
+    
+    # Make the first split_depth choices of dart. Items in shardList are of
+    # the form (G, dart), for a copy G of the graph and the dart to choose
+    # next, or dart = None once G has reached the end of a circuit. The items
+    # are kept in the order that the search would reach them, so the list of
+    # graphs is the same as for a single process.
+    
+    G = Graph(PD_list, type_list)
+    shardList = [(G, dart) for dart in reversed(G.listAvailableDarts())]
+    
+    for depth in range(split_depth):
+        newList = []
+        
+        for (shardGraph, dart) in shardList:
+            if dart is None:
+                newList += [(shardGraph, dart)]
+                continue
             
-            while nextGraph.lenCPath() > 0:
-                if nextGraph.currentNodeDegree() > 0:
-                    break
-                    iter += 1           # How many times is this part of algorithm hit?
-                else:
-                    nextGraph.backtrack()
-                    
-            # More processing to be done?
+            shardGraph = shardGraph.copy()
+            shardGraph.chooseNextDart(dart)
             
-            if nextGraph.lenCPath() > 0:
-                graphStack += [nextGraph]
-            elif nextGraph not in graphList:
-                nextGraph.order()
-                graphList += [nextGraph]
+            while shardGraph.lenCPath() > 0 and shardGraph.currentNodeDegree() == 0:
+                shardGraph.backtrack()
                 
-                # Include reversed version of graph circuit
-                
-                revGraph = deepcopy(nextGraph)
-                revGraph.reverseGraph()
+            if shardGraph.lenCPath() > 0:
+                newList += [(shardGraph, nextDart)
+                            for nextDart in reversed(shardGraph.listAvailableDarts())]
+            else:
+                newList += [(shardGraph, None)]
                 
-                graphList += [revGraph]
+        shardList = newList
         
-        else:
-            
-            # Current node has remaining edges in graph; go through
-            # all possible darts for current node, and create a
-            # new graph for each choice, add to stack
-            
-            nextList = nextGraph.listAvailableDarts()
-            
-            for nextDart in nextList:
-                newGraph = deepcopy(nextGraph)
-                newGraph.chooseNextDart(nextDart)
-                graphStack += [newGraph]
+    # Find the circuits for each item in a separate process, then merge the
+    # results, keeping the first copy of each circuit
+    
+    with ProcessPoolExecutor(max_workers = workers) as executor:
+        partList = list(executor.map(shardCircuits, [shardGraph for (shardGraph, dart) in shardList],
+                                     [dart for (shardGraph, dart) in shardList]))
+        
+    circuitKeys = set()
+    graphList = []
+    
+    for circuitList in partList:
+        for [key, newGraph, revGraph] in circuitList:
+            if key not in circuitKeys:
+                circuitKeys.add(key)
+                graphList += [newGraph, revGraph]
+    
+    return graphList
+
+#-----------------------------------------------------------------------------#
+
+def createCircuits(PD_list, type_list, engine = 'dfs', workers = 1, split_depth = 4,
+                   orbits = False):
+    """
+    Find the list of graphs for all Eulerian circuits through the knotted
+    graph, with each circuit followed by its reverse, using the given engine
+    (see iterCircuits).
+    
+    For the 'dfs' engine, if workers is greater than one, the first
+    split_depth choices of dart are made in this process, and the partial
+    circuits found are divided between workers separate processes. The
+    results are the same as for a single process, including the order of the
+    list of graphs.
+    
+    If orbits is True, only one circuit is found from each orbit under the
+    symmetries of the knotted graph, and the function returns [graphList,
+    multiplicity_list], with the size of the orbit of each graph. The
+    circuits are then found by choosing transitions, skipping choices which
+    cannot give the first circuit of its orbit (see transitionCircuits), so
+    the other circuits of each orbit are never made, whatever the engine.
+    """
+    
+    if orbits:
+        graphList = []
+        multiplicity_list = []
+        
+        for [circuit, multiplicity] in transitionCircuits(PD_list, type_list, \
+                                                          graphAutomorphisms(PD_list, type_list)):
+            graphList += circuitGraphs(PD_list, type_list, circuit)
+            multiplicity_list += [multiplicity, multiplicity]
             
+        return [graphList, multiplicity_list]
+    
+    if workers <= 1 or split_depth <= 0 or engine != 'dfs':
+        graphList = list(iterCircuits(PD_list, type_list, engine))
+    else:
+        graphList = parallelCircuits(PD_list, type_list, workers, split_depth)
+        
     # Return results
     
     return graphList
@@ -18,24 +18,73 @@ should be grouped together in the final PD code for the induced knot diagram.
 
 class UnionFind:
     
+    # The trees of the union-find data structure are kept in flat lists, with
+    # union by rank and path halving. Each entry has a stamp giving the
+    # generation in which it was last changed; entries with an older stamp
+    # are single item clusters, so that reset() only needs to start a new
+    # generation, and the same instance can be used for every circuit of a
+    # graph.
+    
     def __init__(self, num_entries):
         self.num_entries = num_entries
-        self.root_list = [iii for iii in range(num_entries)]
+        self.generation = 0
+        self.parent = list(range(num_entries))
+        self.rank = [0] * num_entries
+        self.stamp = [0] * num_entries
+        
+    #-------------------------------------------------------------------------#
+
+    def reset(self, num_entries = None):
+        """
+        Make every entry a single item cluster again, with num_entries
+        entries if given, without clearing the arrays.
+        """
+        
+        if num_entries is not None and num_entries > len(self.parent):
+            extra = num_entries - len(self.parent)
+            self.parent += range(len(self.parent), num_entries)
+            self.rank += [0] * extra
+            self.stamp += [self.generation] * extra
+            
+        if num_entries is not None:
+            self.num_entries = num_entries
+            
+        self.generation += 1
         
     #-------------------------------------------------------------------------#
 
     def rootList(self):
-        return self.root_list
+        """
+        Compress every tree, and return the list of the root of each entry.
+        """
+        
+        num_entries, generation = self.num_entries, self.generation
+        
+        # Work on the whole parent list at once: entries with an older stamp
+        # are their own root, and every entry is then pointed to the parent
+        # of its parent until nothing changes. Union by rank keeps the trees
+        # shallow, so only a few passes are needed.
+        
+        root = [par if st == generation else iii for (iii, par, st) in
+                zip(range(num_entries), self.parent, self.stamp)]
+        
+        while True:
+            new_root = list(map(root.__getitem__, root))
+            
+            if new_root == root:
+                break
+            
+            root = new_root
+            
+        self.parent[:num_entries] = root
+        
+        return root
         
     #-------------------------------------------------------------------------#
 
     def nonIsoList(self):
         
-        self.non_iso_list = []
-
-        for item in range(self.num_entries):
-            if self.root_list[item] == item:
-                self.non_iso_list += [item]
+        self.non_iso_list = [item for (item, root) in enumerate(self.rootList()) if root == item]
 
         return self.non_iso_list
         
@@ -43,115 +92,132 @@ class UnionFind:
                           
     def findRoot(self, index):
         
-        # If the value of the root list at index is equal to index
-        # (index is the root of a multiple item cluster) or num_entries
-        # (index is a single item cluster), return index as the root
-        # of the given cluster
+        parent, stamp, generation = self.parent, self.stamp, self.generation
         
-        if self.root_list[index] == index or self.root_list[index] == self.num_entries:
+        if stamp[index] != generation:
             return index
-
-        # Recursive piece if node is pointing to another node
         
-        self.root_list[index] = self.findRoot(self.root_list[index])
-        return self.root_list[index]
+        # Path halving: point each entry passed to its grandparent. Parents
+        # are always changed in the current generation, so do not need their
+        # stamps checked.
+        
+        while parent[index] != index:
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+            
+        return index
         
     #-------------------------------------------------------------------------#
 
     def Union(self, aaa, bbb):
-    
-        # To ensure that the lowest node number becomes the
-        # root of each tree in the union-find structure, we
-        # enforce aaa < bbb
         
-        if aaa > bbb:
-            aaa, bbb = bbb, aaa
-
+        parent, rank, stamp, generation = self.parent, self.rank, self.stamp, self.generation
+        
         root_aaa = self.findRoot(aaa)
         root_bbb = self.findRoot(bbb)
-
-        if root_aaa == aaa and root_bbb == bbb:
-    
-            # Both aaa and bbb are the roots of clusters;
-            # add bbb to cluster for aaa, since aaa < bbb
+        
+        if root_aaa == root_bbb:
+            return
+        
+        # Entries not yet changed in this generation start as single item
+        # clusters
+        
+        if stamp[root_aaa] != generation:
+            stamp[root_aaa], parent[root_aaa], rank[root_aaa] = generation, root_aaa, 0
             
-            self.root_list[bbb] = aaa
-    
-        elif root_aaa == aaa:
-    
-            # aaa is the root of a cluster, but bbb is not; add
-            # aaa to cluster for root_bbb if root_bbb < aaa,
-            # otherwise, add root_bbb to new cluster for aaa
-    
-            if root_bbb < aaa:
-                self.root_list[aaa] = root_bbb
-            else:
-                self.root_list[root_bbb] = aaa
-    
-        elif root_bbb == bbb:
-    
-            # bbb ifins the root of a cluster, but aaa is not; add
-            # bbb to cluster for root_aaa since
-            # root_aaa <= aaa < bbb
-    
-            self.root_list[bbb] = root_aaa
-    
+        if stamp[root_bbb] != generation:
+            stamp[root_bbb], parent[root_bbb], rank[root_bbb] = generation, root_bbb, 0
+                
+        # Add the cluster with lower rank to the other cluster
+        
+        if rank[root_aaa] < rank[root_bbb]:
+            root_aaa, root_bbb = root_bbb, root_aaa
+            
+        parent[root_bbb] = root_aaa
+        
+        if rank[root_aaa] == rank[root_bbb]:
+            rank[root_aaa] += 1
+            
+    #-------------------------------------------------------------------------#
+
+    def relabel(self, items = None):
+        """
+        Compress every tree, and return a dict giving each item (by default
+        all entries) the label of its cluster, with the clusters numbered
+        0, 1, 2, ... in order of their lowest item.
+        """
+        
+        root = self.rootList()
+        
+        if items is None:
+            items = range(self.num_entries)
+            item_root = root
         else:
-    
-            # Neither aaa, bbb are roots of clusters; make
-            # sure both are in the same cluster with
-            # lowest root value
-    
-            if root_aaa > root_bbb:
-                self.root_list[root_aaa] = root_bbb
-            else:
-                self.root_list[root_bbb] = root_aaa
+            items = sorted(items)
+            item_root = [root[item] for item in items]
+            
+        # The roots in order of their first item give the cluster labels
+        
+        root_label = dict(zip(dict.fromkeys(item_root), range(len(item_root))))
+        
+        return dict(zip(items, map(root_label.__getitem__, item_root)))
         
 #=============================================================================#
 
-def createInducedKnot(graph):
+def inducedCode(circuit, PD_code, nodeDict, dartData = None):
+    """
+    Find the crossings of the knot diagram induced by the Eulerian circuit,
+    given as a list of darts, through the knotted graph with the given PD
+    code, where nodeDict gives the node each dart is incident to. Returns
+    [dartCode, f_list, dartData], where dartCode is the PD code of the
+    induced knot in terms of the darts of the graph, and dartData is the
+    union-find data structure joining the darts on each edge of the induced
+    knot. If dartData is given, it is reset and used in place of a new
+    union-find data structure.
+    """
     
-    # Get required information from graph class object
-    
-    num_node = graph.numNodes()     # Number of nodes in original graph
-    PD_code = graph.listPDCode()    # Planar diagram code for graph
-    circuit = graph.listEPath()     # Final Eulerian circuit through graph
+    num_darts = len(circuit)
     
     # Create union-find data structure for half-edges
     
-    dartData = UnionFind(4 * num_node)
+    if dartData is None:
+        dartData = UnionFind(num_darts)
+    else:
+        dartData.reset(num_darts)
     
     # Create list to write PD code for induced knot diagram
     
-    knotCode = []
+    dartCode = []
     
     # Create f(i) function list, for keeping track of the direction of the
     # overcrossing, as it passes over the undercrossing
     
     f_list = []
     
-    # From given PD code, make a dict, with half-edge labels as keys, and
-    # node labels as values. All half-edges should be incident on a node, so
-    # all will appear as keys in the dictionary.
+    # Position of each dart in circuit, so that the order of the darts can be
+    # found without searching through circuit
     
-    nodeDict = {dart : node for node in range(num_node) for dart in PD_code[node]}
-            
-    # From given PD code make a dict, with node labels as keys, and the PD
-    # code for that node as value
+    position = [0 for dart in range(num_darts)]
     
-    codeDict = {iii : PD_code[iii] for iii in range(num_node)}
+    for (iii, dart) in enumerate(circuit):
+        position[dart] = iii
+        
+    # Keep track of the nodes already dealt with, so that a node is not
+    # included twice
+    
+    node_done = [False for node in PD_code]
             
     # Read through given PD code. If two darts have labels differing by one,
     # then either they make up the same edge, or else they are opposite sides
     # of a node. If not, then they pass through an node, making a turn at the
     # node, so the node must not be included in the final list.
     
-    for iii in range(4 * num_node):
+    for iii in range(num_darts):
         current_dart = circuit[iii]
-        next_dart = circuit[(iii + 1) % (4 * num_node)]
+        next_dart = circuit[(iii + 1) % num_darts]
         
         if (abs(current_dart - next_dart) == 1 or                                 \
-            abs(current_dart - next_dart) == (4 * num_node - 1)):
+            abs(current_dart - next_dart) == (num_darts - 1)):
             
             if nodeDict[current_dart] != nodeDict[next_dart]:
                 
@@ -159,7 +225,7 @@ def createInducedKnot(graph):
                 
                 dartData.Union(current_dart, next_dart)
                 
-            elif nodeDict[current_dart] in codeDict.keys():
+            elif not node_done[nodeDict[current_dart]]:
                 
                 # This is a node that has not been dealt with yet in circuit
                 
@@ -173,25 +239,25 @@ def createInducedKnot(graph):
                 # can change the ordering of a portion of the sequence, but
                 # not a global change in orientation.
                 
-                [iii, jjj, kkk, lll] = PD_code[current_node]
+                [aaa, bbb, ccc, ddd] = PD_code[current_node]
                 
                 # We check to see if the ordering of half-edges in the list
                 # circuit has changed the orientation of the edges at the
                 # crossing. We first find the order of the undercrossing edge
-                # by finding the indices of iii, kkk in circuit. We assume that
+                # from the positions of aaa, ccc in circuit. We assume that
                 # for this crossing, the half-edge labels on the same edge
                 # differ by 1, so either the difference is \pm 1, or \pm (N - 1)
                 # if the half-edge labels are at the extreme ends of the list
                 # circuit.
                 
-                under_index = circuit.index(kkk) - circuit.index(iii)
+                under_index = position[ccc] - position[aaa]
                 
-                if under_index == 1 or under_index == -(4 * num_node - 1):
-                    temp_PD_code = [iii, jjj, kkk, lll]
-                elif under_index == -1 or under_index == (4 * num_node - 1):
-                    temp_PD_code = [kkk, lll, iii, jjj]
+                if under_index == 1 or under_index == -(num_darts - 1):
+                    temp_PD_code = [aaa, bbb, ccc, ddd]
+                elif under_index == -1 or under_index == (num_darts - 1):
+                    temp_PD_code = [ccc, ddd, aaa, bbb]
                     
-                knotCode += [temp_PD_code]
+                dartCode += [temp_PD_code]
                 
                 # For overcrossing, see which way the sequence passes, and
                 # update f(i) for crossing i accordingly. To do this, see what
@@ -206,21 +272,18 @@ def createInducedKnot(graph):
                 # (c - a)(d - b), to see what the sense is of the induced knot
                 # crossing versus the one in the original graph.
                 
-                dirProd = under_index * (circuit.index(lll) - circuit.index(jjj))
+                dirProd = under_index * (position[ddd] - position[bbb])
                 
-                if dirProd == 1 or dirProd == (1 - 4 * num_node):
+                if dirProd == 1 or dirProd == (1 - num_darts):
                     f_list += [1]
                 else:
                     f_list += [-1]
                 
                 # Combine half-edges on overcrossing
                 
-                dartData.Union(codeDict[current_node][1], codeDict[current_node][3])
-                
-                # To ensure that a node is not included twice, remove node
-                # from codeDict
+                dartData.Union(bbb, ddd)
                 
-                del codeDict[current_node]
+                node_done[current_node] = True
                 
         else:
             
@@ -229,20 +292,143 @@ def createInducedKnot(graph):
             
             dartData.Union(current_dart, next_dart)
             
-    # Using union-find data structure, switching from half-edges to edges, so
-    # that each edge has its own distinct label
+    return [dartCode, f_list, dartData]
+
+#-----------------------------------------------------------------------------#
+
+def edgeLabels(dartData):
+    """
+    Using the union-find data structure from inducedCode(), switching from
+    half-edges to edges, find the label of the edge of each dart, so that
+    each edge has its own distinct label. Edges are numbered in order of the
+    lowest dart on each edge.
+    """
+    
+    return list(dartData.relabel().values())
+
+#-----------------------------------------------------------------------------#
+
+def createInducedKnot(graph, darts = False):
+    """
+    Find the PD code and f(i) function list for the knot diagram induced by
+    the Eulerian circuit of graph. If darts is True, the crossings are instead
+    given by the labels of their darts in the graph, and the function returns
+    [e_path, PD_code, f_list], with e_path = [circuit], in the form used by
+    LPoly() and simplifyDiagram().
+    """
     
-    for iii in range(4 * num_node):
-        dartData.findRoot(iii)
+    # Get required information from graph class object
     
-    rootList = list(set(dartData.rootList()))
-    rootList.sort()
+    num_node = graph.numNodes()     # Number of nodes in original graph
+    PD_code = graph.listPDCode()    # Planar diagram code for graph
+    circuit = graph.listEPath()     # Final Eulerian circuit through graph
+    
+    # From given PD code, make a dict, with half-edge labels as keys, and
+    # node labels as values. All half-edges should be incident on a node, so
+    # all will appear as keys in the dictionary.
+    
+    nodeDict = {dart : node for node in range(num_node) for dart in PD_code[node]}
+    
+    [dartCode, f_list, dartData] = inducedCode(circuit, PD_code, nodeDict)
+            
+    if darts:
+        return [[list(circuit)], dartCode, f_list]
     
-    for iii in range(len(knotCode)):
-        knotCode[iii] = [rootList.index(dartData.findRoot(knotCode[iii][jjj])) for jjj in range(4)]
+    edge_label = edgeLabels(dartData)
+    knotCode = [[edge_label[dart] for dart in code] for code in dartCode]
                 
     # Return results
     
     return [knotCode, f_list]
+
+#-----------------------------------------------------------------------------#
+
+def createInducedKnots(graphList):
+    """
+    Find the PD codes and f(i) function lists for the knot diagrams induced
+    by the Eulerian circuits of a list of graphs, all for the same knotted
+    graph (such as the list from createCircuits()), sharing the work that
+    only depends on the graph. Returns [knot_array, f_array, num_cross] as
+    NumPy arrays, where num_cross[iii] is the number of crossings of the knot
+    diagram for graphList[iii], knot_array[iii, :num_cross[iii]] is its PD
+    code, and f_array[iii, :num_cross[iii]] its f(i) function list, as from
+    createInducedKnot(). The remaining entries of knot_array are -1, and
+    those of f_array are 0.
+    
+    NumPy is only needed when this function is used.
+    """
+    
+    import numpy as np
+    
+    num_graph = len(graphList)
+    num_node = graphList[0].numNodes() if num_graph > 0 else 0
+    
+    knot_array = np.full((num_graph, num_node, 4), -1, dtype = np.int32)
+    f_array = np.zeros((num_graph, num_node), dtype = np.int8)
+    num_cross = np.zeros(num_graph, dtype = np.int32)
+    
+    if num_graph == 0:
+        return [knot_array, f_array, num_cross]
+    
+    # The PD code of each graph only differs by reversing the order of the
+    # darts at some nodes, which does not change the induced knot, so the
+    # PD code of the first graph is used for all of them
+    
+    PD_code = [list(node) for node in graphList[0].listPDCode()]
+    nodeDict = {dart : node for node in range(num_node) for dart in PD_code[node]}
+    num_darts = 4 * num_node
+    dartData = UnionFind(num_darts)
+    
+    # The parent list, stamps and crossings in terms of darts are kept for
+    # every circuit, so that the edges can be labelled for all of them at
+    # once, in the same way as UnionFind.relabel()
+    
+    parent_array = np.empty((num_graph, num_darts), dtype = np.int32)
+    stamp_array = np.empty((num_graph, num_darts), dtype = np.int32)
+    generation = np.empty((num_graph, 1), dtype = np.int32)
+    dart_array = np.zeros((num_graph, num_node, 4), dtype = np.int32)
+    
+    for (iii, graph) in enumerate(graphList):
+        [dartCode, f_list, dartData] = inducedCode(graph.listEPath(), PD_code, nodeDict, dartData)
+        
+        num_cross[iii] = len(dartCode)
+        parent_array[iii] = dartData.parent[:num_darts]
+        stamp_array[iii] = dartData.stamp[:num_darts]
+        generation[iii] = dartData.generation
+        
+        if len(dartCode) > 0:
+            dart_array[iii, :len(dartCode)] = dartCode
+            f_array[iii, :len(dartCode)] = f_list
+            
+    # Entries not changed for a circuit are their own root, and every entry
+    # is pointed to the parent of its parent until nothing changes
+    
+    dart_range = np.arange(num_darts, dtype = np.int32)
+    root = np.where(stamp_array == generation, parent_array, dart_range)
+    
+    while True:
+        new_root = np.take_along_axis(root, root, axis = 1)
+        
+        if np.array_equal(new_root, root):
+            break
+        
+        root = new_root
+        
+    # Find the lowest dart on each edge; edges are numbered in order of
+    # their lowest dart, as in edgeLabels()
+    
+    graph_range = np.arange(num_graph)[:, None]
+    lowest = np.full((num_graph, num_darts), num_darts, dtype = np.int32)
+    np.minimum.at(lowest, (graph_range, root), dart_range)
+    
+    lowest = lowest[graph_range, root]
+    edge_label = np.cumsum(lowest == dart_range, axis = 1) - 1
+    edge_label = np.take_along_axis(edge_label, lowest, axis = 1).astype(np.int32)
+    
+    knot_array = np.take_along_axis(edge_label, dart_array.reshape(num_graph, -1), axis = 1)
+    knot_array = knot_array.reshape(num_graph, num_node, 4)
+    knot_array[np.arange(num_node) >= num_cross[:, None]] = -1
+        
+    return [knot_array, f_array, num_cross]
         
 #=============================================================================#
\ No newline at end of file
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""
+These functions choose the order in which the crossings of a link diagram are
+split when finding its states. The diagram is given by the list link from
+pairDarts(), so that the darts of crossing iii are the slots 4 * iii + jjj.
+The work done by the planar algebra engine in planarBracket() grows with the
+frontier width of the order, the largest number of darts joining the crossings
+already split to those which are not; the other engines process the crossings
+in the same order, so the order can be compared across them.
+"""
+
+from collections import deque
+
+#=============================================================================#
+
+def frontierWidth(link, order):
+    """
+    Find the largest number of boundary darts found when the crossings are
+    added one at a time to a region of the diagram, in the given order, which
+    must have each crossing exactly once.
+    """
+
+    if sorted(order) != list(range(len(link) // 4)):
+        raise ValueError('Crossing order is not a permutation of the crossings: ' + str(order))
+
+    added = [False for iii in range(len(link) // 4)]
+    width, boundary = 0, 0
+
+    for cross in order:
+        added[cross] = True
+
+        # Each dart of the new crossing either joins the region, removing a
+        # boundary dart, or leaves it, adding a boundary dart; darts joined
+        # to the crossing itself do neither
+
+        for slot in range(4 * cross, 4 * cross + 4):
+            if link[slot] // 4 == cross:
+                continue
+            elif added[link[slot] // 4]:
+                boundary -= 1
+            else:
+                boundary += 1
+
+        width = max(width, boundary)
+
+    return width
+
+#-----------------------------------------------------------------------------#
+
+def crossingOrder(link, method = 'greedy'):
+    """
+    Find an order for the crossings of the diagram given by link, using one of
+    the following methods:
+
+        'reverse' : the crossings in reverse order of the PD code, which is
+                    the order used by the state tree in LPoly()
+        'circuit' : the order the crossings are first reached, travelling
+                    along each component of the link in turn
+        'bfs'     : breadth-first search from the first crossing, where two
+                    crossings are neighbors if they have darts joined together
+        'greedy'  : at each step, add the crossing giving the smallest number
+                    of boundary darts for the new region
+        'loops'   : at each step, add the crossing with the most darts joined
+                    to the region, so that unknots are closed off early
+
+    The order is returned as a list of crossing indices. Ties are always broken
+    using the lowest crossing index.
+    """
+
+    num_cross = len(link) // 4
+    added = [False for iii in range(num_cross)]
+    order = []
+
+    #-------------------------------------------------------------------------#
+
+    if method == 'reverse':
+        order = [cross for cross in range(num_cross - 1, -1, -1)]
+
+    #-------------------------------------------------------------------------#
+
+    elif method == 'circuit':
+
+        # Travel through the crossing from a dart to the opposite dart, then
+        # along the link to the next crossing
+
+        visited = [False for iii in range(4 * num_cross)]
+
+        for start in range(4 * num_cross):
+            slot = start
+
+            while not visited[slot]:
+                if not added[slot // 4]:
+                    added[slot // 4] = True
+                    order += [slot // 4]
+
+                other = 4 * (slot // 4) + (slot + 2) % 4
+                visited[slot], visited[other] = True, True
+                slot = link[other]
+
+    #-------------------------------------------------------------------------#
+
+    elif method == 'bfs':
+        for start in range(num_cross):
+            if added[start]:
+                continue
+
+            added[start] = True
+            crossQueue = deque([start])
+
+            while len(crossQueue) > 0:
+                cross = crossQueue.popleft()
+                order += [cross]
+
+                for slot in range(4 * cross, 4 * cross + 4):
+                    if not added[link[slot] // 4]:
+                        added[link[slot] // 4] = True
+                        crossQueue.append(link[slot] // 4)
+
+    #-------------------------------------------------------------------------#
+
+    elif method in ['greedy', 'loops']:
+        for step in range(num_cross):
+            best, best_score = -1, None
+
+            for cross in range(num_cross):
+                if added[cross]:
+                    continue
+
+                joins = len([slot for slot in range(4 * cross, 4 * cross + 4)
+                             if link[slot] // 4 != cross and added[link[slot] // 4]])
+                leaves = len([slot for slot in range(4 * cross, 4 * cross + 4)
+                              if link[slot] // 4 != cross and not added[link[slot] // 4]])
+
+                # Smallest change in the number of boundary darts, or
+                # the most joins to the region
+
+                if method == 'greedy':
+                    score = (leaves - joins, -joins)
+                else:
+                    score = (-joins, leaves)
+
+                if best_score is None or score < best_score:
+                    best, best_score = cross, score
+
+            added[best] = True
+            order += [best]
+
+    #-------------------------------------------------------------------------#
+
+    else:
+        raise ValueError('Unknown crossing order method: ' + str(method))
+
+    # Return results
+
+    return order
+
+#=============================================================================#
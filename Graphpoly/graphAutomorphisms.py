@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""
+This program finds the symmetries of a knotted 4-valent graph, given by its
+PD code and node types in the same form as for createCircuits(). Each
+symmetry is given as a permutation of the darts of the graph, taking nodes to
+nodes and edges to edges. At each node, the darts are either rotated, keeping
+the lower strand (positions 0 and 2 of the PD code) as the lower strand, or
+reflected, taking the lower strand to the upper strand (positions 1 and 3).
+The second kind comes from turning the graph over, which reverses the
+counter-clockwise order of the darts and switches all crossings, and so
+either all nodes are rotated, or all nodes are reflected. Crossings are taken
+to crossings, and vertices to vertices.
+
+Since the graph is connected, a symmetry is fixed by the image of a single
+dart and the kind of map at its node, so the symmetries are found by trying
+each choice for dart 0, and following the edges of the graph out from it.
+"""
+
+#=============================================================================#
+
+def graphAutomorphisms(PD_list, type_list):
+    """
+    Return the list of symmetries of the knotted graph, each given as a list
+    perm with perm[dart] the image of the dart. The first symmetry is always
+    the identity.
+    """
+
+    num_node = len(PD_list)
+    num_darts = 4 * num_node
+
+    # Find the node and position in the PD code of each dart, and the dart
+    # on the other end of its edge, as in createCircuits()
+
+    dart_node = [-1 for dart in range(num_darts)]
+    dart_pos = [-1 for dart in range(num_darts)]
+    dart_match = [-1 for dart in range(num_darts)]
+
+    for (node, dart_list) in enumerate(PD_list):
+        outgoing_list = [2, 3] if type_list[node] > 0 else [1, 2]
+
+        for (loc, dart) in enumerate(dart_list):
+            dart_node[dart] = node
+            dart_pos[dart] = loc
+
+            if loc in outgoing_list:
+                dart_match[dart] = (dart + 1) % num_darts
+            else:
+                dart_match[dart] = (dart - 1) % num_darts
+
+    #-------------------------------------------------------------------------#
+
+    # Each node is mapped by loc -> (sign * loc + shift) % 4, where sign = 1
+    # for a rotation, with shift in [0, 2], and sign = -1 for a reflection,
+    # with shift in [1, 3]
+
+    perm_list = []
+
+    for sign in [1, -1]:
+        for image in range(num_darts):
+
+            if abs(type_list[dart_node[image]]) != abs(type_list[dart_node[0]]):
+                continue
+
+            shift = (dart_pos[image] - sign * dart_pos[0]) % 4
+
+            if shift % 2 != (0 if sign == 1 else 1):
+                continue
+
+            # Follow the edges of the graph out from dart 0, mapping each node
+            # reached; node_image gives the image of each node, or -1 if the
+            # node has not been reached yet
+
+            perm = [-1 for dart in range(num_darts)]
+            node_image = [-1 for node in range(num_node)]
+            node_used = [False for node in range(num_node)]
+
+            nodeStack = [(dart_node[0], dart_node[image], shift)]
+            valid = True
+
+            while len(nodeStack) > 0 and valid:
+                (node, new_node, shift) = nodeStack.pop()
+
+                if node_image[node] != -1:
+                    continue
+
+                if node_used[new_node] or abs(type_list[node]) != abs(type_list[new_node]) or \
+                   shift % 2 != (0 if sign == 1 else 1):
+                    valid = False
+                    break
+
+                node_image[node] = new_node
+                node_used[new_node] = True
+
+                for (loc, dart) in enumerate(PD_list[node]):
+                    perm[dart] = PD_list[new_node][(sign * loc + shift) % 4]
+
+                # The edge from each dart is taken to the edge from its image
+
+                for dart in PD_list[node]:
+                    other, new_other = dart_match[dart], dart_match[perm[dart]]
+
+                    if perm[other] == -1:
+                        next_shift = (dart_pos[new_other] - sign * dart_pos[other]) % 4
+                        nodeStack += [(dart_node[other], dart_node[new_other], next_shift)]
+                    elif perm[other] != new_other:
+                        valid = False
+                        break
+
+            # The stack holds each node as many times as it is reached, so
+            # check that the darts were mapped the same way each time
+
+            if valid and -1 not in perm:
+                valid = all(perm[dart_match[dart]] == dart_match[perm[dart]]
+                            for dart in range(num_darts))
+
+            if valid and -1 not in perm:
+                perm_list += [perm]
+
+    # Put the identity first
+
+    identity = [dart for dart in range(num_darts)]
+
+    if identity in perm_list:
+        perm_list.remove(identity)
+
+    return [identity] + perm_list
+
+#=============================================================================#
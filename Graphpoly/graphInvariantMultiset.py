@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+"""
+This program finds the multiset of knot invariants of the diagrams induced by
+the Eulerian circuits of a knotted 4-valent graph, given by its DT sequence.
+The steps done one after another in the notebooks (isRealizable(),
+planarDiagram(), createCircuits(), createInducedKnot(), then LPoly() or
+counting quandle colorings) are run together, one circuit at a time: each
+circuit from transitionCircuits() is a plain list of darts, and its induced
+knot is found with inducedCode(), reusing the same union-find data structure,
+so that no Graph objects or lists of circuits are kept. Only the multiset
+{invariant : count} is built up.
+
+The counts are those for the list of graphs from createCircuits(), where each
+circuit appears twice, once in each direction. Circuits taken to each other by
+a symmetry of the graph (see graphAutomorphisms) have the same induced knot,
+so only one circuit from each orbit is used, counted once for each circuit in
+its orbit.
+"""
+
+from Graphpoly.createInducedKnot import edgeLabels, inducedCode, UnionFind
+from Graphpoly.graphAutomorphisms import graphAutomorphisms
+from Graphpoly.InvariantCache import pdKey
+from Graphpoly.isRealizable import isRealizable
+from Graphpoly.LaurentPoly import LaurentPoly
+from Graphpoly.LPoly import LPoly
+from Graphpoly.LRUCache import LRUCache
+from Graphpoly.planarDiagram import planarDiagram
+from Graphpoly.simplifyDiagram import arcCode, simplifyDiagram
+from Graphpoly.transitionCircuits import transitionCircuits
+from Graphpoly.twoVarPoly import twoVarPoly
+
+#=============================================================================#
+
+def quandleColorings(knotCode, f_list, quandle):
+    """
+    Count the colorings of the knot diagram with PD code knotCode (in terms
+    of its edges) and f(i) function list f_list, as from createInducedKnot(),
+    by the quandle with multiplication table quandle, given as a list of
+    lists with quandle[x][y] the product of x and y. A knot with no crossings
+    has one edge, so has as many colorings as there are elements in the
+    quandle.
+    """
+
+    num_elements = len(quandle)
+
+    if len(knotCode) == 0:
+        return num_elements
+
+    num_edges = max(max(crossing) for crossing in knotCode) + 1
+
+    # Each crossing can be checked once all of its edges have a color, so
+    # list the crossings to check after coloring each edge
+
+    check_list = [[] for edge in range(num_edges)]
+
+    for (crossing, f) in zip(knotCode, f_list):
+        check_list[max(crossing)] += [(crossing, f)]
+
+    #-------------------------------------------------------------------------#
+
+    # Color the edges in order, going back as soon as a crossing fails. If
+    # the overcrossing is right-to-left (f = 1), the color of the entering
+    # undercrossing edge is the product of the colors of the leaving
+    # undercrossing edge and the overcrossing; otherwise, the color of the
+    # leaving undercrossing edge is the product of the colors of the entering
+    # undercrossing edge and the overcrossing.
+
+    color_list = [0 for edge in range(num_edges)]
+    colorStack = [(0, color) for color in range(num_elements)]
+    num_colorings = 0
+
+    while len(colorStack) > 0:
+        (edge, color) = colorStack.pop()
+        color_list[edge] = color
+
+        valid = True
+
+        for ([aaa, bbb, ccc, ddd], f) in check_list[edge]:
+            if color_list[bbb] != color_list[ddd]:
+                valid = False
+            elif f == 1:
+                valid = quandle[color_list[ccc]][color_list[bbb]] == color_list[aaa]
+            else:
+                valid = quandle[color_list[aaa]][color_list[bbb]] == color_list[ccc]
+
+            if not valid:
+                break
+
+        if not valid:
+            continue
+
+        if edge == num_edges - 1:
+            num_colorings += 1
+        else:
+            colorStack += [(edge + 1, color) for color in range(num_elements)]
+
+    return num_colorings
+
+#-----------------------------------------------------------------------------#
+
+def graphInvariantMultiset(DT_seq, invariant = 'jones', quandle = None, engine = 'state', \
+                           orbits = True, cache = None):
+    """
+    Given the DT sequence of a knotted 4-valent graph, with crossing or
+    vertex type information, in the form used by isRealizable(), find the
+    multiset of invariants of the knot diagrams induced by the Eulerian
+    circuits through the graph. The multiset is returned as a dictionary
+    {invariant : count}.
+
+    The parameter invariant chooses the invariant found:
+
+        'bracket'  : the Kauffman bracket, as a LaurentPoly in A
+        'jones'    : the Kauffman bracket multiplied by (-A^3)^-w, for w the
+                     writhe of the diagram, as a LaurentPoly in A (default)
+        'quandle'  : the number of colorings of the diagram by the quandle
+                     with multiplication table quandle (see quandleColorings)
+        'twovar'   : the 2-variable graph polynomial of the circuit, as a
+                     LaurentPoly in c, s and A (see twoVarPoly), with one
+                     memo table shared between all circuits
+
+    The bracket is found by LPoly() with the given engine, and the number of
+    colorings by quandleColorings(), after removing kinks and bigons from the
+    diagram. If orbits is False, every circuit is used, instead of one from
+    each orbit under the symmetries of the graph.
+
+    If cache is an InvariantCache, the bracket (with the writhe) or number
+    of colorings of each induced knot diagram is looked up there by its PD
+    code, and only found if it has not been stored before. The 2-variable
+    polynomial is not cached, since it depends on the vertices of the graph.
+    """
+
+    if invariant not in ['bracket', 'jones', 'quandle', 'twovar']:
+        raise ValueError('Unknown invariant for graphInvariantMultiset: ' + str(invariant))
+
+    if invariant == 'quandle' and quandle is None:
+        raise ValueError('A quandle must be given to count quandle colorings')
+
+    orientList = isRealizable(DT_seq, f_list = True)
+
+    if orientList is False:
+        raise ValueError('DT sequence is not realizable: ' + str(DT_seq))
+
+    [PD_code, type_list] = planarDiagram(DT_seq, orientList)
+
+    num_node = len(PD_code)
+    nodeDict = {dart : node for node in range(num_node) for dart in PD_code[node]}
+    dartData = UnionFind(4 * num_node)
+
+    memo = LRUCache(2 ** 16)
+
+    # Only the first circuit of each orbit under the symmetries of the graph
+    # is found, with the number of circuits in its orbit
+
+    if orbits:
+        circuitList = transitionCircuits(PD_code, type_list, graphAutomorphisms(PD_code, type_list))
+    else:
+        circuitList = ([circuit, 1] for circuit in transitionCircuits(PD_code, type_list))
+
+    #-------------------------------------------------------------------------#
+
+    multiset = {}
+
+    for [circuit, multiplicity] in circuitList:
+
+        # The 2-variable polynomial uses the vertices of the graph, with the
+        # PD code of each node turned to match the circuit, as in order()
+
+        if invariant == 'twovar':
+            position = {dart : iii for (iii, dart) in enumerate(circuit)}
+            circuit_PD_code = [node if circuit[(position[node[0]] + 1) % len(circuit)] in node[1:]
+                               else [node[2], node[3], node[0], node[1]] for node in PD_code]
+
+            value = twoVarPoly([circuit], circuit_PD_code, type_list, memo, engine = engine)
+            multiset[value] = multiset.get(value, 0) + 2 * multiplicity
+            continue
+
+        # The bracket and Jones polynomial do not depend on the direction of
+        # the knot, but the number of quandle colorings might, so the
+        # reversed circuit is dealt with separately
+
+        if invariant == 'quandle':
+            direction_list = [circuit, [circuit[0]] + circuit[:0:-1]]
+        else:
+            direction_list = [circuit]
+
+        for direction in direction_list:
+            [dartCode, f_list, dartData] = inducedCode(direction, PD_code, nodeDict, dartData)
+
+            # Kinks and bigons do not change the number of quandle colorings,
+            # so they are taken out before the colorings are counted
+
+            if invariant == 'quandle':
+                [e_path, knot_PD_code, f_list, twist] = simplifyDiagram([direction], dartCode, f_list)
+                knotCode = arcCode(e_path, knot_PD_code)
+            elif cache is not None:
+                edge_label = edgeLabels(dartData)
+                knotCode = [[edge_label[dart] for dart in crossing] for crossing in dartCode]
+
+            # The writhe and bracket are stored together, so that the cache
+            # can be used for both the bracket and the Jones polynomial
+
+            if invariant == 'quandle':
+                name = 'quandle ' + repr(quandle)
+                compute = lambda : quandleColorings(knotCode, f_list, quandle)
+            else:
+                name = 'bracket'
+                compute = lambda : LPoly([direction], dartCode, aggregate = True, \
+                                         engine = engine, simplify = True)
+
+            if cache is None:
+                value = compute()
+            else:
+                key = pdKey(knotCode, f_list, reverse = invariant != 'quandle')
+                value = cache.lookup(name, key, compute)
+
+            if invariant != 'quandle':
+                [writhe, bracket] = value
+                value = LaurentPoly(bracket)
+
+                if invariant == 'jones':
+                    value = value.shift(-3 * writhe) * (-1 if writhe % 2 else 1)
+
+            count = multiplicity * (2 // len(direction_list))
+            multiset[value] = multiset.get(value, 0) + count
+
+    return multiset
+
+#=============================================================================#
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""
+This program finds the states of a link diagram by going through all 2^N
+states in Gray code order, so that each state differs from the one before by
+the split at a single crossing. Instead of building the e_path for each state,
+the unknots of the current state are kept as labels on the darts, using the
+list link from pairDarts() together with how each crossing is split. When the
+split of a crossing is changed, the two strands through the crossing are
+either on different unknots, which are merged into one, or on the same
+unknot, which is split in two, or (for a diagram which is not planar) stays a
+single unknot. Only the darts of the smaller of the unknots involved are
+relabeled, so no lists are copied as the states are gone through.
+"""
+
+#=============================================================================#
+
+def grayBracket(link, free_loops):
+    """
+    Given the list link and number of free unknots from pairDarts(), find the
+    states of the link, changing the split of one crossing at a time. The
+    states are returned as a dictionary, with keys (A, B, N), and values the
+    number of states with these values.
+    """
+
+    num_cross = len(link) // 4
+    num_darts = 4 * num_cross
+
+    # Start with every crossing split with a factor of A, which joins d0 to
+    # d1 and d2 to d3; split gives the dart joined to each dart by the splits
+
+    split = [dart ^ 1 for dart in range(num_darts)]
+
+    # Label the darts on each unknot, going from a dart to the dart it is
+    # joined to by the split of its crossing, then along the link to the next
+    # crossing. The number of darts with each label is kept in size, and
+    # labels no longer in use are kept in free_labels.
+
+    label = [-1 for dart in range(num_darts)]
+    size = []
+    free_labels = []
+
+    for start in range(num_darts):
+        if label[start] < 0:
+            size += [0]
+            dart = start
+
+            while label[dart] < 0:
+                label[dart], label[split[dart]] = len(size) - 1, len(size) - 1
+                size[-1] += 2
+                dart = link[split[dart]]
+
+    loops = len(size)
+    A = num_cross
+
+    stateDict = {(A, loops) : 1}
+
+    #-------------------------------------------------------------------------#
+
+    # Go through the rest of the states, where step k changes the split of
+    # the crossing given by the lowest bit set in k
+
+    for step in range(1, 2 ** num_cross):
+        base = 4 * ((step & -step).bit_length() - 1)
+
+        if split[base] == base + 1:
+            new_pairs = [(base, base + 3), (base + 1, base + 2)]
+            A -= 1
+        else:
+            new_pairs = [(base, base + 1), (base + 2, base + 3)]
+            A += 1
+
+        label_1, label_2 = label[base], label[base + 2]
+
+        if label_1 != label_2:
+
+            # The strands are on different unknots; relabel the smaller one
+            # before the split is changed, so that it can be followed
+
+            if size[label_1] < size[label_2]:
+                small, big, dart = label_1, label_2, base
+            else:
+                small, big, dart = label_2, label_1, base + 2
+
+            while label[dart] == small:
+                label[dart], label[split[dart]] = big, big
+                dart = link[split[dart]]
+
+            size[big] += size[small]
+            free_labels += [small]
+            loops -= 1
+
+            for (slot_1, slot_2) in new_pairs:
+                split[slot_1], split[slot_2] = slot_2, slot_1
+
+        else:
+            for (slot_1, slot_2) in new_pairs:
+                split[slot_1], split[slot_2] = slot_2, slot_1
+
+            # The strands are on the same unknot; follow the new unknots from
+            # both strands of the crossing at the same time, until one closes
+            # up, or one reaches the other strand
+
+            dart_1, dart_2 = base, base + 2
+            other_1, other_2 = split[base + 2], split[base]
+            start = -1
+
+            while start < 0:
+                dart_1 = link[split[dart_1]]
+
+                if dart_1 == base:
+                    start = base
+                elif dart_1 == base + 2 or dart_1 == other_1:
+                    break
+
+                dart_2 = link[split[dart_2]]
+
+                if dart_2 == base + 2:
+                    start = base + 2
+                elif dart_2 == base or dart_2 == other_2:
+                    break
+
+            # If an unknot closed up first, give its darts a new label
+
+            if start >= 0:
+                if len(free_labels) > 0:
+                    new_label = free_labels.pop()
+                    size[new_label] = 0
+                else:
+                    new_label = len(size)
+                    size += [0]
+
+                dart = start
+
+                while label[dart] != new_label:
+                    label[dart], label[split[dart]] = new_label, new_label
+                    size[new_label] += 2
+                    dart = link[split[dart]]
+
+                size[label_1] -= size[new_label]
+                loops += 1
+
+        stateDict[(A, loops)] = stateDict.get((A, loops), 0) + 1
+
+    # Return results
+
+    return {(num_A, num_cross - num_A, num_N + free_loops) : num
+            for ((num_A, num_N), num) in stateDict.items()}
+
+#=============================================================================#
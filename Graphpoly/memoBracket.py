@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""
+This program finds the states of a link diagram in the same way as LPoly(),
+by splitting the crossings one at a time, starting from the last crossing in
+the PD code. However, each partially split diagram is first put into a
+canonical form, and the states found for it are stored in a memo table. When
+two different sets of splits lead to the same diagram, the states for the
+remaining crossings are only found once.
+
+The canonical form of a partially split diagram with M crossings left is the
+list link from pairDarts(), restricted to the slots 0, ..., 4M - 1 of the
+remaining crossings. This does not depend on the dart labels, and completely
+determines the states of the remaining diagram, apart from unknots which no
+longer pass through any crossing. These are counted separately as the splits
+are made, and are not part of the memo table entries.
+"""
+
+from Graphpoly.LRUCache import LRUCache
+
+#=============================================================================#
+
+def splitCrossing(link, pair_list):
+    """
+    Split the last crossing in the list link, joining the pairs of its darts
+    given in pair_list. Returns the list link for the remaining crossings,
+    along with the number of unknots formed which no longer pass through any
+    crossing.
+    """
+
+    base = len(link) - 4
+    mate = {}
+
+    for (slot_1, slot_2) in pair_list:
+        mate[slot_1], mate[slot_2] = slot_2, slot_1
+
+    # Follow each dart joined to the split crossing through the crossing,
+    # until the path returns to one of the remaining crossings
+
+    new_link = [slot for slot in link[:base]]
+    visited = {slot : False for slot in mate}
+
+    for slot in range(base):
+        other = link[slot]
+
+        while other >= base:
+            visited[other] = True
+            visited[mate[other]] = True
+            other = link[mate[other]]
+
+        new_link[slot] = other
+
+    # Any darts of the split crossing not yet visited must lie on unknots
+    # which only pass through the split crossing
+
+    loops = 0
+
+    for slot in mate:
+        if not visited[slot]:
+            loops += 1
+            other = slot
+
+            while not visited[other]:
+                visited[other] = True
+                visited[mate[other]] = True
+                other = link[mate[other]]
+
+    # Return results
+
+    return [new_link, loops]
+
+#-----------------------------------------------------------------------------#
+
+def stateCounts(link, memo):
+    """
+    Recursively find the states of the diagram with the given list link. The
+    states are returned as a dictionary, with keys (A, B, N), and values the
+    number of states with these values. N only counts unknots formed by the
+    splits of the crossings in link.
+    """
+
+    if len(link) == 0:
+        return {(0, 0, 0) : 1}
+
+    key = tuple(link)
+    state_dict = memo.get(key)
+
+    if state_dict is not None:
+        return state_dict
+
+    # Split the last crossing in both possible ways; A joins d0 to d1 and d2
+    # to d3, while A^-1 joins d0 to d3 and d1 to d2
+
+    base = len(link) - 4
+    state_dict = {}
+
+    for (pair_list, (A, B)) in [([(base, base + 1), (base + 2, base + 3)], (1, 0)), \
+                                ([(base, base + 3), (base + 1, base + 2)], (0, 1))]:
+        [new_link, loops] = splitCrossing(link, pair_list)
+
+        for ((sub_A, sub_B, sub_N), num) in stateCounts(new_link, memo).items():
+            state = (sub_A + A, sub_B + B, sub_N + loops)
+            state_dict[state] = state_dict.get(state, 0) + num
+
+    memo.put(key, state_dict)
+
+    return state_dict
+
+#=============================================================================#
+
+def memoBracket(link, free_loops, memo_size):
+    """
+    Given the list link and number of free unknots from pairDarts(), find the
+    states of the link, using a memo table holding at most memo_size
+    partially split diagrams. The states are returned as a dictionary, with
+    keys (A, B, N), and values the number of states with these values.
+    """
+
+    memo = LRUCache(memo_size)
+
+    return {(A, B, N + free_loops) : num for ((A, B, N), num) in stateCounts(link, memo).items()}
+
+#=============================================================================#
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+def pairDarts(e_path, PD_code):
+    """
+    Given an e_path for a link, possibly made of several components, and the
+    PD code for the crossings of the link, find how the darts of the crossings
+    are joined together by the link, away from the crossings themselves.
+    
+    Each dart is referred to by its slot 4 * iii + jjj, where iii is the index
+    of the crossing in PD_code, and jjj is the location of the dart in the PD
+    code for that crossing. The function returns a list link, where link[slot]
+    is the slot of the dart joined to the given one, along with the number of
+    components in e_path which do not pass through any crossing.
+    
+    Darts in e_path which do not belong to any crossing (for example, those
+    of vertices removed from a graph) are skipped over. Two darts on opposite
+    sides of a crossing, and next to each other in e_path, are the path of the
+    link through the crossing, and are not joined in link. If a component
+    consists of only these two darts, the second pairing between them is the
+    part of the link leaving the crossing and returning to it, so they are
+    joined in link.
+    """
+    
+    # Definitions
+    
+    slot_dict = {dart : 4 * iii + jjj for (iii, crossing) in enumerate(PD_code)
+                 for (jjj, dart) in enumerate(crossing)}
+    
+    link = [-1 for iii in range(4 * len(PD_code))]
+    passed = [False for iii in range(4 * len(PD_code))]
+    free_loops = 0
+    
+    # Go through each component of e_path, and find the darts in it that are
+    # incident to a crossing
+    
+    for segment in e_path:
+        len_segment = len(segment)
+        loc_list = [iii for iii in range(len_segment) if segment[iii] in slot_dict]
+        
+        if len(loc_list) == 0:
+            free_loops += 1
+            continue
+        
+        # Go through consecutive pairs of crossing darts in the segment
+        
+        for iii in range(len(loc_list)):
+            loc_1, loc_2 = loc_list[iii], loc_list[(iii + 1) % len(loc_list)]
+            slot_1, slot_2 = slot_dict[segment[loc_1]], slot_dict[segment[loc_2]]
+            
+            # Darts on opposite sides of the same crossing, with nothing
+            # in between, are the passage through the crossing
+            
+            if (loc_2 == (loc_1 + 1) % len_segment and slot_1 // 4 == slot_2 // 4
+                and (slot_1 - slot_2) % 4 == 2 and not passed[slot_1]):
+                passed[slot_1], passed[slot_2] = True, True
+            else:
+                link[slot_1], link[slot_2] = slot_2, slot_1
+                
+    # Return results
+    
+    return [link, free_loops]
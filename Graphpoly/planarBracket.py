@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""
+This program finds the states of a link diagram by adding the crossings one
+at a time to a growing region of the diagram, in the manner of a planar (or
+Temperley-Lieb) algebra. At each step, the darts of the region joined to
+crossings not yet added are the boundary of the region. Once the crossings in
+the region have been split, the only information needed for the rest of the
+diagram is how the boundary darts are joined in pairs inside the region. Thus,
+the states for the region are kept as a dictionary, whose keys are these
+boundary pairings, and whose values are the states giving each pairing.
+
+The number of boundary pairings depends on the number of boundary darts (the
+frontier width) instead of the number of crossings, so the amount of work
+done grows exponentially with the frontier width, rather than with the total
+number of crossings as in LPoly().
+"""
+
+from Graphpoly.crossingOrder import crossingOrder
+
+#=============================================================================#
+
+def addCrossing(link, added, boundary, pairing, pair_list):
+    """
+    Add a crossing, split using the pairs of its darts given in pair_list, to
+    a region whose boundary darts are joined by the given pairing (a
+    dictionary, with each boundary dart as key and the dart it is joined to
+    as value). The list added gives the crossings in the region, including the
+    new crossing. Returns the pairing of the new boundary darts, along with the
+    number of unknots closed off inside the region by the new crossing.
+    """
+
+    # Darts inside the region are joined either by the old pairing, or by
+    # the split of the new crossing
+
+    inner = {slot : other for (slot, other) in pairing.items()}
+
+    for (slot_1, slot_2) in pair_list:
+        inner[slot_1], inner[slot_2] = slot_2, slot_1
+
+    # Walk from each new boundary dart through the region, until another
+    # boundary dart is reached
+
+    new_pairing = {}
+    visited = {slot : False for slot in inner}
+
+    for slot in boundary:
+        if slot in new_pairing:
+            continue
+
+        visited[slot] = True
+        other = inner[slot]
+
+        while added[link[other] // 4]:
+            visited[other] = True
+            other = link[other]
+            visited[other] = True
+            other = inner[other]
+
+        visited[other] = True
+        new_pairing[slot], new_pairing[other] = other, slot
+
+    # Any darts not visited are on unknots closed off inside the region
+
+    loops = 0
+
+    for slot in inner:
+        if not visited[slot]:
+            loops += 1
+            other = slot
+
+            while not visited[other]:
+                visited[other] = True
+                visited[inner[other]] = True
+                other = link[inner[other]]
+
+    # Return results
+
+    return [new_pairing, loops]
+
+#=============================================================================#
+
+def planarBracket(link, free_loops, order = None):
+    """
+    Given the list link and number of free unknots from pairDarts(), find the
+    states of the link by adding the crossings to the region in the given
+    order, a list of crossing indices; by default, the order is found with the
+    'greedy' method of crossingOrder(). The states are returned as a
+    dictionary, with keys (A, B, N), and values the number of states with
+    these values, along with the largest number of boundary darts found.
+    """
+
+    num_cross = len(link) // 4
+
+    if order is None:
+        order = crossingOrder(link, 'greedy')
+
+    # Start with an empty region, having a single state with no splits
+
+    added = [False for iii in range(num_cross)]
+    stateDict = {() : {(0, 0) : 1}}
+    boundary = []
+    width = 0
+
+    for cross in order:
+        base = 4 * cross
+        added[cross] = True
+
+        # Find the boundary of the region once the crossing is added
+
+        boundary = [slot for slot in boundary if not added[link[slot] // 4]] + \
+                   [slot for slot in range(base, base + 4) if not added[link[slot] // 4]]
+        width = max(width, len(boundary))
+
+        # Split the crossing both ways for each boundary pairing; A joins
+        # d0 to d1 and d2 to d3, while A^-1 joins d0 to d3 and d1 to d2
+
+        newStateDict = {}
+
+        for (key, countDict) in stateDict.items():
+            pairing = {}
+
+            for (slot_1, slot_2) in key:
+                pairing[slot_1], pairing[slot_2] = slot_2, slot_1
+
+            for (pair_list, A) in [([(base, base + 1), (base + 2, base + 3)], 1), \
+                                   ([(base, base + 3), (base + 1, base + 2)], 0)]:
+                [new_pairing, loops] = addCrossing(link, added, boundary, pairing, pair_list)
+
+                new_key = tuple(sorted((slot_1, slot_2) for (slot_1, slot_2) in new_pairing.items()
+                                       if slot_1 < slot_2))
+                newCountDict = newStateDict.setdefault(new_key, {})
+
+                for ((num_A, num_N), num) in countDict.items():
+                    state = (num_A + A, num_N + loops)
+                    newCountDict[state] = newCountDict.get(state, 0) + num
+
+        stateDict = newStateDict
+
+    # All crossings have been added, so the only boundary pairing left is
+    # the empty one
+
+    return [{(A, num_cross - A, N + free_loops) : num for ((A, N), num) in stateDict[()].items()}, \
+            width]
+
+#=============================================================================#
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""
+These functions simplify a link diagram, given by an e_path and the PD code
+for its crossings, before its Kauffman bracket or quandle colorings are found.
+The induced knot diagrams of a graph often have kinks (Reidemeister I loops)
+and bigons which can be undone by a Reidemeister II move, wherever a vertex of
+the graph became a crossing. Each crossing removed halves the number of states
+of the diagram.
+
+A crossing is removed by taking it out of the PD code, and taking its darts
+out of the e_path, so that the darts on either side of it are joined together
+by pairDarts(). Removing the two crossings of a bigon does not change the
+bracket or the writhe, while removing a kink multiplies the bracket by -A^-3
+or -A^3, and changes the writhe by -1 or +1, respectively. For a knot, the
+number of quandle colorings is not changed, so the simplified diagram can be
+passed to arcCode() to find the PD code used to count colorings.
+"""
+
+from Graphpoly.createInducedKnot import UnionFind
+from Graphpoly.pairDarts import pairDarts
+
+#=============================================================================#
+
+def findMove(link):
+    """
+    Given the list link from pairDarts(), find a kink or bigon in the diagram.
+    Returns the tuple (crossings, twist), with crossings the list of indices
+    of the crossings to remove, and twist the power of -A^3 taken out of the
+    bracket by removing them, or None if there are no kinks or bigons.
+    """
+
+    # Kinks are found first, since removing a kink never stops a bigon from
+    # being removed later. The dart of a kink is joined to one of the darts
+    # on either side of it, in the same crossing; if these are d0 and d1, or
+    # d2 and d3, the A split of the crossing gives the extra unknot.
+
+    for slot in range(len(link)):
+        other = link[slot]
+
+        if other // 4 == slot // 4 and (other - slot) % 2 == 1:
+            if min(slot, other) % 4 in [0, 2] and abs(slot - other) == 1:
+                return ([slot // 4], 1)
+            else:
+                return ([slot // 4], -1)
+
+    # A bigon is made by two edges joining neighbouring darts of one crossing
+    # to neighbouring darts of another, going around the bigon in the opposite
+    # direction. It can be undone if each edge is an overcrossing at both of
+    # its ends, or an undercrossing at both ends.
+
+    for slot in range(len(link)):
+        other = link[slot]
+
+        if other // 4 == slot // 4 or (other - slot) % 2 == 1:
+            continue
+
+        for step in [1, 3]:
+            if link[4 * (slot // 4) + (slot + step) % 4] == 4 * (other // 4) + (other - step) % 4:
+                return ([slot // 4, other // 4], 0)
+
+    return None
+
+#-----------------------------------------------------------------------------#
+
+def simplifyDiagram(e_path, PD_code, f_list = None):
+    """
+    Given an e_path for a link, possibly made of several components, and the
+    PD code for the crossings of the link, remove kinks and bigons until there
+    are none left. If f_list is given, it is a list of values for each
+    crossing in PD_code (such as the one from createInducedKnot()), which is
+    kept for the crossings that are left.
+
+    Returns [e_path, PD_code, f_list, twist] for the simplified diagram, with
+    twist the total writhe of the kinks removed, so that the Kauffman bracket
+    of the original diagram is (-A^3)^twist times that of the new diagram,
+    and its writhe is larger by twist. A component whose crossings are all
+    removed keeps one of its darts, so that it is still counted as an unknot.
+    """
+
+    e_path = [list(segment) for segment in e_path]
+    PD_code = [list(crossing) for crossing in PD_code]
+    f_list = None if f_list is None else list(f_list)
+    twist = 0
+
+    move = findMove(pairDarts(e_path, PD_code)[0])
+
+    while move is not None:
+        (crossings, kink) = move
+        twist += kink
+
+        # Take the darts of the crossings out of e_path, and the crossings
+        # out of PD_code and f_list
+
+        removed = {dart for cross in crossings for dart in PD_code[cross]}
+        e_path = [[dart for dart in segment if dart not in removed] or segment[:1]
+                  for segment in e_path]
+
+        PD_code = [PD_code[iii] for iii in range(len(PD_code)) if iii not in crossings]
+
+        if f_list is not None:
+            f_list = [f_list[iii] for iii in range(len(f_list)) if iii not in crossings]
+
+        move = findMove(pairDarts(e_path, PD_code)[0])
+
+    # Return results
+
+    return [e_path, PD_code, f_list, twist]
+
+#-----------------------------------------------------------------------------#
+
+def arcCode(e_path, PD_code):
+    """
+    Given an e_path and PD code for a knot, with the undercrossing of each
+    crossing going from d0 to d2 along e_path (as in the PD code returned by
+    createInducedKnot() when darts is True), find the PD code of the knot in
+    terms of its edges, in the same form as the PD code from
+    createInducedKnot(). Darts next to each other in e_path are on the same
+    edge, unless they are the two darts of an undercrossing, and the edges
+    are labelled 0, 1, 2, ... in order of their lowest dart.
+    """
+
+    if len(PD_code) == 0:
+        return []
+
+    darts = [dart for segment in e_path for dart in segment]
+    dartData = UnionFind(max(darts) + 1)
+    under = {(crossing[0], crossing[2]) for crossing in PD_code}
+
+    # Combine darts next to each other in e_path, other than those passing
+    # under a crossing
+
+    for segment in e_path:
+        for iii in range(len(segment)):
+            current_dart, next_dart = segment[iii], segment[(iii + 1) % len(segment)]
+
+            if (current_dart, next_dart) not in under:
+                dartData.Union(current_dart, next_dart)
+
+    dart_label = dartData.relabel(set(darts))
+
+    # Return results
+
+    return [[dart_label[dart] for dart in crossing] for crossing in PD_code]
+
+#=============================================================================#
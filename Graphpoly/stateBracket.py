@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+
+from Graphpoly.LaurentPoly import loopPower
+
+def stateBracket(state_dict):
+    """
+    Given a dictionary of states for a link diagram, where the keys are tuples
+    (power, loops) and the values are the number of states with that key, find
+    the Kauffman bracket of the diagram. Here power is A - B for a state with
+    A splits of type A and B splits of type A^-1, and loops is the number of
+    unknots left once all crossings have been split. Each state contributes
+
+        A^power * (-A^2 - A^-2)^(loops - 1)
+
+    to the bracket. The bracket is returned as an integer Laurent polynomial
+    in A, given by a dictionary with exponents as keys and the (non-zero)
+    integer coefficients as values.
+    """
+
+    bracket = {}
+
+    for ((power, loops), num) in state_dict.items():
+
+        # Use the stored powers of the loop value (-A^2 - A^-2), shifted by
+        # A^power
+
+        d_power = loopPower(loops - 1)
+
+        for (exponent, coeff) in zip(d_power.exponents, d_power.coeffs):
+            bracket[power + exponent] = bracket.get(power + exponent, 0) + num * coeff
+
+    # Remove any terms that have cancelled
+
+    return {exponent : coeff for (exponent, coeff) in sorted(bracket.items()) if coeff != 0}
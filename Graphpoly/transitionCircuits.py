@@ -0,0 +1,291 @@
+# -*- coding: utf-8 -*-
+"""
+This program finds the Eulerian circuits through a knotted 4-valent graph by
+choosing a transition at each vertex, instead of by the search in
+createCircuits(). An Eulerian circuit passes straight through each crossing,
+and at each vertex either passes straight through, or takes one of the two
+possible turns, so each circuit is given by one of the three transitions at
+each vertex. The transitions are chosen one vertex at a time, and a choice is
+dropped as soon as it closes up a loop which does not pass through every edge
+of the graph.
+
+The strands made by the transitions chosen so far are kept by pairing the two
+ends of each strand, which are darts of the vertices still to be dealt with.
+Joining the two ends of the same strand closes a loop, while joining the ends
+of two different strands makes a single longer strand. Each change to the
+pairing is recorded in an undo log, so that the pairing can be returned to the
+point where a transition is chosen.
+
+If the symmetries of the graph are given (see graphAutomorphisms), only one
+circuit is found from each orbit of circuits under the symmetries. Each
+circuit is given by the list of transitions chosen at the vertices, and a
+symmetry takes it to the circuit whose transition at the image of each
+vertex is the image of the transition there. The circuit found from each
+orbit is the one whose list of transitions comes first, so a choice is also
+dropped as soon as some symmetry takes the transitions chosen so far to ones
+coming before them, since no circuit continuing the choice can come first in
+its orbit.
+
+The graph is given by PD_list and type_list, in the same form as for
+createCircuits().
+"""
+
+#=============================================================================#
+
+# Pairs of positions in the PD code of a vertex joined by each transition; the
+# first passes straight through the vertex, as for a crossing
+
+transition_list = [[(0, 2), (1, 3)], [(0, 1), (2, 3)], [(0, 3), (1, 2)]]
+
+#=============================================================================#
+
+def followCircuit(edge, passage):
+    """
+    Follow the loop starting at dart 0, going along the edge from each dart,
+    and then through the node at the other end of the edge, using the dicts
+    edge and passage of the darts joined to each dart.
+    """
+
+    circuit = []
+    dart = 0
+
+    while True:
+        circuit += [dart, edge[dart]]
+        dart = passage[edge[dart]]
+
+        if dart == 0:
+            return circuit
+
+#-----------------------------------------------------------------------------#
+
+def graphStrands(PD_list, type_list):
+    """
+    Find the dicts edge and passage of the darts joined to each dart by an
+    edge of the graph, and by passing straight through its node, along with
+    the list of vertices of the graph. Returns [edge, passage, vertex_list,
+    end], where end gives the other end of the strand from each vertex dart,
+    going along edges and straight through crossings, or is None if some
+    darts are on a loop through crossings alone.
+    """
+
+    num_darts = 4 * len(PD_list)
+
+    # Find the dart on the other end of the edge for each dart. Outgoing
+    # darts are at positions 2, 3 of the PD code of a node with positive
+    # type, and 1, 2 otherwise, and the outgoing dart d is joined to the
+    # incoming dart d + 1.
+
+    edge = {}
+
+    for (node, node_type) in zip(PD_list, type_list):
+        outgoing_list = [2, 3] if node_type > 0 else [1, 2]
+
+        for (loc, dart) in enumerate(node):
+            if loc in outgoing_list:
+                edge[dart] = (dart + 1) % num_darts
+            else:
+                edge[dart] = (dart - 1) % num_darts
+
+    # Dart joined to each dart by passing through its node; this is straight
+    # through for a crossing, and is changed by the transition for a vertex
+
+    passage = {}
+
+    for node in PD_list:
+        for (loc_1, loc_2) in transition_list[0]:
+            passage[node[loc_1]], passage[node[loc_2]] = node[loc_2], node[loc_1]
+
+    vertex_list = [node for (node, node_type) in zip(PD_list, type_list) if abs(node_type) == 2]
+    vertex_darts = {dart for node in vertex_list for dart in node}
+
+    # Find the strands between vertex darts
+
+    end = {}
+    num_covered = len(vertex_darts)
+
+    for dart in vertex_darts:
+        if dart in end:
+            continue
+
+        other = edge[dart]
+
+        while other not in vertex_darts:
+            num_covered += 2
+            other = edge[passage[other]]
+
+        end[dart], end[other] = other, dart
+
+    # If some darts are not on any strand, they make up a loop through
+    # crossings alone
+
+    if len(vertex_list) > 0 and num_covered < num_darts:
+        end = None
+
+    return [edge, passage, vertex_list, end]
+
+#-----------------------------------------------------------------------------#
+
+def transitionImages(PD_list, vertex_list, perm_list):
+    """
+    Find how each symmetry in perm_list acts on the lists of transitions
+    chosen at the vertices in vertex_list. Returns a list with an item
+    [vertex_image, transition_image] for each symmetry other than the
+    identity, where vertex_image[level] is the index in vertex_list of the
+    image of vertex level, and transition_image[level][t] is the index in
+    transition_list of the image of transition t at vertex level.
+    """
+
+    dart_pos = {dart : loc for node in PD_list for (loc, dart) in enumerate(node)}
+    vertex_index = {dart : level for (level, node) in enumerate(vertex_list) for dart in node}
+    pair_list = [{frozenset(pair) for pair in transition} for transition in transition_list]
+
+    image_list = []
+
+    for perm in perm_list:
+        if all(perm[dart] == dart for dart in range(len(perm))):
+            continue
+
+        vertex_image = [vertex_index[perm[node[0]]] for node in vertex_list]
+        transition_image = []
+
+        for node in vertex_list:
+            new_loc = [dart_pos[perm[dart]] for dart in node]
+            image_pairs = [{frozenset((new_loc[loc_1], new_loc[loc_2])) for (loc_1, loc_2) in
+                            transition} for transition in transition_list]
+
+            transition_image += [[pair_list.index(pairs) for pairs in image_pairs]]
+
+        image_list += [[vertex_image, transition_image]]
+
+    return image_list
+
+#-----------------------------------------------------------------------------#
+
+def comesFirst(chosen, level, image_list):
+    """
+    Check that no symmetry takes the transitions chosen at vertices 0 to
+    level, given by chosen, to transitions coming before them, comparing the
+    lists one vertex at a time as far as the images are known.
+    """
+
+    for [vertex_image, transition_image] in image_list:
+        image = {vertex_image[iii] : transition_image[iii][chosen[iii]] for iii in
+                 range(level + 1)}
+
+        for iii in range(level + 1):
+            if iii not in image or image[iii] > chosen[iii]:
+                break
+            elif image[iii] < chosen[iii]:
+                return False
+
+    return True
+
+#-----------------------------------------------------------------------------#
+
+def transitionCircuits(PD_list, type_list, perm_list = None):
+    """
+    Go through the transitions at the vertices of the graph, yielding the
+    Eulerian circuit for each choice of transitions which gives a single
+    closed curve. Each circuit is a list of the darts passed through,
+    starting at dart 0 and going along its edge first, and each circuit
+    through the graph is found exactly once.
+
+    If perm_list is given, as from graphAutomorphisms(), only the first
+    circuit of each orbit under the symmetries is found, and the items
+    yielded are [circuit, multiplicity], with multiplicity the number of
+    circuits in the orbit.
+    """
+
+    [edge, passage, vertex_list, end] = graphStrands(PD_list, type_list)
+
+    # With no vertices, the graph is a single circuit if following it from
+    # dart 0 passes through every dart; with a loop through crossings alone,
+    # there are no Eulerian circuits
+
+    if len(vertex_list) == 0:
+        circuit = followCircuit(edge, passage)
+
+        if len(circuit) == len(edge):
+            yield circuit if perm_list is None else [circuit, 1]
+
+        return
+
+    if end is None:
+        return
+
+    #-------------------------------------------------------------------------#
+
+    # Choose the transition at each vertex in turn. Items in the stack are of
+    # the form (mark, level, choice), where mark is the length of the undo
+    # log when the transition with index choice in transition_list is chosen
+    # at vertex level. The list chosen holds the choices made so far.
+
+    image_list = [] if perm_list is None else transitionImages(PD_list, vertex_list, perm_list)
+    chosen = [0 for node in vertex_list]
+
+    undo_log = []
+    transitionStack = [(0, 0, choice) for choice in reversed(range(len(transition_list)))]
+
+    while len(transitionStack) > 0:
+        (mark, level, choice) = transitionStack.pop()
+        chosen[level] = choice
+
+        # Return the strand ends to where they were when the transition was
+        # chosen
+
+        while len(undo_log) > mark:
+            (dart, old_end, old_passage) = undo_log.pop()
+            end[dart], passage[dart] = old_end, old_passage
+
+        node = vertex_list[level]
+        open_ends = 4 * (len(vertex_list) - level)
+
+        # Join the ends of the strands at the darts paired by the transition
+
+        closed = False
+
+        for (loc_1, loc_2) in transition_list[choice]:
+            dart_1, dart_2 = node[loc_1], node[loc_2]
+            end_1, end_2 = end[dart_1], end[dart_2]
+
+            undo_log += [(dart_1, end_1, passage[dart_1]), (dart_2, end_2, passage[dart_2]),
+                         (end_1, end[end_1], passage[end_1]), (end_2, end[end_2], passage[end_2])]
+
+            passage[dart_1], passage[dart_2] = dart_2, dart_1
+            open_ends -= 2
+
+            # If the darts are the two ends of one strand, a loop is closed,
+            # which is only allowed when no other strands are left
+
+            if end_1 != dart_2:
+                end[end_1], end[end_2] = end_2, end_1
+            elif open_ends > 0:
+                closed = True
+                break
+
+        if closed or not comesFirst(chosen, level, image_list):
+            continue
+
+        if level < len(vertex_list) - 1:
+            mark = len(undo_log)
+            transitionStack += [(mark, level + 1, choice)
+                                for choice in reversed(range(len(transition_list)))]
+        elif perm_list is None:
+            yield followCircuit(edge, passage)
+        else:
+
+            # The orbit holds the circuits given by the images of chosen
+
+            orbit = {tuple(chosen)}
+
+            for [vertex_image, transition_image] in image_list:
+                image = [0 for node in vertex_list]
+
+                for iii in range(len(vertex_list)):
+                    image[vertex_image[iii]] = transition_image[iii][chosen[iii]]
+
+                orbit.add(tuple(image))
+
+            yield [followCircuit(edge, passage), len(orbit)]
+
+#=============================================================================#
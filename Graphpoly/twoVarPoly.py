@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+"""
+This program finds the 2-variable graph polynomial of the knot diagram
+induced by an Eulerian circuit through a knotted 4-valent graph. The vertices
+of the graph are resolved one at a time, from the end of the PD code, using
+the skein relation
+
+    [G] = c [G_c] + s [G_s],
+
+where G_c keeps the vertex as a crossing (if the circuit passes straight
+through it), or removes it (if the circuit takes a turn there), and G_s
+splits the vertex the other way, changing the segments of e_path. Once all
+vertices are resolved, what is left is a link, whose Jones polynomial
+
+    (-A^3)^-w <L>
+
+is found from its writhe w and Kauffman bracket <L> using LPoly(). The result
+is a LaurentPoly in c, s and A.
+
+This was first written in 2-variable-graph-poly.ipynb. Here, the partially
+resolved diagrams are kept in a memo table, keyed by a canonical form of the
+diagram, so that a diagram reached by more than one sequence of resolutions
+(or from more than one circuit through the same graph, if the memo table is
+shared) is only found once. Segments of e_path with no darts of the
+remaining nodes are free unknots, and are factored out as powers of the loop
+value d = -A^2 - A^-2 before the memo table is checked.
+"""
+
+from Graphpoly.connectList import connectList
+from Graphpoly.LaurentPoly import LaurentPoly
+from Graphpoly.LPoly import LPoly
+from Graphpoly.LRUCache import LRUCache
+from Graphpoly.sewSegments import sewSegments
+from Graphpoly.splitSegment import splitSegment
+
+#=============================================================================#
+
+# Variable names for the polynomial, and the loop value d = -A^2 - A^-2
+
+poly_names = ('c', 's', 'A')
+loop_value = LaurentPoly({(0, 0, 2) : -1, (0, 0, -2) : -1}, poly_names)
+
+# Ways the circuit can take turns at a vertex, for the s term of the skein
+# relation at an improper vertex. Each item is of the form (connect_1,
+# connect_2, order, keep), where connect_1 and connect_2 are the connections
+# through the vertex, as pairs of positions in its PD code; order gives the
+# positions of the darts a, b, c, d passed to splitSegment() (if the
+# connections are in the same segment) or to sewSegments() (if not); and keep
+# is True if the vertex stays in the PD code as a crossing.
+
+turn_list = [((0, 1), (2, 3), [1, 2, 3, 0], [1, 0, 3, 2], False),
+             ((0, 1), (3, 2), [1, 3, 2, 0], [1, 0, 2, 3], True),
+             ((0, 3), (1, 2), [3, 1, 2, 0], [3, 0, 2, 1], True),
+             ((0, 3), (2, 1), [3, 2, 1, 0], [3, 0, 1, 2], False),
+             ((1, 0), (3, 2), [0, 3, 2, 1], [0, 1, 2, 3], False),
+             ((1, 2), (3, 0), [0, 1, 2, 3], [0, 3, 2, 1], False)]
+
+#=============================================================================#
+
+def diagramKey(e_path, PD_code, type_list):
+    """
+    Return a key for the partially resolved diagram, which is the same for
+    any cyclic permutation or ordering of the segments of e_path. The nodes
+    still to be resolved are kept in order, with the size of their types,
+    while the order of the crossings already dealt with does not matter.
+    """
+
+    seg_list = []
+
+    for segment in e_path:
+        start = segment.index(min(segment))
+        seg_list += [tuple(segment[start:] + segment[:start])]
+
+    num_left = len(type_list)
+    node_list = tuple((tuple(node), abs(node_type)) for (node, node_type) in
+                      zip(PD_code[:num_left], type_list))
+
+    return (tuple(sorted(seg_list)), node_list, tuple(sorted(tuple(node) for node in
+                                                             PD_code[num_left:])))
+
+#-----------------------------------------------------------------------------#
+
+def jonesPoly(e_path, PD_code, engine = 'state'):
+    """
+    Find the Jones polynomial (-A^3)^-w <L> of the link with the given e_path
+    and PD code, as a LaurentPoly in c, s and A.
+    """
+
+    [writhe, bracket] = LPoly(e_path, PD_code, aggregate = True, engine = engine)
+
+    sign = -1 if writhe % 2 else 1
+
+    return LaurentPoly({(0, 0, power - 3 * writhe) : sign * coeff
+                        for (power, coeff) in bracket.items()}, poly_names)
+
+#-----------------------------------------------------------------------------#
+
+def resolveNode(e_path, PD_code, type_list, memo, engine):
+    """
+    Resolve the last node of type_list in PD code, returning the polynomial
+    for the diagram.
+    """
+
+    next_node_index = len(type_list) - 1
+    current_node = PD_code[next_node_index]
+    removed_PD_code = [node for node in PD_code if node != current_node]
+
+    # Find the segment and connection lists for current e_path, node
+
+    [seg_list, connect_list] = connectList([segment for segment in e_path], list(current_node))
+    [d0, d1, d2, d3] = current_node
+    pos_list = [pos for (seg, pos) in seg_list]
+
+    # If the node type is a crossing, check to make sure that PD code for
+    # current node matches orientation of e_path, by seeing if the first
+    # dart listed comes before the third listed.
+
+    if abs(type_list[-1]) == 1:
+        new_PD_code = [node for node in PD_code]
+
+        if (d2, d0) in connect_list:
+            new_PD_code[next_node_index] = [d2, d3, d0, d1]
+
+        return twoVarTerm(e_path, new_PD_code, type_list[:-1], memo, engine)
+
+    #-------------------------------------------------------------------------#
+
+    # If the vertex is proper, the c term keeps the vertex as a crossing,
+    # while the s term joins the darts the other way, in the direction the
+    # overcrossing passes through the vertex
+
+    if (d0, d2) in connect_list:
+        c_func = twoVarTerm(e_path, PD_code, type_list[:-1], memo, engine)
+
+        if seg_list[0][0] == seg_list[1][0]:
+            order = [2, 1, 3, 0] if (d1, d3) in connect_list else [2, 3, 1, 0]
+            new_e_path = splitSegment([segment for segment in e_path], seg_list[0][0],
+                                      *[pos_list[iii] for iii in order])
+        else:
+            order = [2, 0, 3, 1] if (d1, d3) in connect_list else [2, 0, 1, 3]
+            new_e_path = sewSegments([segment for segment in e_path], seg_list[0][0],
+                                     seg_list[1][0], *[pos_list[iii] for iii in order])
+
+        s_func = twoVarTerm(new_e_path, removed_PD_code, type_list[:-1], memo, engine)
+
+        return c_func.shift((1, 0, 0)) + s_func.shift((0, 1, 0))
+
+    # If the vertex is not proper, the c term removes the vertex, keeping the
+    # same e_path, while the s term breaks the segment through the vertex in
+    # two, or sews the two segments through it together into one
+
+    c_func = twoVarTerm(e_path, removed_PD_code, type_list[:-1], memo, engine)
+
+    for (connect_1, connect_2, split_order, sew_order, keep) in turn_list:
+        if (current_node[connect_1[0]], current_node[connect_1[1]]) in connect_list and \
+           (current_node[connect_2[0]], current_node[connect_2[1]]) in connect_list:
+            break
+    else:
+        raise ValueError('Circuit does not pass through vertex ' + str(current_node))
+
+    if seg_list[0][0] == seg_list[2][0]:
+        new_e_path = splitSegment([segment for segment in e_path], seg_list[0][0],
+                                  *[pos_list[iii] for iii in split_order])
+    else:
+        new_e_path = sewSegments([segment for segment in e_path], seg_list[0][0],
+                                 seg_list[2][0], *[pos_list[iii] for iii in sew_order])
+
+    new_PD_code = PD_code if keep else removed_PD_code
+    s_func = twoVarTerm(new_e_path, new_PD_code, type_list[:-1], memo, engine)
+
+    return c_func.shift((1, 0, 0)) + s_func.shift((0, 1, 0))
+
+#-----------------------------------------------------------------------------#
+
+def twoVarTerm(e_path, PD_code, type_list, memo, engine):
+    """
+    Find the polynomial for a partially resolved diagram, factoring out the
+    free unknots, and using the memo table for the rest of the diagram.
+    """
+
+    node_darts = {dart for node in PD_code for dart in node}
+    link_path = [list(segment) for segment in e_path if not node_darts.isdisjoint(segment)]
+    free_loops = len(e_path) - len(link_path)
+
+    # With no nodes left, the diagram is a collection of free unknots
+
+    if len(link_path) == 0:
+        return loop_value ** (free_loops - 1)
+
+    key = diagramKey(link_path, PD_code, type_list)
+    result = memo.get(key)
+
+    if result is None:
+        if len(type_list) == 0:
+            result = jonesPoly(link_path, [list(node) for node in PD_code], engine)
+        else:
+            result = resolveNode(link_path, PD_code, type_list, memo, engine)
+
+        memo.put(key, result)
+
+    return result * loop_value ** free_loops if free_loops > 0 else result
+
+#-----------------------------------------------------------------------------#
+
+def twoVarPoly(e_path, PD_code, type_list, memo = None, memo_size = 2 ** 16, engine = 'state'):
+    """
+    Given the e_path, PD code and node types for the graph of an Eulerian
+    circuit (such as [graph.listEPath()], graph.listPDCode() and the values
+    of graph.listNodeTypeDict() for a graph from createCircuits()), find the
+    2-variable graph polynomial, as a LaurentPoly in c, s and A.
+
+    Partially resolved diagrams are kept in the memo table memo, an
+    LRUCache, which can be shared between calls for circuits through the
+    same graph; if memo is None, a new table holding at most memo_size
+    diagrams is used. The Jones polynomials of the links left are found by
+    LPoly() with the given engine.
+    """
+
+    if memo is None:
+        memo = LRUCache(memo_size)
+
+    return twoVarTerm([list(segment) for segment in e_path], [list(node) for node in PD_code],
+                      list(type_list), memo, engine)
+
+#=============================================================================#
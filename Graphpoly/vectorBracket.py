@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+This program finds the states of a link diagram using NumPy, instead of going
+through the tree of splits one state at a time. Each state is given by an
+integer, whose bit iii is 0 if crossing iii is split with a factor of A, and 1
+for a factor of A^-1. For a batch of states at once, the split at each crossing
+gives a pairing of the darts of the crossing, so together with the list link
+from pairDarts(), each state gives two fixed-point free involutions of the
+darts. The unknots of the state are the cycles of the graph formed by the two
+pairings, and each unknot gives two cycles of the permutation
+
+    dart -> link[split[dart]]
+
+The cycles of this permutation are counted for the whole batch by pointer
+jumping, with each dart finding the smallest dart in its cycle after about
+log_2 (number of darts) steps. The crossings which are split the same way for
+every state in a batch are split beforehand, so that only the darts of the
+other crossings are used in the arrays.
+
+This is meant for diagrams with up to about 22 crossings, since all 2^N states
+are gone through. NumPy is only needed when this function is used.
+"""
+
+from Graphpoly.memoBracket import splitCrossing
+
+#=============================================================================#
+
+def vectorBracket(link, free_loops, batch_size = 2 ** 8):
+    """
+    Given the list link and number of free unknots from pairDarts(), find the
+    states of the link, going through batch_size states at a time (rounded
+    down to a power of two). The states are returned as a dictionary, with
+    keys (A, B, N), and values the number of states with these values.
+    """
+
+    import numpy as np
+
+    num_cross = len(link) // 4
+
+    # Crossings 0, ..., num_batch - 1 are split differently for each state in
+    # a batch, while the remaining crossings are split the same way for the
+    # whole batch. These are split first, using splitCrossing(), so that the
+    # arrays only hold the darts of the first num_batch crossings.
+
+    num_batch = min(num_cross, max(0, batch_size.bit_length() - 1))
+    num_darts = 4 * num_batch
+
+    # Darts paired with each dart by the two possible splits of its crossing;
+    # A joins d0 to d1 and d2 to d3, while A^-1 joins d0 to d3 and d1 to d2
+
+    darts = np.arange(num_darts, dtype = np.int32)
+    A_split = darts ^ 1
+    B_split = 4 * (darts // 4) + 3 - darts % 4
+
+    # Bit for each crossing of each state in the batch, repeated for each of
+    # the darts of the crossing
+
+    states = np.arange(2 ** num_batch, dtype = np.int32)
+    bits = (states[:, None] >> np.arange(num_batch, dtype = np.int32)) & 1
+    split = np.where(np.repeat(bits, 4, axis = 1).astype(bool), B_split, A_split)
+    batch_A = num_batch - bits.sum(axis = 1)
+
+    # Offsets to treat the arrays for the whole batch as one flat array, and
+    # the number of pointer jumping steps needed to cover the longest cycle,
+    # which has at most half of the darts
+
+    offset = (states * num_darts)[:, None]
+    start_label = np.tile(darts, 2 ** num_batch)
+    num_steps = max(1, (num_darts // 2 - 1).bit_length())
+
+    # Histogram of states, with A in range(num_cross + 1), and at most one
+    # unknot for every two darts
+
+    max_loops = 2 * num_cross + 1
+    histogram = np.zeros((num_cross + 1) * max_loops, dtype = np.int64)
+
+    # Split the crossings which are the same for the whole batch, going
+    # through the tree of their splits so that the splits of the last
+    # crossings are shared between batches. Items in the stack are of the form
+    # [link, A, N] for the crossings not yet split.
+
+    linkStack = [[link, 0, 0]]
+
+    while len(linkStack) > 0:
+        [batch_link, high_A, high_loops] = linkStack.pop()
+
+        if len(batch_link) > num_darts:
+            base = len(batch_link) - 4
+
+            [A_link, A_loops] = splitCrossing(batch_link, [(base, base + 1), (base + 2, base + 3)])
+            [B_link, B_loops] = splitCrossing(batch_link, [(base, base + 3), (base + 1, base + 2)])
+
+            linkStack += [[A_link, high_A + 1, high_loops + A_loops]]
+            linkStack += [[B_link, high_A, high_loops + B_loops]]
+            continue
+
+        # Pointer jumping for the permutation dart -> link[split[dart]],
+        # with each dart finding the smallest dart in its cycle
+
+        if num_batch > 0:
+            perm = (np.array(batch_link, dtype = np.int32)[split] + offset).ravel()
+            label = start_label
+
+            for step in range(num_steps):
+                label = np.minimum(label, label[perm])
+                perm = perm[perm]
+
+            loops = (label.reshape(-1, num_darts) == darts).sum(axis = 1) // 2
+        else:
+            loops = np.zeros(1, dtype = np.int32)
+
+        histogram += np.bincount((batch_A + high_A) * max_loops + loops + high_loops, \
+                                 minlength = histogram.size)
+
+    # Return results
+
+    return {(key // max_loops, num_cross - key // max_loops, key % max_loops + free_loops) : int(num)
+            for (key, num) in enumerate(histogram.tolist()) if num > 0}
+
+#=============================================================================#
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+
+# Go to graph-poly folder and run "python -m unittest tests.test_InvariantCache"
+
+import os
+import tempfile
+import unittest
+from Graphpoly import graphInvariantMultiset, InvariantCache, pdKey
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+class TestInvariantCache(unittest.TestCase):
+
+    #-------------------------------------------------------------------------#
+
+    def test_pd_key(self):
+        """
+            Left trefoil with its crossings and edges in a different order
+            has the same key
+        """
+
+        self.assertEqual(pdKey([[0, 2, 1, 2], [1, 0, 2, 0], [2, 1, 0, 1]], [1, 1, 1]), \
+                         pdKey([[2, 1, 0, 1], [0, 2, 1, 2], [1, 0, 2, 0]], [1, 1, 1]))
+        self.assertNotEqual(pdKey([[0, 2, 1, 2], [1, 0, 2, 0], [2, 1, 0, 1]], [1, 1, 1]), \
+                            pdKey([[0, 2, 1, 2], [1, 0, 2, 0], [2, 1, 0, 1]], [-1, -1, -1]))
+
+    #-------------------------------------------------------------------------#
+
+    def test_lookup(self):
+        """
+            Value is only found once, and is kept on disk for the next cache
+            using the same file
+        """
+
+        key = pdKey([[0, 0, 0, 0]], [1])
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return [1, {-3 : -1}]
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'invariants.db')
+
+            with InvariantCache(path) as cache:
+                self.assertListEqual(cache.lookup('bracket', key, compute), [1, {-3 : -1}])
+                self.assertListEqual(cache.lookup('bracket', key, compute), [1, {-3 : -1}])
+                self.assertIsNone(cache.get('quandle', key))
+
+            with InvariantCache(path) as cache:
+                self.assertListEqual(cache.lookup('bracket', key, compute), [1, {-3 : -1}])
+
+        self.assertEqual(len(calls), 1)
+
+    #-------------------------------------------------------------------------#
+
+    def test_stored_values(self):
+        """
+            A stored None is found rather than computed again, NumPy numbers
+            are stored as Python numbers, and values that cannot be read back
+            from disk are rejected
+        """
+
+        key = pdKey([[0, 0, 0, 0]], [1])
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return None
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'invariants.db')
+
+            with InvariantCache(path) as cache:
+                self.assertIsNone(cache.lookup('quandle', key, compute))
+                self.assertIsNone(cache.lookup('quandle', key, compute))
+                self.assertEqual(cache.get('bracket', key, 0), 0)
+
+                if numpy is not None:
+                    cache.put('bracket', key, [numpy.int64(1), {numpy.int32(-3) : numpy.int64(-1)}])
+
+                with self.assertRaises(ValueError):
+                    cache.put('bracket', key, object())
+
+            with InvariantCache(path) as cache:
+                self.assertIsNone(cache.lookup('quandle', key, compute))
+
+                if numpy is not None:
+                    value = cache.get('bracket', key)
+
+                    self.assertListEqual(value, [1, {-3 : -1}])
+                    self.assertIs(type(value[0]), int)
+
+        self.assertEqual(len(calls), 1)
+
+    #-------------------------------------------------------------------------#
+
+    def test_multiset(self):
+        """
+            Multiset found using the cache is the same as without it
+        """
+
+        seq = [[0, 3, -2], [2, 5, 2], [4, 7, -1], [6, 1, 1]]
+        cache = InvariantCache()
+
+        for invariant in ['bracket', 'jones']:
+            self.assertDictEqual(graphInvariantMultiset(seq, invariant, cache = cache), \
+                                 graphInvariantMultiset(seq, invariant))
+
+    #-------------------------------------------------------------------------#
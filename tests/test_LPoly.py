@@ -8,7 +8,12 @@ Created on Wed Jun 26 13:28:10 2024
 # Go to graph-poly folder and run "python -m unittest tests.test_LPoly"
 
 import unittest
-from Graphpoly import LPoly
+from Graphpoly import grayBracket, iterLPoly, LPoly, memoBracket, pairDarts, vectorBracket
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 class TestLPoly(unittest.TestCase):
     
@@ -93,4 +98,242 @@ class TestLPoly(unittest.TestCase):
         self.assertCountEqual(state_list, [(0, 3, 3), (1, 2, 2), (1, 2, 2), (1, 2, 2), \
                                             (2, 1, 1), (2, 1, 1), (2, 1, 1), (3, 0, 2)])
              
-     #-------------------------------------------------------------------------#
\ No newline at end of file
+     #-------------------------------------------------------------------------#
+    
+    #-------------------------------------------------------------------------#
+    
+    def test_left_trefoil_aggregate(self):
+        """
+            Left trefoil, with states merged into the bracket polynomial
+        """
+        
+        [writhe, bracket] = LPoly([[iii for iii in range(12)]], \
+                                  [[0, 6, 1, 7], [4, 10, 5, 11], [8, 2, 9, 3]], \
+                                  aggregate = True)
+            
+        self.assertEqual(writhe, -3)
+        self.assertDictEqual(bracket, {-5 : -1, 3 : -1, 7 : 1})
+            
+    #-------------------------------------------------------------------------#
+    
+    def test_figure_eight_aggregate(self):
+        """
+            Figure eight knot, with states merged into the bracket polynomial
+        """
+        
+        [writhe, bracket] = LPoly([[iii for iii in range(16)]], \
+                                  [[0, 6, 1, 7], [12, 3, 13, 2], [4, 11, 5, 10], [8, 14, 9, 15]], \
+                                  aggregate = True)
+            
+        self.assertEqual(writhe, 0)
+        self.assertDictEqual(bracket, {-8 : 1, -4 : -1, 0 : 1, 4 : -1, 8 : 1})
+            
+    #-------------------------------------------------------------------------#
+    
+    def test_memo_engine(self):
+        """
+            The memo engine gives the same states as the state tree, for the
+            trefoils and the figure eight knot
+        """
+        
+        for PD_code in [[[0, 6, 1, 7], [4, 10, 5, 11], [8, 2, 9, 3]], \
+                        [[2, 9, 3, 8], [6, 1, 7, 0], [10, 5, 11, 4]], \
+                        [[0, 6, 1, 7], [12, 3, 13, 2], [4, 11, 5, 10], [8, 14, 9, 15]]]:
+            e_path = [[iii for iii in range(4 * len(PD_code))]]
+            
+            [writhe, state_list] = LPoly([[dart for dart in seg] for seg in e_path], \
+                                         [[dart for dart in node] for node in PD_code])
+            [memo_writhe, memo_state_list] = LPoly(e_path, PD_code, engine = 'memo')
+            
+            self.assertEqual(writhe, memo_writhe)
+            self.assertCountEqual(state_list, memo_state_list)
+            
+    #-------------------------------------------------------------------------#
+    
+    def test_memo_engine_unlike_type(self):
+        """
+            Unknot with two crossings of opposite type, using the memo engine
+            with a single memo table entry
+        """
+        
+        [writhe, state_list] = LPoly([[iii for iii in range(8)]], \
+                                     [[0, 6, 1, 7], [2, 5, 3, 4]], \
+                                     engine = 'memo', memo_size = 1)
+            
+        self.assertEqual(writhe, 0)
+        self.assertCountEqual(state_list, [(1, 1, 1), (0, 2, 2), (2, 0, 2), (1, 1, 3)])
+            
+    #-------------------------------------------------------------------------#
+    
+    def test_tl_engine(self):
+        """
+            The planar algebra engine gives the same states as the state tree,
+            for the trefoils and the figure eight knot
+        """
+        
+        for PD_code in [[[0, 6, 1, 7], [4, 10, 5, 11], [8, 2, 9, 3]], \
+                        [[2, 9, 3, 8], [6, 1, 7, 0], [10, 5, 11, 4]], \
+                        [[0, 6, 1, 7], [12, 3, 13, 2], [4, 11, 5, 10], [8, 14, 9, 15]]]:
+            e_path = [[iii for iii in range(4 * len(PD_code))]]
+            
+            [writhe, state_list] = LPoly([[dart for dart in seg] for seg in e_path], \
+                                         [[dart for dart in node] for node in PD_code])
+            [tl_writhe, tl_state_list] = LPoly(e_path, PD_code, engine = 'tl')
+            
+            self.assertEqual(writhe, tl_writhe)
+            self.assertCountEqual(state_list, tl_state_list)
+            
+    #-------------------------------------------------------------------------#
+    
+    def test_tl_engine_hopf_unknot(self):
+        """
+            Hopf link (+1) with an extra unknot, using the planar algebra engine
+        """
+        
+        [writhe, bracket] = LPoly([[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]], \
+                                  [[0, 4, 1, 5], [6, 2, 7, 3]], \
+                                  aggregate = True, engine = 'tl')
+        
+        [state_writhe, state_bracket] = LPoly([[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]], \
+                                              [[0, 4, 1, 5], [6, 2, 7, 3]], \
+                                              aggregate = True)
+            
+        self.assertEqual(writhe, state_writhe)
+        self.assertDictEqual(bracket, state_bracket)
+            
+    #-------------------------------------------------------------------------#
+    
+    def test_crossing_orders(self):
+        """
+            Figure eight knot, with each engine and crossing order giving the
+            same bracket; the planar algebra engine reports the width of the
+            order it used
+        """
+        
+        PD_code = [[0, 6, 1, 7], [12, 3, 13, 2], [4, 11, 5, 10], [8, 14, 9, 15]]
+        
+        for engine in ['state', 'memo', 'tl']:
+            for order in ['reverse', 'circuit', 'bfs', 'greedy', 'loops', [0, 2, 1, 3]]:
+                [writhe, bracket, width] = LPoly([[iii for iii in range(16)]], \
+                                                 [[dart for dart in node] for node in PD_code], \
+                                                 aggregate = True, engine = engine, \
+                                                 order = order, width = True)
+                    
+                self.assertEqual(writhe, 0)
+                self.assertDictEqual(bracket, {-8 : 1, -4 : -1, 0 : 1, 4 : -1, 8 : 1})
+                self.assertLessEqual(width, 8)
+                
+        [writhe, bracket, width] = LPoly([[iii for iii in range(16)]], PD_code, \
+                                         aggregate = True, engine = 'tl', width = True)
+            
+        self.assertEqual(width, 4)
+        
+        for order in [[0, 0, 1, 2], [0], [0, 2, 1, 5]]:
+            with self.assertRaises(ValueError):
+                LPoly([[iii for iii in range(16)]], PD_code, aggregate = True, order = order)
+            
+    #-------------------------------------------------------------------------#
+    
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_numpy_engine(self):
+        """
+            The NumPy engine gives the same states as the memo engine, for the
+            figure eight knot, the Hopf link with an extra unknot, and the
+            unknot with two crossings of opposite type; a batch size of 2
+            splits the figure eight knot over several batches
+        """
+        
+        for (e_path, PD_code) in [([[iii for iii in range(16)]], \
+                                   [[0, 6, 1, 7], [12, 3, 13, 2], [4, 11, 5, 10], [8, 14, 9, 15]]), \
+                                  ([[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]], \
+                                   [[0, 4, 1, 5], [6, 2, 7, 3]]), \
+                                  ([[iii for iii in range(8)]], \
+                                   [[0, 6, 1, 7], [2, 5, 3, 4]])]:
+            
+            [writhe, state_list] = LPoly(e_path, PD_code, engine = 'memo')
+            [np_writhe, np_state_list] = LPoly(e_path, PD_code, engine = 'numpy')
+            
+            self.assertEqual(writhe, np_writhe)
+            self.assertCountEqual(state_list, np_state_list)
+            
+        [link, free_loops] = pairDarts([[iii for iii in range(16)]], \
+                                       [[0, 6, 1, 7], [12, 3, 13, 2], [4, 11, 5, 10], [8, 14, 9, 15]])
+            
+        self.assertDictEqual(vectorBracket(link, free_loops, batch_size = 2), \
+                             memoBracket(link, free_loops, 16))
+            
+    #-------------------------------------------------------------------------#
+    
+    def test_parallel_state_tree(self):
+        """
+            Splitting the state tree between processes gives exactly the same
+            list of states as a single process for the figure eight knot, for
+            split depths both smaller and larger than the number of crossings
+        """
+        
+        e_path = [[iii for iii in range(16)]]
+        PD_code = [[0, 6, 1, 7], [12, 3, 13, 2], [4, 11, 5, 10], [8, 14, 9, 15]]
+        
+        result = LPoly([[dart for dart in seg] for seg in e_path], [cross for cross in PD_code])
+        
+        for split_depth in [2, 6]:
+            par_result = LPoly([[dart for dart in seg] for seg in e_path], [cross for cross in PD_code], \
+                               workers = 2, split_depth = split_depth)
+            
+            self.assertEqual(result, par_result)
+            
+        par_result = LPoly(e_path, PD_code, aggregate = True, workers = 2)
+        
+        self.assertDictEqual(par_result[1], {-8 : 1, -4 : -1, 0 : 1, 4 : -1, 8 : 1})
+            
+    #-------------------------------------------------------------------------#
+    
+    def test_gray_engine(self):
+        """
+            The Gray code engine gives the same states as the memo engine, for
+            the figure eight knot, the Hopf link with an extra unknot, and a
+            diagram whose darts are joined so that it is not planar, where
+            changing a split can leave the number of unknots the same
+        """
+        
+        for (e_path, PD_code) in [([[iii for iii in range(16)]], \
+                                   [[0, 6, 1, 7], [12, 3, 13, 2], [4, 11, 5, 10], [8, 14, 9, 15]]), \
+                                  ([[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]], \
+                                   [[0, 4, 1, 5], [6, 2, 7, 3]])]:
+            
+            [writhe, state_list] = LPoly(e_path, PD_code, engine = 'memo')
+            [gray_writhe, gray_state_list] = LPoly(e_path, PD_code, engine = 'gray')
+            
+            self.assertEqual(writhe, gray_writhe)
+            self.assertCountEqual(state_list, gray_state_list)
+            
+        link = [2, 4, 0, 6, 1, 7, 3, 5]
+        
+        self.assertDictEqual(grayBracket(link, 0), memoBracket(link, 0, 16))
+            
+    #-------------------------------------------------------------------------#
+    
+    def test_iter_states(self):
+        """
+            The generator from iterLPoly gives the same writhe number and
+            states, in the same order, as LPoly for the figure eight knot, and
+            can be stopped early
+        """
+        
+        e_path = [[iii for iii in range(16)]]
+        PD_code = [[0, 6, 1, 7], [12, 3, 13, 2], [4, 11, 5, 10], [8, 14, 9, 15]]
+        
+        [writhe, state_list] = LPoly([[dart for dart in seg] for seg in e_path], \
+                                     [cross for cross in PD_code])
+        [iter_writhe, states] = iterLPoly(e_path, PD_code)
+        
+        self.assertEqual(writhe, iter_writhe)
+        self.assertEqual(next(states), state_list[0])
+        self.assertListEqual([state for state in states], state_list[1:])
+        
+        [iter_writhe, states] = iterLPoly(e_path, PD_code)
+        
+        self.assertListEqual([state for (state, iii) in zip(states, range(3))], state_list[:3])
+        self.assertListEqual(PD_code, [[0, 6, 1, 7], [12, 3, 13, 2], [4, 11, 5, 10], [8, 14, 9, 15]])
+            
+    #-------------------------------------------------------------------------#
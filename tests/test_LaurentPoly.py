@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+
+# Go to graph-poly folder and run "python -m unittest tests.test_LaurentPoly"
+
+import unittest
+from Graphpoly import LaurentPoly, loopPower, LPoly
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import sympy
+except ImportError:
+    sympy = None
+
+class TestLaurentPoly(unittest.TestCase):
+    
+    #-------------------------------------------------------------------------#
+    
+    def test_arithmetic(self):
+        """
+            Adding, multiplying and shifting polynomials in A, with terms
+            that cancel removed
+        """
+        
+        A = LaurentPoly({1 : 1})
+        
+        self.assertDictEqual(((A ** 2 + 3) * (A ** -1 - 1)).terms(), \
+                             {-1 : 3, 0 : -3, 1 : 1, 2 : -1})
+        self.assertDictEqual((A - A).terms(), {})
+        self.assertDictEqual(((-A ** 3) ** -2).terms(), {-6 : 1})
+        self.assertEqual((2 - A).shift(3), 2 * A ** 3 - A ** 4)
+        
+        with self.assertRaises(ValueError):
+            (A + 1) ** -1
+            
+    #-------------------------------------------------------------------------#
+    
+    def test_loop_power(self):
+        """
+            Powers of the loop value d = -A^2 - A^-2, and the Kauffman bracket
+            of the figure eight knot found with them
+        """
+        
+        A = LaurentPoly({1 : 1})
+        
+        self.assertEqual(loopPower(0), LaurentPoly({0 : 1}))
+        self.assertEqual(loopPower(3), (-A ** 2 - A ** -2) ** 3)
+        self.assertDictEqual(loopPower(2).terms(), {-4 : 1, 0 : 2, 4 : 1})
+        
+        [writhe, state_list] = LPoly([[iii for iii in range(16)]], \
+                                     [[0, 6, 1, 7], [12, 3, 13, 2], [4, 11, 5, 10], [8, 14, 9, 15]])
+        
+        bracket = sum(loopPower(N - 1).shift(a - b) for (a, b, N) in state_list)
+        
+        self.assertDictEqual(bracket.terms(), {-8 : 1, -4 : -1, 0 : 1, 4 : -1, 8 : 1})
+        self.assertDictEqual(bracket.terms(), LPoly([[iii for iii in range(16)]], \
+                                                    [[0, 6, 1, 7], [12, 3, 13, 2], [4, 11, 5, 10], \
+                                                     [8, 14, 9, 15]], aggregate = True)[1])
+            
+    #-------------------------------------------------------------------------#
+    
+    def test_two_variables(self):
+        """
+            Polynomials in several variables can be multiplied and used as
+            dictionary keys, but cannot be combined with polynomials in other
+            variables
+        """
+        
+        poly = LaurentPoly({(1, 0, 2) : 3, (0, 1, -1) : -1}, names = ('c', 's', 'A'))
+        
+        self.assertDictEqual((poly * poly).terms(), \
+                             {(0, 2, -2) : 1, (1, 1, 1) : -6, (2, 0, 4) : 9})
+        self.assertEqual(poly.shift((1, 1, 1)), \
+                         LaurentPoly({(2, 1, 3) : 3, (1, 2, 0) : -1}, names = ('c', 's', 'A')))
+        
+        polyDict = {poly : 1}
+        polyDict[LaurentPoly({(0, 1, -1) : -1, (1, 0, 2) : 3}, names = ('c', 's', 'A'))] += 1
+        
+        self.assertDictEqual(polyDict, {poly : 2})
+        
+        with self.assertRaises(ValueError):
+            poly + LaurentPoly({1 : 1})
+            
+    #-------------------------------------------------------------------------#
+    
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_numpy_integers(self):
+        """
+            NumPy integers can be used for exponents, powers and integer
+            terms, in the same way as Python integers
+        """
+        
+        A = LaurentPoly({1 : 1})
+        
+        self.assertEqual(LaurentPoly({numpy.int64(2) : 1}), A ** 2)
+        self.assertEqual(A ** numpy.int32(-2), LaurentPoly({-2 : 1}))
+        self.assertEqual(A * numpy.int64(3) + numpy.int8(1), LaurentPoly({1 : 3, 0 : 1}))
+        self.assertEqual(A.shift(numpy.int64(-1)), LaurentPoly({0 : 1}))
+        
+        with self.assertRaises(ValueError):
+            A ** numpy.float64(2)
+            
+    #-------------------------------------------------------------------------#
+    
+    @unittest.skipIf(sympy is None, 'SymPy is not installed')
+    def test_to_sympy(self):
+        """
+            Conversion of a polynomial to a SymPy expression
+        """
+        
+        (c, A) = sympy.symbols('c, A')
+        poly = LaurentPoly({(1, 2) : 3, (0, -1) : -1}, names = ('c', 'A'))
+        
+        self.assertEqual(sympy.expand(poly.toSympy() - (3 * c * A ** 2 - A ** -1)), 0)
+            
+    #-------------------------------------------------------------------------#
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+
+# Go to graph-poly folder and run "python -m unittest tests.test_SegmentArray"
+
+import unittest
+from Graphpoly import SegmentArray, sewSegments, splitSegment
+from Graphpoly.LPoly import splitLink
+
+class TestSegmentArray(unittest.TestCase):
+    
+    #-------------------------------------------------------------------------#
+    
+    def test_connect_list(self):
+        """
+            The node and epath are ambiguous, since d1 comes after d0, and d2
+            comes before; d0 is joined to d2, and d1 to d3, as for
+            connectList()
+        """
+        
+        segments = SegmentArray([[7, 8, 6, 5, 4, 3, 2, 1, 0, 11, 10, 9]])
+        [seg_list, connect_list] = segments.connectList([2, 1, 3, 0])
+            
+        self.assertListEqual(seg_list, [(0, 6), (0, 7), (0, 5), (0, 8)])
+        self.assertListEqual(connect_list, [(3, 2), (1, 0)])
+    
+    #-------------------------------------------------------------------------#
+    
+    def test_connect_list_same_crossing(self):
+        """
+            An edge joins d0 and d1 of the crossing, so that d0 is next to
+            both d1 and d2
+        """
+        
+        segments = SegmentArray([[0, 1, 2, 3, 4, 5, 6, 7]])
+        [seg_list, connect_list] = segments.connectList([1, 7, 0, 6])
+            
+        self.assertListEqual(seg_list, [(0, 1), (0, 7), (0, 0), (0, 6)])
+        self.assertListEqual(connect_list, [(0, 1), (6, 7)])
+    
+    #-------------------------------------------------------------------------#
+    
+    def test_split_sew(self):
+        """
+            Splitting and sewing segments gives the same segments as
+            splitSegment() and sewSegments(), with the index kept up to date,
+            and without changing copies made beforehand
+        """
+        
+        e_path = [[iii for iii in range(10)], [10, 11, 12, 13]]
+        segments = SegmentArray(e_path)
+        old_segments = segments.copy()
+        
+        segments.splitSegment(0, 2, 5, 7, 9)
+        e_path = splitSegment(e_path, 0, 2, 5, 7, 9)
+        
+        self.assertCountEqual(segments.listEPath(), e_path)
+        
+        segments.sewSegments(segments.locate(7)[0], 1, segments.locate(7)[1], \
+                             segments.locate(9)[1], 1, 3)
+        e_path = sewSegments(e_path, 2, 0, 0, 2, 1, 3)
+        
+        self.assertCountEqual(segments.listEPath(), e_path)
+        self.assertEqual(len(segments), 2)
+        
+        for seg in segments.listEPath():
+            for (pos, dart) in enumerate(seg):
+                self.assertEqual(segments.segment(segments.locate(dart)[0])[pos], dart)
+                
+        self.assertListEqual(old_segments.listEPath(), [[iii for iii in range(10)], [10, 11, 12, 13]])
+        self.assertEqual(old_segments.locate(7), (0, 7))
+            
+    #-------------------------------------------------------------------------#
+    
+    def test_undo(self):
+        """
+            Undoing changes back to a mark gives the same segments and index
+            as before, with darts moved back to their old segments
+        """
+        
+        segments = SegmentArray([[iii for iii in range(10)], [10, 11, 12, 13]])
+        mark = segments.mark()
+        
+        segments.splitSegment(0, 2, 5, 7, 9)
+        segments.sewSegments(segments.locate(7)[0], 1, segments.locate(7)[1], \
+                             segments.locate(9)[1], 1, 3)
+        segments.replaceSegment(segments.locate(2)[0], [5, 4, 3, 2])
+        
+        self.assertEqual(segments.locate(2), (0, 3))
+        
+        segments.undo(mark)
+        
+        self.assertCountEqual(segments.listEPath(), [[iii for iii in range(10)], [10, 11, 12, 13]])
+        
+        for dart in range(14):
+            self.assertEqual(segments.locate(dart), (0, dart) if dart < 10 else (1, dart - 10))
+            
+    #-------------------------------------------------------------------------#
+    
+    def test_split_link_positions(self):
+        """
+            Every change found by splitLink() for the figure eight knot keeps
+            the index giving the segment and position of each dart, and
+            undoing it puts back the index as it was
+        """
+        
+        segments = SegmentArray([[iii for iii in range(16)]])
+        PD_code = [[0, 6, 1, 7], [12, 3, 13, 2], [4, 11, 5, 10], [8, 14, 9, 15]]
+        
+        def checkIndex():
+            for (label, seg) in segments.segments.items():
+                for (pos, dart) in enumerate(seg):
+                    self.assertEqual(segments.locate(dart), (label, pos))
+                    
+        def splitAll(crossings):
+            if len(crossings) == 0:
+                return
+            
+            for change in splitLink(segments, crossings[-1]):
+                mark = segments.mark()
+                segments.changeSegments(*change)
+                checkIndex()
+                splitAll(crossings[:-1])
+                segments.undo(mark)
+                checkIndex()
+                
+        splitAll(PD_code)
+        
+        self.assertListEqual(segments.listEPath(), [[iii for iii in range(16)]])
+            
+    #-------------------------------------------------------------------------#
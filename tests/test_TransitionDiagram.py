@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+# Go to graph-poly folder and run "python -m unittest tests.test_TransitionDiagram"
+
+import random
+import unittest
+from Graphpoly import createCircuits, TransitionDiagram
+
+class TestTransitionDiagram(unittest.TestCase):
+
+    #-------------------------------------------------------------------------#
+
+    def test_count(self):
+        """
+            Number of circuits matches createCircuits(), for graphs with three
+            and eight nodes
+        """
+
+        for (PD_list, type_list) in [([[2, 9, 3, 8], [6, 1, 7, 0], [10, 5, 11, 4]], [-2, -1, -2]), \
+                                     ([[0, 23, 1, 22], [24, 10, 25, 11], [12, 3, 13, 2], \
+                                       [4, 15, 5, 14], [16, 26, 17, 27], [28, 18, 29, 19], \
+                                       [20, 7, 21, 6], [30, 9, 31, 8]], \
+                                      [-2, 1, -2, -1, 2, 1, -1, -2])]:
+            diagram = TransitionDiagram(PD_list, type_list)
+
+            self.assertEqual(diagram.count(), len(createCircuits(PD_list, type_list)) // 2)
+
+    #-------------------------------------------------------------------------#
+
+    def test_iter_circuits(self):
+        """
+            The circuits of the diagram are those found by createCircuits(),
+            and ranges of circuits can be gone through separately
+        """
+
+        PD_list, type_list = [[6, 1, 7, 0], [8, 2, 9, 3], [10, 5, 11, 4]], [-2, 2, -2]
+        diagram = TransitionDiagram(PD_list, type_list)
+
+        self.assertEqual(diagram.count(), 16)
+        self.assertCountEqual([(G.listEPath(), G.listPDCode()) for index in range(16) \
+                               for G in diagram.graphs(index)], \
+                              [(G.listEPath(), G.listPDCode()) \
+                               for G in createCircuits(PD_list, type_list)])
+        self.assertListEqual(list(diagram.iterCircuits(0, 3)) + list(diagram.iterCircuits(3)), \
+                             [diagram.circuit(index) for index in range(16)])
+
+    #-------------------------------------------------------------------------#
+
+    def test_sample(self):
+        """
+            Sampled circuits are circuits of the diagram; a circuit number out
+            of range raises a ValueError
+        """
+
+        PD_list, type_list = [[2, 9, 3, 8], [6, 1, 7, 0], [10, 5, 11, 4]], [-2, -1, -2]
+        diagram = TransitionDiagram(PD_list, type_list)
+        rng = random.Random(0)
+
+        for iii in range(10):
+            self.assertIn(diagram.sample(rng), list(diagram.iterCircuits()))
+
+        with self.assertRaises(ValueError):
+            diagram.circuit(diagram.count())
+
+    #-------------------------------------------------------------------------#
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+
+# Go to graph-poly folder and run "python -m unittest tests.test_canonicalPD"
+
+import unittest
+from Graphpoly import canonicalGraph, canonicalKnot
+
+class TestCanonicalPD(unittest.TestCase):
+
+    #-------------------------------------------------------------------------#
+
+    def test_knot_relabel(self):
+        """
+            Left trefoil with its crossings and edges in a different order,
+            or with the direction reversed, has the same canonical form
+        """
+
+        trefoil = [[[0, 2, 1, 2], [1, 0, 2, 0], [2, 1, 0, 1]], [1, 1, 1]]
+
+        self.assertListEqual(canonicalKnot([[2, 1, 0, 1], [0, 2, 1, 2], [1, 0, 2, 0]], [1, 1, 1]), \
+                             trefoil)
+        self.assertListEqual(canonicalKnot([[1, 2, 0, 2], [2, 0, 1, 0], [0, 1, 2, 1]], [1, 1, 1]), \
+                             trefoil)
+        self.assertNotEqual(canonicalKnot([[0, 2, 1, 2], [1, 0, 2, 0], [2, 1, 0, 1]], [-1, -1, -1]), \
+                            trefoil)
+        self.assertListEqual(canonicalKnot([], []), [[], []])
+
+    #-------------------------------------------------------------------------#
+
+    def test_knot_reverse(self):
+        """
+            Figure-eight knot has the same canonical form as its reversal,
+            and, keeping the direction, as the knot with its edges shifted
+        """
+
+        knotCode = [[0, 2, 1, 2], [1, 3, 2, 3], [2, 0, 3, 0], [3, 1, 0, 1]]
+        f_list = [1, 1, -1, -1]
+        reverseCode = [[3 - ccc, 3 - bbb, 3 - aaa, 3 - ddd] for [aaa, bbb, ccc, ddd] in knotCode]
+        shiftCode = [[(edge + 1) % 4 for edge in crossing] for crossing in knotCode]
+
+        self.assertListEqual(canonicalKnot(knotCode, f_list), canonicalKnot(reverseCode, f_list))
+        self.assertListEqual(canonicalKnot(knotCode, f_list, reverse = False), \
+                             canonicalKnot(shiftCode[::-1], f_list[::-1], reverse = False))
+
+        with self.assertRaises(ValueError):
+            canonicalKnot([[0, 2, 1, 2], [1, 0, 0, 0], [2, 1, 2, 1]], [1, 1, 1])
+
+    #-------------------------------------------------------------------------#
+
+    def test_graph_relabel(self):
+        """
+            Graph with its darts relabelled from any start, in either
+            direction, and its nodes in any order, has the same canonical form
+        """
+
+        PD_list, type_list = [[6, 1, 7, 0], [8, 2, 9, 3], [10, 5, 11, 4]], [-2, 2, -2]
+        canonical = canonicalGraph(PD_list, type_list)
+
+        for start in range(12):
+            if start % 2 == 0:
+                new_PD_list = [[(dart - start) % 12 for dart in node] for node in PD_list]
+            else:
+                new_PD_list = [[(start - dart) % 12 for dart in node[2:] + node[:2]]
+                               for node in PD_list]
+
+            self.assertListEqual(canonicalGraph(new_PD_list[::-1], type_list[::-1]), canonical)
+
+        self.assertNotEqual(canonicalGraph(PD_list, [2, 2, -2]), canonical)
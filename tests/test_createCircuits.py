@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+# Go to graph-poly folder and run "python -m unittest tests.test_createCircuits"
+
+import unittest
+from Graphpoly.createCircuits import createCircuits, Graph, iterCircuits, leastRotation
+
+class TestCreateCircuits(unittest.TestCase):
+
+    #-------------------------------------------------------------------------#
+
+    def test_undo(self):
+        """
+            Undoing the steps of the search returns the graph to where it
+            was when the undo log had the given length
+        """
+
+        G = Graph([[2, 9, 3, 8], [6, 1, 7, 0], [10, 5, 11, 4]], [-2, -1, -2])
+        G.chooseNextDart(9)
+
+        mark = G.lenUndoLog()
+        state = [list(G.listCPath()), list(G.listEPath()), G.listCurrentNode(), \
+                 G.listCurrentDart(), list(G.listAvailableDarts()), \
+                 {node : list(darts) for (node, darts) in G.listDartAdjDict().items()}]
+
+        while G.currentNodeDegree() > 0:
+            G.chooseNextDart(G.listAvailableDarts()[0])
+
+        while G.lenCPath() > 0:
+            G.backtrack()
+
+        G.undo(mark)
+
+        self.assertListEqual([G.listCPath(), G.listEPath(), G.listCurrentNode(), \
+                              G.listCurrentDart(), G.listAvailableDarts(), \
+                              G.listDartAdjDict()], state)
+
+    #-------------------------------------------------------------------------#
+
+    def test_circuits(self):
+        """
+            Graph with two vertices and a crossing; each circuit is followed
+            by its reverse
+        """
+
+        graphList = createCircuits([[2, 9, 3, 8], [6, 1, 7, 0], [10, 5, 11, 4]], [-2, -1, -2])
+
+        self.assertEqual(len(graphList), 12)
+        self.assertListEqual(graphList[0].listEPath(), [0, 11, 10, 9, 3, 4, 5, 6, 7, 8, 2, 1])
+        self.assertListEqual(graphList[1].listEPath(), [0, 1, 2, 8, 7, 6, 5, 4, 3, 9, 10, 11])
+
+    #-------------------------------------------------------------------------#
+
+    def test_least_rotation(self):
+        """
+            Smallest cyclic permutation, with repeated labels
+        """
+
+        self.assertEqual(leastRotation([3, 1, 2, 1, 1, 2]), 3)
+        self.assertEqual(leastRotation([2, 2, 2]), 0)
+        self.assertEqual(leastRotation([5, 0, 4, 0, 4, 0, 3]), 5)
+
+    #-------------------------------------------------------------------------#
+
+    def test_reverse_equal(self):
+        """
+            A circuit and its reverse are equal, and have the same hash
+        """
+
+        graphList = createCircuits([[2, 9, 3, 8], [6, 1, 7, 0], [10, 5, 11, 4]], [-2, -1, -2])
+
+        self.assertEqual(graphList[0], graphList[1])
+        self.assertEqual(hash(graphList[0]), hash(graphList[1]))
+        self.assertNotEqual(graphList[0], graphList[2])
+        self.assertEqual(len(set(graphList)), len(graphList) // 2)
+
+    #-------------------------------------------------------------------------#
+
+    def test_iter_circuits(self):
+        """
+            The generator gives the same graphs as createCircuits(), and the
+            first circuit can be found without finding the rest
+        """
+
+        PD_list, type_list = [[2, 9, 3, 8], [6, 1, 7, 0], [10, 5, 11, 4]], [-2, -1, -2]
+        circuits = iterCircuits(PD_list, type_list)
+
+        self.assertListEqual(next(circuits).listEPath(), [0, 11, 10, 9, 3, 4, 5, 6, 7, 8, 2, 1])
+        self.assertListEqual([G.listEPath() for G in iterCircuits(PD_list, type_list)], \
+                             [G.listEPath() for G in createCircuits(PD_list, type_list)])
+
+    #-------------------------------------------------------------------------#
+
+    def test_transition_engine(self):
+        """
+            Choosing transitions at the vertices gives the same graphs as the
+            search through the darts, for a graph with two vertices and a
+            crossing, and for a graph with three vertices
+        """
+
+        for (PD_list, type_list) in [([[2, 9, 3, 8], [6, 1, 7, 0], [10, 5, 11, 4]], [-2, -1, -2]), \
+                                     ([[6, 1, 7, 0], [8, 2, 9, 3], [10, 5, 11, 4]], [-2, 2, -2])]:
+            graphList = createCircuits(PD_list, type_list, engine = 'transition')
+
+            self.assertCountEqual([(G.listEPath(), G.listPDCode()) for G in graphList], \
+                                  [(G.listEPath(), G.listPDCode()) \
+                                   for G in createCircuits(PD_list, type_list)])
+
+        with self.assertRaises(ValueError):
+            createCircuits(PD_list, type_list, engine = 'bfs')
+
+    #-------------------------------------------------------------------------#
+
+    def test_parallel_circuits(self):
+        """
+            Splitting the search between processes gives the same list of
+            graphs as a single process
+        """
+
+        PD_list, type_list = [[6, 1, 7, 0], [8, 2, 9, 3], [10, 5, 11, 4]], [-2, 2, -2]
+        graphList = createCircuits(PD_list, type_list)
+
+        for split_depth in [1, 3]:
+            parallelList = createCircuits(PD_list, type_list, workers = 2, split_depth = split_depth)
+
+            self.assertListEqual([(G.listEPath(), G.listPDCode()) for G in parallelList], \
+                                 [(G.listEPath(), G.listPDCode()) for G in graphList])
+
+    #-------------------------------------------------------------------------#
+
+    def test_shared_arrays(self):
+        """
+            A copy of the graph shares the arrays found from the PD code, but
+            has its own array of available darts
+        """
+
+        G = Graph([[2, 9, 3, 8], [6, 1, 7, 0], [10, 5, 11, 4]], [-2, -1, -2])
+        H = G.copy()
+        H.chooseNextDart(9)
+
+        self.assertIs(H.dart_match, G.dart_match)
+        self.assertListEqual([G.findDartMatch(dart) for dart in [0, 3, 8, 9]], [11, 4, 7, 10])
+        self.assertListEqual(G.listDartAdjDict()[0], [2, 9, 3, 8])
+        self.assertListEqual(H.listDartAdjDict()[0], [2, -1, 3, 8])
+
+        with self.assertRaises(AttributeError):
+            G.dart_dict = {}
+
+    #-------------------------------------------------------------------------#
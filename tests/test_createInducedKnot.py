@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+# Go to graph-poly folder and run "python -m unittest tests.test_createInducedKnot"
+
+import unittest
+from Graphpoly import createCircuits, createInducedKnot, createInducedKnots
+from Graphpoly.createInducedKnot import UnionFind
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+class TestCreateInducedKnot(unittest.TestCase):
+
+    #-------------------------------------------------------------------------#
+
+    def test_induced_knot(self):
+        """
+            Circuit passing straight through one vertex, and turning at the
+            other two, gives a kink
+        """
+
+        graphList = createCircuits([[6, 1, 7, 0], [8, 2, 9, 3], [10, 5, 11, 4]], [-2, 2, -2])
+
+        self.assertListEqual(createInducedKnot(graphList[0]), [[[0, 0, 0, 0]], [-1]])
+        self.assertListEqual(createInducedKnot(graphList[2]), [[], []])
+
+    #-------------------------------------------------------------------------#
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_batch(self):
+        """
+            The batch of circuits gives the same PD codes and f(i) function
+            lists as one circuit at a time
+        """
+
+        graphList = createCircuits([[6, 1, 7, 0], [8, 2, 9, 3], [10, 5, 11, 4]], [-2, 2, -2])
+        [knot_array, f_array, num_cross] = createInducedKnots(graphList)
+
+        self.assertEqual(knot_array.shape, (len(graphList), 3, 4))
+
+        for (iii, graph) in enumerate(graphList):
+            num = num_cross[iii]
+
+            self.assertListEqual([knot_array[iii, :num].tolist(), f_array[iii, :num].tolist()], \
+                                 createInducedKnot(graph))
+            self.assertTrue((knot_array[iii, num:] == -1).all())
+
+    #-------------------------------------------------------------------------#
+
+    def test_union_find(self):
+        """
+            Clusters are labelled in order of their lowest item, long chains
+            do not reach the recursion limit, and reset() makes every item a
+            single item cluster again
+        """
+
+        dartData = UnionFind(6)
+        dartData.Union(5, 1)
+        dartData.Union(4, 2)
+        dartData.Union(2, 0)
+
+        self.assertDictEqual(dartData.relabel(), {0 : 0, 1 : 1, 2 : 0, 3 : 2, 4 : 0, 5 : 1})
+        self.assertDictEqual(dartData.relabel([5, 3]), {3 : 0, 5 : 1})
+
+        dartData.reset(20000)
+
+        for iii in range(19999):
+            dartData.Union(iii, iii + 1)
+
+        self.assertEqual(dartData.findRoot(0), dartData.findRoot(19999))
+
+        dartData.reset()
+
+        self.assertListEqual(dartData.nonIsoList(), [iii for iii in range(20000)])
+
+    #-------------------------------------------------------------------------#
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+
+# Go to graph-poly folder and run "python -m unittest tests.test_graphAutomorphisms"
+
+import unittest
+from Graphpoly import createCircuits, graphAutomorphisms, transitionCircuits
+
+class TestGraphAutomorphisms(unittest.TestCase):
+
+    #-------------------------------------------------------------------------#
+
+    def test_symmetries(self):
+        """
+            Graph with three vertices has four symmetries, each taking edges
+            to edges, starting with the identity
+        """
+
+        PD_list, type_list = [[6, 1, 7, 0], [8, 2, 9, 3], [10, 5, 11, 4]], [-2, 2, -2]
+        perm_list = graphAutomorphisms(PD_list, type_list)
+
+        self.assertEqual(len(perm_list), 4)
+        self.assertListEqual(perm_list[0], [dart for dart in range(12)])
+
+        for perm in perm_list:
+            self.assertListEqual(sorted(perm), [dart for dart in range(12)])
+            self.assertCountEqual([sorted(perm[dart] for dart in node) for node in PD_list], \
+                                  [sorted(node) for node in PD_list])
+
+    #-------------------------------------------------------------------------#
+
+    def test_circuit_orbits(self):
+        """
+            One circuit is kept from each orbit, and the sizes of the orbits
+            add up to the number of circuits
+        """
+
+        PD_list, type_list = [[6, 1, 7, 0], [8, 2, 9, 3], [10, 5, 11, 4]], [-2, 2, -2]
+        [orbitList, multiplicity_list] = createCircuits(PD_list, type_list, orbits = True)
+
+        self.assertEqual(len(orbitList), 20)
+        self.assertEqual(sum(multiplicity_list[::2]), len(createCircuits(PD_list, type_list)) // 2)
+        self.assertEqual(len(set(orbitList)), 10)
+
+    #-------------------------------------------------------------------------#
+
+    def test_orbit_transitions(self):
+        """
+            Choosing transitions finds one circuit from each orbit, with the
+            circuits of each orbit never found
+        """
+
+        PD_list, type_list = [[6, 1, 7, 0], [8, 2, 9, 3], [10, 5, 11, 4]], [-2, 2, -2]
+        circuit_list = list(transitionCircuits(PD_list, type_list))
+        orbit_list = list(transitionCircuits(PD_list, type_list, graphAutomorphisms(PD_list, type_list)))
+
+        self.assertEqual(len(orbit_list), 10)
+        self.assertEqual(sum(multiplicity for (circuit, multiplicity) in orbit_list), len(circuit_list))
+
+        for (circuit, multiplicity) in orbit_list:
+            self.assertIn(circuit, circuit_list)
+
+    #-------------------------------------------------------------------------#
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+# Go to graph-poly folder and run "python -m unittest tests.test_graphInvariantMultiset"
+
+import unittest
+from Graphpoly import createCircuits, createInducedKnot, graphInvariantMultiset, isRealizable, \
+                      LaurentPoly, planarDiagram, quandleColorings, simplifyDiagram
+
+class TestGraphInvariantMultiset(unittest.TestCase):
+
+    #-------------------------------------------------------------------------#
+
+    def test_trefoil_colorings(self):
+        """
+            Left trefoil has nine colorings by the dihedral quandle of order
+            three
+        """
+
+        quandle = [[(2 * iii - jjj) % 3 for jjj in range(3)] for iii in range(3)]
+
+        self.assertEqual(quandleColorings([[0, 2, 1, 2], [1, 0, 2, 0], [2, 1, 0, 1]], \
+                                          [1, 1, 1], quandle), 9)
+        self.assertEqual(quandleColorings([], [], quandle), 3)
+
+    #-------------------------------------------------------------------------#
+
+    def test_multiset(self):
+        """
+            Graph 3^l 5^u 7^- 1^+ from the quandle notebook, with two of its
+            twelve circuits giving a trefoil, and the rest unknots
+        """
+
+        seq = [[0, 3, -2], [2, 5, 2], [4, 7, -1], [6, 1, 1]]
+        quandle = [[(2 * iii - jjj) % 3 for jjj in range(3)] for iii in range(3)]
+
+        self.assertDictEqual(graphInvariantMultiset(seq), \
+                             {LaurentPoly({4 : 1, 12 : 1, 16 : -1}) : 2, LaurentPoly({0 : 1}) : 10})
+        self.assertDictEqual(graphInvariantMultiset(seq, 'quandle', quandle), {9 : 2, 3 : 10})
+        self.assertDictEqual(graphInvariantMultiset(seq, orbits = False), graphInvariantMultiset(seq))
+
+        with self.assertRaises(ValueError):
+            graphInvariantMultiset(seq, 'quandle')
+
+    #-------------------------------------------------------------------------#
+
+    def test_simplified_colorings(self):
+        """
+            Taking kinks and bigons out of the induced knots, before counting
+            their colorings, gives the same multiset as counting colorings of
+            the knots from createInducedKnot(), for the graph of test_multiset
+        """
+
+        seq = [[0, 3, -2], [2, 5, 2], [4, 7, -1], [6, 1, 1]]
+        [PD_list, type_list] = planarDiagram(seq, isRealizable(seq, f_list = True))
+        graphList = createCircuits(PD_list, type_list)
+
+        # Most of the induced knots are unknots with crossings to take out
+
+        num_removed = 0
+
+        for G in graphList:
+            [e_path, PD_code, f_list] = createInducedKnot(G, darts = True)
+            num_removed += len(PD_code) - len(simplifyDiagram(e_path, PD_code, f_list)[1])
+
+        self.assertGreater(num_removed, 0)
+
+        for order in [3, 5]:
+            quandle = [[(2 * iii - jjj) % order for jjj in range(order)] for iii in range(order)]
+            multiset = {}
+
+            for G in graphList:
+                value = quandleColorings(*createInducedKnot(G), quandle)
+                multiset[value] = multiset.get(value, 0) + 1
+
+            self.assertDictEqual(graphInvariantMultiset(seq, 'quandle', quandle), multiset)
+
+    #-------------------------------------------------------------------------#
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+# Go to graph-poly folder and run "python -m unittest tests.test_simplifyDiagram"
+
+import unittest
+from Graphpoly import arcCode, LPoly, simplifyDiagram
+
+class TestSimplifyDiagram(unittest.TestCase):
+
+    #-------------------------------------------------------------------------#
+
+    def test_single_kink(self):
+        """
+            Unknot with a single crossing; the kink is removed, leaving one
+            dart for the unknot
+        """
+
+        [e_path, PD_code, f_list, twist] = simplifyDiagram([[0, 1, 2, 3]], [[0, 3, 1, 2]], [1])
+
+        self.assertListEqual(e_path, [[0]])
+        self.assertListEqual(PD_code, [])
+        self.assertListEqual(f_list, [])
+        self.assertEqual(twist, 1)
+
+    #-------------------------------------------------------------------------#
+
+    def test_double_cross_unknot(self):
+        """
+            Unknots with two crossings, of unlike and like type, are reduced
+            to no crossings, with the writhe of the original diagrams
+        """
+
+        for (PD_code, writhe) in [([[0, 6, 1, 7], [2, 5, 3, 4]], 0), \
+                                  ([[0, 6, 1, 7], [4, 2, 5, 3]], -2)]:
+            [e_path, new_PD_code, f_list, twist] = simplifyDiagram([[iii for iii in range(8)]], \
+                                                                   PD_code)
+
+            self.assertEqual(len(e_path), 1)
+            self.assertListEqual(new_PD_code, [])
+            self.assertIsNone(f_list)
+            self.assertEqual(twist, writhe)
+
+    #-------------------------------------------------------------------------#
+
+    def test_trefoil_unchanged(self):
+        """
+            The left trefoil has no kinks or bigons
+        """
+
+        e_path = [[iii for iii in range(12)]]
+        PD_code = [[0, 6, 1, 7], [4, 10, 5, 11], [8, 2, 9, 3]]
+
+        self.assertListEqual(simplifyDiagram(e_path, PD_code, [1, 1, 1]), \
+                             [e_path, PD_code, [1, 1, 1], 0])
+
+    #-------------------------------------------------------------------------#
+
+    def test_simplified_bracket(self):
+        """
+            The bracket found by LPoly() is the same with or without
+            simplifying the diagram first, for each engine
+        """
+
+        e_path = [[iii for iii in range(8)]]
+        PD_code = [[0, 6, 1, 7], [4, 2, 5, 3]]
+
+        for engine in ['state', 'memo', 'tl', 'gray']:
+            self.assertListEqual(LPoly(e_path, PD_code, aggregate = True, engine = engine, \
+                                       simplify = True), \
+                                 LPoly(e_path, PD_code, aggregate = True))
+
+        with self.assertRaises(ValueError):
+            LPoly(e_path, PD_code, simplify = True)
+
+    #-------------------------------------------------------------------------#
+
+    def test_simplified_order(self):
+        """
+            Figure eight knot with a kink, which is taken out by simplifying
+            the diagram. A crossing order method can still be used, but not a
+            list of crossings, even one with the right length for the
+            simplified diagram, since its indices are for the original one
+        """
+
+        e_path = [[iii for iii in range(20)]]
+        PD_code = [[0, 6, 1, 7], [12, 3, 13, 2], [4, 11, 5, 10], [8, 14, 9, 15], [16, 19, 17, 18]]
+
+        self.assertListEqual(LPoly(e_path, PD_code, aggregate = True, order = 'greedy', \
+                                   simplify = True), \
+                             LPoly(e_path, PD_code, aggregate = True, order = [4, 0, 2, 1, 3]))
+
+        for order in [[4, 0, 2, 1, 3], [0, 2, 1, 3]]:
+            with self.assertRaises(ValueError):
+                LPoly(e_path, PD_code, aggregate = True, order = order, simplify = True)
+
+    #-------------------------------------------------------------------------#
+
+    def test_arc_code(self):
+        """
+            PD code of the left trefoil in terms of its edges
+        """
+
+        self.assertListEqual(arcCode([[iii for iii in range(12)]], \
+                                     [[0, 6, 1, 7], [4, 10, 5, 11], [8, 2, 9, 3]]), \
+                             [[0, 2, 1, 2], [1, 0, 2, 0], [2, 1, 0, 1]])
+
+    #-------------------------------------------------------------------------#
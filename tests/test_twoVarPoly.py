@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+
+# Go to graph-poly folder and run "python -m unittest tests.test_twoVarPoly"
+
+import unittest
+from Graphpoly import graphInvariantMultiset, LaurentPoly, LRUCache, twoVarPoly
+
+class TestTwoVarPoly(unittest.TestCase):
+
+    #-------------------------------------------------------------------------#
+
+    def test_two_vertices(self):
+        """
+            Circuit through graph 3^l 5^+ 7^- 1^u from the 2-variable
+            notebook, with a trefoil in the c^2 term
+        """
+
+        e_path = [[0, 15, 14, 13, 12, 11, 10, 9, 8, 7, 6, 5, 4, 3, 2, 1]]
+        PD_code = [[1, 7, 0, 6], [3, 13, 2, 12], [9, 15, 8, 14], [11, 5, 10, 4]]
+        names = ('c', 's', 'A')
+
+        result = LaurentPoly({(0, 2, 0) : 1, (1, 1, 2) : -2, (1, 1, 10) : -2, (2, 0, 4) : 1, \
+                              (2, 0, 12) : 1, (2, 0, 16) : -1}, names)
+
+        self.assertEqual(twoVarPoly(e_path, PD_code, [2, 2, 1, 1]), result)
+
+    #-------------------------------------------------------------------------#
+
+    def test_shared_memo(self):
+        """
+            Sharing the memo table between calls gives the same polynomial,
+            using the diagrams found by the first call
+        """
+
+        e_path = [[0, 15, 14, 13, 12, 11, 10, 9, 8, 7, 6, 5, 4, 3, 2, 1]]
+        PD_code = [[1, 7, 0, 6], [3, 13, 2, 12], [9, 15, 8, 14], [11, 5, 10, 4]]
+
+        memo = LRUCache(2 ** 8)
+        result = twoVarPoly(e_path, PD_code, [2, 2, 1, 1], memo)
+        misses = memo.misses
+
+        self.assertEqual(twoVarPoly(e_path, PD_code, [2, 2, 1, 1], memo), result)
+        self.assertEqual(memo.misses, misses)
+
+    #-------------------------------------------------------------------------#
+
+    def test_multiset(self):
+        """
+            Multiset of polynomials for all twelve circuits of the graph
+        """
+
+        multiset = graphInvariantMultiset([[0, 3, -2], [2, 5, 1], [4, 7, -1], [6, 1, 2]], 'twovar')
+
+        self.assertEqual(sum(multiset.values()), 12)
+        self.assertListEqual(sorted(multiset.values()), [2, 2, 8])
+
+    #-------------------------------------------------------------------------#